@@ -2,7 +2,6 @@
 Chat API Routes — NL → SQL with streaming support.
 POST /api/chat — Send a message, get AI response
 """
-import json
 import logging
 from fastapi import APIRouter, HTTPException, Request
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -12,7 +11,7 @@ from shared.schemas import ChatRequest, ChatResponse
 from backend.services.pipeline_service import get_run
 from backend.core.config import settings
 from backend.core.exceptions import DownstreamServiceError
-from backend.core.utils import DecimalEncoder
+from backend.core.schema_context import build_schema_context
 from backend.core.rate_limiter import limiter, CHAT_LIMIT
 
 logger = logging.getLogger(__name__)
@@ -36,11 +35,13 @@ async def chat(request: Request, body: ChatRequest):
         raise HTTPException(status_code=400, detail="Pipeline run has no enriched schema data")
 
     try:
-        context_json = json.dumps(schema_data, cls=DecimalEncoder)
+        context = build_schema_context(
+            schema_data, settings.CHAT_CONTEXT_TOKENS, table_stats=True
+        )
         system_prompt = f"""You are a Senior Database Architect and SQL Expert.
 
 SCHEMA CONTEXT (AI-enriched data dictionary):
-{context_json}
+{context}
 
 DIRECTIVES:
 1. If the user asks a natural language question about the data, generate the EXACT SQL query needed.
@@ -15,6 +15,7 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from backend.services.pipeline_service import get_run
 from backend.core.config import settings
 from backend.core.utils import DecimalEncoder
+from backend.core.schema_context import build_schema_context
 from backend.core.rate_limiter import limiter, EXPORT_REPORT_LIMIT, READ_LIMIT
 
 logger = logging.getLogger(__name__)
@@ -60,6 +61,15 @@ def _get_unique_pct(stats, row_count=0):
     return 0.0
 
 
+def _format_indexes(indexes) -> str:
+    """`name` (col, col) [unique], comma-separated."""
+    return ", ".join(
+        f"`{ix.get('name') or 'unnamed'}` ({', '.join(ix.get('columns') or [])})"
+        + (" unique" if ix.get("unique") else "")
+        for ix in indexes
+    )
+
+
 def generate_markdown(schema_data: dict) -> str:
     """Generate a complete markdown data dictionary from schema data."""
     total_tables = len(schema_data)
@@ -103,6 +113,9 @@ def generate_markdown(schema_data: dict) -> str:
                 ]
             )
             md += "\n\n"
+        indexes = meta.get("indexes") or []
+        if indexes:
+            md += "**Indexes:** " + _format_indexes(indexes) + "\n\n"
         md += "| Column | Type | Null % | Unique % | Description | Tags |\n"
         md += "|--------|------|--------|----------|-------------|------|\n"
         for col_name, col_data in meta.get("columns", {}).items():
@@ -226,28 +239,22 @@ def _compute_relationship_map(schema_data: dict) -> list[dict]:
 def _generate_ai_overview(schema_data: dict) -> dict:
     """Use Gemini to generate executive summary and recommendations."""
     try:
-        # Build compact summary for prompt
-        summary_lines = []
-        total_rows = 0
-        pii_cols = []
-        for table, meta in schema_data.items():
-            rc = meta.get("row_count", 0)
-            total_rows += rc
-            col_count = len(meta.get("columns", {}))
-            hs = meta.get("health_score", 100)
-            fk_count = len(meta.get("foreign_keys", []))
-            summary_lines.append(f"- {table}: {rc:,} rows, {col_count} cols, health={hs:.0f}, {fk_count} FKs")
-            for c, cm in meta.get("columns", {}).items():
-                desc = cm.get("description") or ""
-                if cm.get("potential_pii"):
-                    pii_cols.append(f"{table}.{c}")
-                if desc:
-                    summary_lines.append(f"  └ {c}: {desc[:80]}")
+        total_rows = sum(meta.get("row_count") or 0 for meta in schema_data.values())
+        pii_cols = [
+            f"{table}.{c}"
+            for table, meta in schema_data.items()
+            for c, cm in meta.get("columns", {}).items()
+            if cm.get("potential_pii")
+        ]
+        # Descriptions only: stats and samples add little to an overview
+        context = build_schema_context(
+            schema_data, settings.CHAT_CONTEXT_TOKENS, table_stats=True, tiers=("descriptions",)
+        )
 
         prompt = f"""You are a Senior Data Architect writing a business-ready database assessment report.
 
 DATABASE SUMMARY:
-{chr(10).join(summary_lines)}
+{context}
 
 Total tables: {len(schema_data)}, Total rows: {total_rows:,}, PII columns: {len(pii_cols)}
 
@@ -351,6 +358,7 @@ def generate_business_report(schema_data: dict, run_id: str) -> dict:
             "column_count": len(cols),
             "health_score": round(hs, 1),
             "foreign_keys": fks,
+            "indexes": meta.get("indexes") or [],
             "columns": col_details,
         })
 
@@ -469,6 +477,8 @@ def report_to_markdown(report: dict) -> str:
             md += "**Foreign Keys:** " + ", ".join(
                 f"`{fk['column']}` → `{fk['referred_table']}.{fk['referred_column']}`" for fk in fks
             ) + "\n\n"
+        if table.get("indexes"):
+            md += "**Indexes:** " + _format_indexes(table["indexes"]) + "\n\n"
 
         md += "| Column | Type | Null% | Unique% | PII | Description |\n"
         md += "|--------|------|-------|---------|-----|-------------|\n"
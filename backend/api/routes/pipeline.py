@@ -7,8 +7,9 @@ GET  /api/pipeline/run/{run_id} — Get run results
 import logging
 from fastapi import APIRouter, HTTPException, Request
 from shared.schemas import PipelineRunRequest, PipelineRunResponse
-from backend.services.pipeline_service import execute_pipeline, get_run, list_runs
+from backend.services.pipeline_service import execute_pipeline_async, get_run, list_runs
 from backend.core.config import settings
+from backend.connectors.file_connector import TABLE_SUFFIXES
 from backend.core.exceptions import PipelineExecutionError
 from backend.core.rate_limiter import limiter, PIPELINE_RUN_LIMIT, READ_LIMIT
 
@@ -30,7 +31,7 @@ async def run_pipeline(request: Request, body: PipelineRunRequest):
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    result = execute_pipeline(body.connection_string, session_id=_sid(request))
+    result = await execute_pipeline_async(body.connection_string, session_id=_sid(request))
 
     # Surface pipeline-level failures as structured errors
     if result.get("status") == "failed":
@@ -100,4 +101,16 @@ async def list_available_databases():
                 "tables": table_count,
             })
 
+    # ── Local Parquet / CSV files (file:// source) ──
+    lake_dir = data_dir / "lake"
+    if lake_dir.is_dir():
+        lake_tables = [p for p in lake_dir.iterdir() if p.suffix.lower() in TABLE_SUFFIXES]
+        if lake_tables:
+            databases.append({
+                "id": "lake_local",
+                "name": f"Local Data Lake ({len(lake_tables)} Tables) [Parquet/CSV]",
+                "connection_string": f"file://{lake_dir}",
+                "tables": len(lake_tables),
+            })
+
     return {"databases": databases}
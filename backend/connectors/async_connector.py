@@ -0,0 +1,204 @@
+"""
+Async SQL Connector — SQLConnector on SQLAlchemy's asyncio engine.
+
+Extraction runs as coroutines on the event loop instead of in worker
+threads.  The engine is ``create_async_engine`` over the dialect's asyncio
+driver (asyncpg, aiosqlite, aiomysql), and SQLConnector's reflection and
+profiling code runs under ``greenlet_spawn`` — the bridge
+``AsyncConnection.run_sync`` is built on — so every driver call awaits on
+the loop rather than blocking a thread.
+
+Tables are profiled concurrently as tasks, at most ``max_concurrency`` at
+a time and never more than the source's governor allows; each table holds
+one pooled connection at a time, so a small pool serves many tables.
+Within a table the work is sequential: column groups, partition slices
+and SQLite worker processes are thread/process based and are turned off.
+Only I/O stays on the loop: CPU-bound profiling (folding streamed batches
+into accumulators and sketches) runs on worker threads via ``_offload``.
+
+Needs ``sqlalchemy[asyncio]`` (greenlet) and the asyncio driver;
+``supports_async`` tells whether a connection string can use it.
+"""
+import time
+import asyncio
+import logging
+import importlib.util
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.util import greenlet_spawn
+
+try:
+    from sqlalchemy.util import await_
+except ImportError:  # SQLAlchemy 2.0 names it await_only
+    from sqlalchemy.util import await_only as await_
+
+from backend.core.config import settings
+from backend.core.state import TableSchema
+from backend.connectors.sql_connector import SQLConnector
+from backend.connectors.engine_registry import EngineRegistry
+from backend.connectors.scheduler import pool_capacity
+from backend.connectors.timeouts import statement_timeout
+from backend.connectors import sqlite_fastpath
+
+logger = logging.getLogger(__name__)
+
+# Dialect -> asyncio driver
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+    "mysql": "aiomysql",
+}
+
+
+def async_url(connection_string: str) -> str:
+    """The connection string with its dialect's asyncio driver."""
+    url = make_url(connection_string)
+    backend = url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No asyncio driver for '{backend}' connections.")
+    return url.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+def supports_async(connection_string: str) -> bool:
+    """Whether the dialect has an asyncio driver and it (and greenlet) is installed."""
+    try:
+        driver = ASYNC_DRIVERS.get(make_url(connection_string).get_backend_name())
+    except Exception:
+        return False
+    return driver is not None and all(
+        importlib.util.find_spec(module) is not None for module in ("greenlet", driver)
+    )
+
+
+class AsyncSQLConnector(SQLConnector):
+    """SQLConnector whose extraction runs as coroutines on an asyncio engine."""
+
+    # Seconds between checks for a free governor slot
+    _SLOT_POLL_S = 0.05
+
+    def __init__(
+        self,
+        connection_string: str,
+        max_concurrency: int = 8,
+        registry: Optional[EngineRegistry] = None,
+        **options,
+    ):
+        # Tables in flight; each holds one connection at a time
+        self.max_concurrency = max_concurrency
+        options.setdefault("max_workers", max_concurrency)
+        # Per-table parallelism is thread/process based: sequential here
+        options.update(column_group_workers=1, partition_threshold=None, sqlite_processes=1)
+        super().__init__(
+            connection_string, registry=registry or async_engine_registry, **options
+        )
+
+    @staticmethod
+    def _create_engine(
+        connection_string: str,
+        pg_schema: Optional[str],
+        read_only: bool = True,
+        sqlite_fast_path: bool = False,
+        sqlite_immutable: bool = False,
+    ) -> Engine:
+        """
+        Build a new asyncio engine and return its sync facade, which the
+        shared SQLConnector code drives from inside ``greenlet_spawn``.
+        """
+        from sqlalchemy.ext.asyncio import create_async_engine  # needs greenlet
+
+        url = async_url(connection_string)
+        if sqlite_fast_path and read_only and url.startswith("sqlite"):
+            url = sqlite_fastpath.fast_url(url, sqlite_immutable)
+        engine = create_async_engine(url, pool_pre_ping=True).sync_engine
+        SQLConnector._configure_engine(engine, pg_schema, read_only, sqlite_fast_path)
+        return engine
+
+    def get_live_schema(self) -> Dict[str, TableSchema]:
+        """Blocking entry point for callers without an event loop."""
+        return asyncio.run(self.get_live_schema_async())
+
+    async def get_live_schema_async(self) -> Dict[str, TableSchema]:
+        """
+        ``get_live_schema`` as a coroutine: the run is planned on one
+        greenlet, then every table is profiled on its own task.
+        """
+        run = await greenlet_spawn(self._plan_run)
+        ordered = run["ordered"]
+        schema_out = run["schema_out"]
+        run_deadline = run["run_deadline"]
+        gate = asyncio.Semaphore(pool_capacity(self.engine, self.max_concurrency))
+
+        async def _profile_table(t_name: str) -> None:
+            async with gate:
+                await self._governor_slot()
+                try:
+                    name, data = await greenlet_spawn(self._process_table, run, t_name)
+                finally:
+                    self.governor.release()
+            schema_out[name] = data
+
+        tasks = {asyncio.create_task(_profile_table(t), name=f"profile:{t}"): t for t in ordered}
+        if tasks:
+            # Statement timeouts normally end every query by the deadline;
+            # the wait is still bounded for dialects that lack them
+            wait_s = run_deadline - time.monotonic() + self._RUN_GRACE_S if run_deadline else None
+            done, pending = await asyncio.wait(tasks, timeout=wait_s)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task, t_name in tasks.items():
+                if task in pending:
+                    logger.warning(f"Run budget exhausted; '{t_name}' left unprofiled.")
+                    self._keep_structure(run, t_name)
+                elif task.exception() is not None:
+                    logger.error(f"Error processing table '{t_name}': {task.exception()}")
+                    self._keep_structure(run, t_name)
+
+        return self._finish_run(run)
+
+    async def _governor_slot(self) -> None:
+        """Take one of the governor's query slots without blocking the loop."""
+        while not self.governor.try_acquire():
+            await asyncio.sleep(self._SLOT_POLL_S)
+
+    @contextmanager
+    def _connect(self, deadline: Optional[float] = None):
+        """
+        A pooled connection for profiling.  The calling table's task
+        already holds a governor slot (see ``_governor_slot``), and
+        blocking on the threading gates here would stall the event loop.
+        """
+        with self.engine.connect() as conn:
+            with statement_timeout(conn, deadline):
+                yield conn
+
+    @staticmethod
+    def _offload(fn, *args):
+        """
+        Run CPU-bound profiling work on a worker thread and await it, so
+        the event loop keeps serving other tables' queries meanwhile.
+        """
+        return await_(asyncio.to_thread(fn, *args))
+
+    @staticmethod
+    def _worker_name() -> str:
+        task = asyncio.current_task()
+        return task.get_name() if task is not None else "event-loop"
+
+
+# ── Singleton ──
+# Separate from engine_registry: the same source has a sync and an async engine
+async_engine_registry = EngineRegistry(
+    max_engines=settings.ENGINE_CACHE_SIZE,
+    idle_ttl_s=settings.ENGINE_IDLE_TTL_S,
+)
+
+
+async def dispose_async_engines() -> None:
+    """Dispose every cached asyncio engine (application shutdown)."""
+    if async_engine_registry.stats()["engines"]:
+        # Closing pooled asyncio connections awaits the driver
+        await greenlet_spawn(async_engine_registry.dispose_all)
@@ -0,0 +1,180 @@
+"""
+Catalog-statistics profiling — the "metadata" tier.
+
+Builds row counts, null percentages and distinct estimates purely from the
+planner statistics the database already keeps, without touching any table:
+
+- PostgreSQL: ``pg_class.reltuples`` + ``pg_stat_user_tables`` (freshness)
+  + ``pg_stats`` (null_frac, n_distinct, histogram/MCV lists).
+- SQLite: ``sqlite_stat1`` only carries row counts and per-index key
+  cardinality — no null fractions — so SQLite tables never qualify for
+  the full metadata tier; their row counts still feed scheduling and
+  sampling decisions via ``SQLConnector._catalog_row_estimates``.
+
+A table qualifies only when every column has statistics and they are not
+stale; otherwise the connector falls back to scanning it.
+"""
+import csv
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+# Rows PostgreSQL's ANALYZE samples at the default statistics target
+# (300 * default_statistics_target); used for the sampling error margin.
+PG_ANALYZE_SAMPLE_ROWS = 30_000
+
+_PG_TABLE_STATS = """
+SELECT c.relname, c.reltuples,
+       s.n_mod_since_analyze,
+       COALESCE(s.last_analyze, s.last_autoanalyze) AS analyzed_at
+FROM pg_class c
+JOIN pg_namespace n ON n.oid = c.relnamespace
+LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+WHERE n.nspname = COALESCE(:schema, current_schema())
+  AND c.relkind IN ('r', 'p')
+"""
+
+_PG_COLUMN_STATS = """
+SELECT tablename, attname, null_frac, n_distinct,
+       most_common_vals::text, most_common_freqs::text, histogram_bounds::text
+FROM pg_stats
+WHERE schemaname = COALESCE(:schema, current_schema())
+"""
+
+
+def parse_pg_array(raw: Optional[str]) -> List[str]:
+    """Parse a one-dimensional PostgreSQL array literal like ``{a,"b c",3}``."""
+    if not raw or raw in ("{}", "NULL"):
+        return []
+    body = raw.strip()
+    if body.startswith("{") and body.endswith("}"):
+        body = body[1:-1]
+    reader = csv.reader([body], delimiter=",", quotechar='"', escapechar="\\")
+    return next(reader, [])
+
+
+def _floats(values: List[str]) -> List[float]:
+    out = []
+    for v in values:
+        try:
+            out.append(float(v))
+        except (TypeError, ValueError):
+            return []
+    return out
+
+
+def load_pg_catalog_stats(conn, schema: Optional[str], stale_fraction: float) -> Dict[str, Dict[str, Any]]:
+    """
+    Read table- and column-level planner statistics for a whole schema in
+    two catalog queries.  Returns ``{table: {"row_count", "stale", "columns"}}``.
+    """
+    out: Dict[str, Dict[str, Any]] = {}
+    try:
+        for name, reltuples, n_mod, analyzed_at in conn.execute(
+            text(_PG_TABLE_STATS), {"schema": schema}
+        ):
+            rows = int(reltuples) if reltuples is not None else -1
+            stale = (
+                analyzed_at is None
+                or rows < 0
+                or (n_mod or 0) > stale_fraction * max(rows, 1)
+            )
+            out[name] = {"row_count": max(rows, 0), "stale": stale, "columns": {}}
+        for tbl, col, null_frac, n_distinct, mcv, mcf, hist in conn.execute(
+            text(_PG_COLUMN_STATS), {"schema": schema}
+        ):
+            if tbl in out:
+                out[tbl]["columns"][col] = {
+                    "null_frac": float(null_frac or 0.0),
+                    "n_distinct": float(n_distinct or 0.0),
+                    "most_common_vals": parse_pg_array(mcv),
+                    "most_common_freqs": _floats(parse_pg_array(mcf)),
+                    "histogram_bounds": parse_pg_array(hist),
+                }
+    except SQLAlchemyError as e:
+        logger.warning(f"Catalog statistics unavailable: {e}")
+        return {}
+    return out
+
+
+def catalog_profile(
+    table_stats: Dict[str, Any],
+    cols_meta: Dict[str, Any],
+    is_numeric: Callable[[str], bool],
+    proportion_margin: Callable[[int, int, int], float],
+    distributions: bool = False,
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    ColumnStats for every column from catalog statistics, or ``None`` when
+    the table does not qualify (stale, or any column lacks statistics).
+    With ``distributions`` the most-common-values list doubles as top-k.
+    """
+    if table_stats.get("stale"):
+        return None
+    col_stats = table_stats["columns"]
+    if any(c not in col_stats for c in cols_meta):
+        return None
+
+    row_count = table_stats["row_count"]
+    analyzed = min(PG_ANALYZE_SAMPLE_ROWS, row_count) or 1
+    stats_out: Dict[str, Dict[str, Any]] = {}
+    for col_name, meta in cols_meta.items():
+        cs = col_stats[col_name]
+        null_frac = cs["null_frac"]
+        # n_distinct < 0 means "-(distinct / rows)", i.e. scales with the table
+        n_distinct = cs["n_distinct"]
+        unique_count = round(-n_distinct * row_count) if n_distinct < 0 else round(n_distinct)
+        unique_count = min(unique_count, row_count)
+
+        mcv, mcf, hist = cs["most_common_vals"], cs["most_common_freqs"], cs["histogram_bounds"]
+        stat = {
+            "null_count": round(null_frac * row_count),
+            "null_percentage": round(null_frac * 100, 2),
+            "unique_count": unique_count,
+            "unique_percentage": round(unique_count / row_count * 100, 2) if row_count else 0.0,
+            "sample_values": (mcv or hist)[:3],
+            "min_value": None,
+            "max_value": None,
+            "mean_value": None,
+            "is_estimate": True,
+            "sample_fraction": round(min(analyzed / row_count, 1.0), 6) if row_count else 1.0,
+            "null_percentage_margin": round(
+                proportion_margin(round(null_frac * analyzed), analyzed, row_count), 2
+            ),
+            "unique_count_bounds": None,
+            "distinct_method": "catalog",
+            "quantiles": None,
+            "histogram": None,
+            "top_values": None,
+            "length_stats": None,
+        }
+        if distributions and len(mcf) >= len(mcv):
+            stat["top_values"] = [
+                {"value": v, "count": round(f * row_count)} for v, f in zip(mcv, mcf)
+            ][:5]
+
+        if is_numeric(meta["original_type"]):
+            hist_f, mcv_f = _floats(hist), _floats(mcv)
+            bounds = hist_f + mcv_f
+            if bounds:
+                stat["min_value"] = min(bounds)
+                stat["max_value"] = max(bounds)
+            # Mean: MCVs weighted by their frequency, the rest spread evenly
+            # across the equi-depth histogram buckets (midpoint per bucket)
+            non_null = 1.0 - null_frac
+            if non_null > 0 and (hist_f or mcv_f):
+                mcv_mass = sum(mcf[: len(mcv_f)]) if mcv_f and len(mcf) >= len(mcv_f) else 0.0
+                total = sum(v * f for v, f in zip(mcv_f, mcf)) if mcv_mass else 0.0
+                rest = max(non_null - mcv_mass, 0.0)
+                if len(hist_f) >= 2 and rest > 0:
+                    mids = [(a + b) / 2 for a, b in zip(hist_f, hist_f[1:])]
+                    total += rest * sum(mids) / len(mids)
+                    stat["mean_value"] = round(total / non_null, 4)
+                elif mcv_mass:
+                    stat["mean_value"] = round(total / mcv_mass, 4)
+        stats_out[col_name] = stat
+    return stats_out
@@ -0,0 +1,129 @@
+"""
+Engine Registry — process-wide cache of SQLAlchemy engines.
+
+Every pipeline run (and every validation retry) used to build a fresh
+engine, paying the TLS/auth handshake to Neon or Snowflake again and
+leaking the old pool.  The registry hands out one engine per
+(normalized connection string, pg_schema, engine options), so repeated
+runs reuse warm pooled connections, and connectors that need a
+differently configured engine (read-write, no SQLite fast path, ...)
+never receive one set up for another.
+
+- Bounded: least-recently-used engines beyond ``max_engines`` are evicted.
+- Idle eviction: engines unused for ``idle_ttl_s`` seconds are evicted.
+- Evicted engines are ``dispose()``d so their pools close cleanly.
+- Engines are created with ``pool_pre_ping`` so stale pooled connections
+  (e.g. closed by a serverless proxy while idle) are replaced transparently.
+"""
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional, Tuple
+
+from sqlalchemy.engine import Engine, make_url
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_url(connection_string: str) -> str:
+    """
+    Canonical form of a connection string: lower-cased driver name and
+    sorted query parameters, so equivalent URLs share one engine.
+    """
+    try:
+        url = make_url(connection_string)
+    except Exception:
+        return connection_string.strip()
+    url = url.set(
+        drivername=url.drivername.lower(),
+        query=dict(sorted(url.query.items())),
+    )
+    return url.render_as_string(hide_password=False)
+
+
+class EngineRegistry:
+    """Thread-safe LRU cache of engines with idle eviction."""
+
+    def __init__(self, max_engines: int = 8, idle_ttl_s: float = 900.0):
+        self.max_engines = max_engines
+        self.idle_ttl_s = idle_ttl_s
+        # key -> (engine, last_used monotonic timestamp)
+        self._engines: "OrderedDict[Tuple[str, Optional[str], Tuple[Any, ...]], list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        connection_string: str,
+        pg_schema: Optional[str],
+        factory: Callable[[str], Engine],
+        options: Tuple[Any, ...] = (),
+    ) -> Engine:
+        """
+        Return the cached engine for this source, creating it on a miss.
+        ``options`` are the settings ``factory`` builds the engine with;
+        they are part of the key.
+        """
+        key = (normalize_url(connection_string), pg_schema, tuple(options))
+        with self._lock:
+            self._evict_idle()
+            entry = self._engines.get(key)
+            if entry is not None:
+                self.hits += 1
+                entry[1] = time.monotonic()
+                self._engines.move_to_end(key)
+                return entry[0]
+
+            self.misses += 1
+            engine = factory(connection_string)
+            self._engines[key] = [engine, time.monotonic()]
+            while len(self._engines) > self.max_engines:
+                _, (old, _) = self._engines.popitem(last=False)
+                self._dispose(old, reason="capacity")
+            return engine
+
+    def _evict_idle(self) -> None:
+        """Dispose engines idle longer than the TTL.  Caller holds the lock."""
+        now = time.monotonic()
+        stale = [k for k, (_, used) in self._engines.items() if now - used > self.idle_ttl_s]
+        for k in stale:
+            engine, _ = self._engines.pop(k)
+            self._dispose(engine, reason="idle")
+
+    def _dispose(self, engine: Engine, reason: str) -> None:
+        self.evictions += 1
+        logger.info(f"Disposing engine for {engine.url.render_as_string()} ({reason}).")
+        try:
+            engine.dispose()
+        except Exception as e:
+            logger.warning(f"Engine dispose failed: {e}")
+
+    def dispose_all(self) -> None:
+        """Dispose every cached engine (application shutdown)."""
+        with self._lock:
+            while self._engines:
+                _, (engine, _) = self._engines.popitem(last=False)
+                self._dispose(engine, reason="shutdown")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "engines": len(self._engines),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# ── Singleton ──
+engine_registry = EngineRegistry(
+    max_engines=settings.ENGINE_CACHE_SIZE,
+    idle_ttl_s=settings.ENGINE_IDLE_TTL_S,
+)
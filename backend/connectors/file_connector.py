@@ -0,0 +1,403 @@
+"""
+File Connector — schema extraction + statistical profiling straight from
+Parquet / CSV files, without loading them into a database first.
+
+A directory (or a single file) is the source: every ``*.parquet`` /
+``*.csv`` file is a table named after its stem, profiled into the same
+TableSchema / ColumnStats shape SQLConnector produces.
+
+- Parquet (needs pyarrow): the file is memory-mapped.  Schema and row
+  count come from the footer, as do per-row-group null counts and min/max.
+  Values are streamed in record batches into the vectorized profiler's
+  accumulators.  Files above ``sample_threshold`` rows are profiled from
+  evenly spread row groups; footer null counts and min/max stay exact for
+  the whole file.
+- CSV: memory-mapped and read in chunks of ``chunk_rows`` with every value
+  kept as text, so chunks hash alike.  Types are inferred from the first
+  chunk.  CSVs have no footer, so they are always scanned in full.
+
+Memory stays bounded by one batch plus the accumulators, whatever the
+file size.  Connection strings are ``file:///path/to/dir`` (or a file).
+"""
+import math
+import logging
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from backend.core.state import TableSchema, ColumnMetadata, ColumnStats
+from backend.connectors.profile_store import ProfileStore, profile_store, source_key
+from backend.connectors.vectorized_profiler import ColumnAccumulator
+from backend.connectors.sql_connector import SQLConnector, _estimate_distinct, _proportion_margin
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet support is optional
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+FILE_SCHEME = "file://"
+TABLE_SUFFIXES = {".parquet": "parquet", ".csv": "csv"}
+
+# pandas dtype kind -> type name (Arrow's spelling, matching Parquet columns)
+_CSV_TYPES = {"i": "int64", "u": "uint64", "f": "double", "b": "bool"}
+
+
+def is_file_source(connection_string: str) -> bool:
+    return connection_string.lower().startswith(FILE_SCHEME)
+
+
+def file_path(connection_string: str) -> Path:
+    """The filesystem path of a ``file://`` connection string."""
+    return Path(connection_string[len(FILE_SCHEME):] if is_file_source(connection_string) else connection_string)
+
+
+class FileConnector:
+    def __init__(
+        self,
+        connection_string: str,
+        incremental: bool = False,
+        store: Optional[ProfileStore] = None,
+        max_workers: int = 4,
+        sample_threshold: Optional[int] = None,
+        sample_rows: int = 100_000,
+        distinct_mode: str = "exact",
+        distributions: bool = False,
+        sample_values: int = 3,
+        sample_max_bytes: int = 256,
+        chunk_rows: int = 100_000,
+    ):
+        self.root = file_path(connection_string)
+        self._source_key = source_key(f"{FILE_SCHEME}{self.root.resolve()}")
+        # Re-profile only files whose size or mtime (or the profiling
+        # options) changed since last run
+        self.incremental = incremental
+        self.store = store or profile_store
+        # Files are profiled concurrently: Arrow decoding releases the GIL
+        self.max_workers = max_workers
+        # Parquet files above sample_threshold rows are profiled from
+        # row groups holding ~sample_rows rows
+        self.sample_threshold = sample_threshold
+        self.sample_rows = sample_rows
+        # "exact" = exact distinct counts up to a cap; "approx" = HyperLogLog
+        self.distinct_mode = distinct_mode
+        self.distributions = distributions
+        self.sample_values = sample_values
+        self.sample_max_bytes = sample_max_bytes
+        # Rows per record batch / CSV chunk
+        self.chunk_rows = chunk_rows
+        # table -> column -> ColumnAccumulator from the last run
+        self.column_accumulators: Dict[str, Dict[str, ColumnAccumulator]] = {}
+        self.last_run_stats: Dict[str, Any] = {"tables_reused": 0, "tables_rescanned": 0}
+
+    def get_live_schema(self) -> Dict[str, TableSchema]:
+        """Every Parquet / CSV file under the source, profiled as a table."""
+        tables = self._discover()
+        logger.info(f"File source {self.root}: found tables {list(tables)}")
+
+        fingerprints = {t: self._fingerprint(p) for t, p in tables.items()}
+        stored = self.store.load(self._source_key) if self.incremental else {}
+
+        schema_out: Dict[str, TableSchema] = {}
+        to_scan = []
+        for t_name in tables:
+            prev = stored.get(t_name)
+            if prev and prev.get("fingerprint") == fingerprints[t_name]:
+                schema_out[t_name] = prev["profile"]
+                schema_out[t_name]["profile_plan"] = {
+                    "strategy": "reuse",
+                    "reason": "unchanged since the last run",
+                    "estimated_rows": prev["profile"]["row_count"],
+                    "estimate_source": None,
+                    "budgeted_rows": 0,
+                }
+            else:
+                to_scan.append(t_name)
+
+        if to_scan:
+            with ThreadPoolExecutor(max_workers=min(len(to_scan), self.max_workers)) as pool:
+                futures = {pool.submit(self._profile_file, t, tables[t]): t for t in to_scan}
+                for future in as_completed(futures):
+                    t_name = futures[future]
+                    try:
+                        schema_out[t_name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing file table '{t_name}': {e}")
+
+        self.last_run_stats = {
+            "tables_reused": len(tables) - len(to_scan),
+            "tables_rescanned": sum(1 for t in to_scan if t in schema_out),
+            "tables_from_catalog": 0,
+            "tables_incomplete": 0,
+            "plan": {t: out["profile_plan"] for t, out in schema_out.items()},
+        }
+        if self.incremental:
+            # Only re-scanned files are written; reused entries stand as they are
+            self.store.save(self._source_key, {
+                t: {"fingerprint": fingerprints[t], "profile": schema_out[t]}
+                for t in to_scan if t in schema_out
+            })
+            stale = {t for t in to_scan if t not in schema_out} | (set(stored) - set(tables))
+            self.store.delete(self._source_key, stale & set(stored))
+        # Catalog order, like the SQL connector's reflection
+        return {t: schema_out[t] for t in tables if t in schema_out}
+
+    def _discover(self) -> Dict[str, Path]:
+        """table name -> file, for the source file or the directory's files."""
+        if not self.root.exists():
+            raise FileNotFoundError(f"File source not found: {self.root}")
+        files = [self.root] if self.root.is_file() else sorted(self.root.iterdir())
+        tables: Dict[str, Path] = {}
+        for path in files:
+            if path.is_file() and path.suffix.lower() in TABLE_SUFFIXES:
+                if path.stem in tables:
+                    logger.warning(f"Skipping '{path.name}': table '{path.stem}' already read from another file.")
+                    continue
+                tables[path.stem] = path
+        return tables
+
+    def _fingerprint(self, path: Path) -> str:
+        """File size and mtime, plus the options that shape its profile."""
+        st = path.stat()
+        options = (
+            self.sample_threshold, self.sample_rows, self.distinct_mode,
+            self.distributions, self.sample_values, self.sample_max_bytes,
+        )
+        return f"{st.st_size}:{st.st_mtime_ns}:{options}"
+
+    # ── Profiling ──
+
+    def _profile_file(self, t_name: str, path: Path) -> TableSchema:
+        if TABLE_SUFFIXES[path.suffix.lower()] == "parquet":
+            return self._profile_parquet(t_name, path)
+        return self._profile_csv(t_name, path)
+
+    def _new_accumulators(self, types: Dict[str, str], numeric: set) -> Dict[str, ColumnAccumulator]:
+        return {
+            c: ColumnAccumulator(
+                c in numeric, self.distributions, self.distinct_mode == "exact",
+                self.sample_values, self.sample_max_bytes,
+            )
+            for c in types
+        }
+
+    @staticmethod
+    def _fold(accs: Dict[str, ColumnAccumulator], frames: Iterator[pd.DataFrame]) -> None:
+        for frame in frames:
+            for c, acc in accs.items():
+                acc.add(frame[c])
+
+    def _profile_parquet(self, t_name: str, path: Path) -> TableSchema:
+        if pq is None:
+            raise ImportError("Parquet files need pyarrow (pip install pyarrow).")
+        parquet = pq.ParquetFile(path, memory_map=True)
+        meta = parquet.metadata
+        schema = parquet.schema_arrow
+        types = {f.name: str(f.type) for f in schema}
+        numeric = {
+            f.name for f in schema
+            if pa.types.is_integer(f.type) or pa.types.is_floating(f.type) or pa.types.is_decimal(f.type)
+        }
+        row_count = meta.num_rows
+
+        row_groups = list(range(meta.num_row_groups))
+        sampling = bool(self.sample_threshold) and row_count > self.sample_threshold
+        if sampling:
+            row_groups = self._sample_row_groups(meta, self.sample_rows)
+            sampling = len(row_groups) < meta.num_row_groups
+
+        accs = self._new_accumulators(types, numeric)
+        if row_count:
+            # Object columns keep values as Python ints / datetimes whether
+            # or not a batch has nulls, so hashes agree across batches
+            self._fold(accs, (
+                batch.to_pandas(integer_object_nulls=True, date_as_object=True, timestamp_as_object=True)
+                for batch in parquet.iter_batches(batch_size=self.chunk_rows, row_groups=row_groups)
+            ))
+        scanned = next(iter(accs.values())).rows if accs else 0
+        if sampling:
+            reason = (
+                f"{row_count:,} rows exceeds the sampling threshold of {self.sample_threshold:,}; "
+                f"{len(row_groups)} of {meta.num_row_groups} row groups"
+            )
+        else:
+            reason = "Parquet file scanned fully"
+        return self._table_out(
+            t_name, types, numeric, accs, row_count, scanned, sampling,
+            {c: (not f.nullable) for c, f in zip(types, schema)},
+            footer=self._footer_stats(meta, numeric),
+            plan={
+                "strategy": "sample" if sampling else "full",
+                "reason": reason,
+                "estimated_rows": row_count,
+                "estimate_source": "footer",
+                "budgeted_rows": scanned,
+            },
+        )
+
+    @staticmethod
+    def _sample_row_groups(meta, target_rows: int) -> List[int]:
+        """Evenly spread row groups holding about ``target_rows`` rows."""
+        groups = meta.num_row_groups
+        per_group = max(meta.num_rows / max(groups, 1), 1)
+        k = min(groups, max(1, math.ceil(target_rows / per_group)))
+        return sorted({i * groups // k for i in range(k)})
+
+    @staticmethod
+    def _footer_stats(meta, numeric: set) -> Dict[str, Dict[str, Any]]:
+        """
+        Whole-file null counts and (numeric) min/max from row-group
+        statistics, for top-level columns whose every row group has them.
+        """
+        by_column: Dict[str, List[Any]] = {}
+        for rg in range(meta.num_row_groups):
+            group = meta.row_group(rg)
+            for i in range(group.num_columns):
+                chunk = group.column(i)
+                if "." in chunk.path_in_schema:
+                    continue  # nested field
+                by_column.setdefault(chunk.path_in_schema, []).append(chunk.statistics)
+
+        footer: Dict[str, Dict[str, Any]] = {}
+        for c, stats in by_column.items():
+            if any(s is None for s in stats):
+                continue
+            out: Dict[str, Any] = {}
+            if all(s.has_null_count for s in stats):
+                out["nulls"] = sum(s.null_count for s in stats)
+            if c in numeric:
+                ranged = [s for s in stats if s.has_min_max]
+                # Row groups with nothing but nulls carry no min/max
+                if ranged and all(s.has_min_max or s.null_count == s.num_values for s in stats):
+                    out["min"] = min(float(s.min) for s in ranged)
+                    out["max"] = max(float(s.max) for s in ranged)
+            footer[c] = out
+        return footer
+
+    def _profile_csv(self, t_name: str, path: Path) -> TableSchema:
+        head = pd.read_csv(path, nrows=self.chunk_rows, memory_map=True)
+        types = {c: _CSV_TYPES.get(dtype.kind, "string") for c, dtype in head.dtypes.items()}
+        numeric = {c for c, t in types.items() if t in ("int64", "uint64", "double")}
+        del head
+
+        accs = self._new_accumulators(types, numeric)
+        self._fold(accs, pd.read_csv(path, chunksize=self.chunk_rows, dtype=str, memory_map=True))
+        row_count = next(iter(accs.values())).rows if accs else 0
+        return self._table_out(
+            t_name, types, numeric, accs, row_count, row_count, False, {},
+            footer={},
+            plan={
+                "strategy": "full",
+                "reason": "CSV streamed in chunks",
+                "estimated_rows": None,
+                "estimate_source": None,
+                "budgeted_rows": row_count,
+            },
+        )
+
+    # ── Output ──
+
+    def _table_out(
+        self,
+        t_name: str,
+        types: Dict[str, str],
+        numeric: set,
+        accs: Dict[str, ColumnAccumulator],
+        row_count: int,
+        scanned: int,
+        sampling: bool,
+        not_null: Dict[str, bool],
+        footer: Dict[str, Dict[str, Any]],
+        plan: Dict[str, Any],
+    ) -> TableSchema:
+        """A table entry in SQLConnector's shape from the folded accumulators."""
+        self.column_accumulators[t_name] = accs
+        columns: Dict[str, ColumnMetadata] = {}
+        stats_out: Dict[str, ColumnStats] = {}
+        for c, type_str in types.items():
+            columns[c] = {
+                "name": c,
+                "original_type": type_str,
+                "nullable": not not_null.get(c, False),
+                "description": None,
+                "business_logic": None,
+                "potential_pii": False,
+                "tags": [],
+                "stats": None,
+            }
+            if row_count == 0 or scanned == 0:
+                continue
+            stats_out[c] = columns[c]["stats"] = self._column_stats(
+                accs[c], c in numeric, row_count, scanned, sampling, footer.get(c, {})
+            )
+
+        return {
+            "table_name": t_name,
+            "row_count": row_count,
+            "columns": columns,
+            "health_score": SQLConnector._score_health(stats_out),
+            "description": None,
+            "foreign_keys": [],
+            "profile_strategy": plan["strategy"],
+            "row_count_estimated": False,
+            "profile_incomplete": False,
+            "profile_plan": plan,
+            "indexes": [],
+        }
+
+    def _column_stats(
+        self,
+        acc: ColumnAccumulator,
+        numeric: bool,
+        row_count: int,
+        scanned: int,
+        sampling: bool,
+        footer: Dict[str, Any],
+    ) -> ColumnStats:
+        null_count = acc.nulls
+        unique_count = acc.distinct()
+        margin = 0.0
+        bounds = None
+        if sampling:
+            unique_count, bounds = _estimate_distinct(
+                unique_count, scanned - null_count, scanned, row_count, acc.frequency_counts
+            )
+            if "nulls" in footer:
+                null_count = footer["nulls"]
+            else:
+                margin = _proportion_margin(null_count, scanned, row_count)
+                null_count = round(null_count / scanned * row_count)
+        fraction = min(scanned / row_count, 1.0)
+
+        col_stat: ColumnStats = {
+            "null_count": null_count,
+            "null_percentage": round((null_count / row_count) * 100, 2),
+            "unique_count": unique_count,
+            "unique_percentage": round((unique_count / row_count) * 100, 2),
+            "sample_values": acc.samples,
+            "min_value": None,
+            "max_value": None,
+            "mean_value": None,
+            "is_estimate": sampling or acc.distinct_method != "exact",
+            "sample_fraction": round(fraction, 6),
+            "null_percentage_margin": round(margin, 2),
+            "unique_count_bounds": bounds,
+            "distinct_method": acc.distinct_method,
+            "quantiles": None,
+            "histogram": None,
+            "top_values": None,
+            "length_stats": None,
+        }
+        if acc.distribution is not None:
+            col_stat.update(acc.distribution.summary(scale=row_count / scanned))
+        if numeric:
+            min_v, max_v = footer.get("min", acc.min), footer.get("max", acc.max)
+            mean_v = acc.mean()
+            col_stat["min_value"] = float(min_v) if min_v is not None else None
+            col_stat["max_value"] = float(max_v) if max_v is not None else None
+            col_stat["mean_value"] = round(float(mean_v), 4) if mean_v is not None else None
+        return col_stat
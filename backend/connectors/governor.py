@@ -0,0 +1,288 @@
+"""
+Query Governor — bounds the load profiling puts on a source database.
+
+One governor per source (shared by every run against it, like engines in
+the engine registry) enforces:
+
+- a cap on concurrent profiling queries (connections checked out through
+  ``SQLConnector._connect``), optionally lowered adaptively: AIMD on
+  statement latency relative to earlier runs of the same statement — the
+  cap halves when a fast moving average of that ratio exceeds
+  ``backoff_ratio``, and grows back by one after ``recover_after``
+  statements without a slowdown.  Comparing like with like keeps a heavy
+  table scan from reading as contention next to cheap catalog queries;
+- an optional queries-per-second budget, a token bucket charged before
+  every statement (``before_cursor_execute``);
+- an optional rows-scanned-per-second budget, a token bucket charged with
+  each scan's expected size before it starts.
+
+Buckets may go into debt: a caller charging more than is available waits
+until the debt is paid back at the configured rate.
+"""
+import time
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.util.concurrency import in_greenlet
+
+try:
+    from sqlalchemy.util import await_
+except ImportError:  # SQLAlchemy 2.0 names it await_only
+    from sqlalchemy.util import await_only as await_
+
+logger = logging.getLogger(__name__)
+
+
+def _sleep(seconds: float) -> None:
+    """
+    ``time.sleep``, except on an asyncio engine's greenlet (AsyncSQLConnector),
+    where the wait is yielded to the event loop instead of stalling it.
+    """
+    try:
+        if in_greenlet():
+            await_(asyncio.sleep(seconds))
+            return
+    except ImportError:
+        pass  # no greenlet installed, so no asyncio engines either
+    time.sleep(seconds)
+
+
+class TokenBucket:
+    """``rate`` tokens per second, bursting up to one second's worth."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self, n: float) -> float:
+        """Charge ``n`` tokens; returns how long the caller must wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= n
+            return max(0.0, -self._tokens / self.rate)
+
+
+class QueryGovernor:
+    """Concurrency cap, rate budgets and adaptive backoff for one source."""
+
+    # EWMA weights: fast (slowdown ratio) reacts within a few statements,
+    # slow (per-statement baseline) drifts with the source
+    _FAST_ALPHA = 0.3
+    _SLOW_ALPHA = 0.02
+    # Latencies under this are noise (catalog lookups, index seeks)
+    _MIN_LATENCY_S = 0.05
+    # Statement baselines kept; the least recently seen are dropped first
+    _MAX_SHAPES = 1024
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        max_qps: Optional[float] = None,
+        max_rows_per_s: Optional[float] = None,
+        adaptive: bool = True,
+        backoff_ratio: float = 2.0,
+        recover_after: int = 20,
+        cooldown_s: float = 1.0,
+    ):
+        self._cond = threading.Condition()
+        self._active = 0
+        self._fast: Optional[float] = None
+        # statement -> latency baseline
+        self._baselines: Dict[str, float] = {}
+        self._streak = 0
+        self._last_cut = 0.0
+        self.queries = 0
+        self.backoffs = 0
+        self.throttled_s = 0.0
+        self._settings: Optional[tuple] = None
+        self.configure(max_concurrent, max_qps, max_rows_per_s, adaptive,
+                       backoff_ratio, recover_after, cooldown_s)
+
+    def configure(
+        self,
+        max_concurrent: int = 8,
+        max_qps: Optional[float] = None,
+        max_rows_per_s: Optional[float] = None,
+        adaptive: bool = True,
+        backoff_ratio: float = 2.0,
+        recover_after: int = 20,
+        cooldown_s: float = 1.0,
+    ) -> None:
+        """
+        Apply limits.  Changed limits restart the adaptive cap at
+        ``max_concurrent``; unchanged ones keep what backoff has learned.
+        """
+        settings = (max_concurrent, max_qps, max_rows_per_s, adaptive,
+                    backoff_ratio, recover_after, cooldown_s)
+        with self._cond:
+            if settings == self._settings:
+                return
+            self._settings = settings
+            self.max_concurrent = max(1, max_concurrent)
+            self.limit = self.max_concurrent
+            self.adaptive = adaptive
+            self.backoff_ratio = backoff_ratio
+            self.recover_after = recover_after
+            self.cooldown_s = cooldown_s
+            self._qps = TokenBucket(max_qps) if max_qps else None
+            self._rows = TokenBucket(max_rows_per_s) if max_rows_per_s else None
+            self._cond.notify_all()
+
+    # ── Concurrency ──
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the currently allowed concurrent query slots."""
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            self.release()
+
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free right now (callers that must not block)."""
+        with self._cond:
+            if self._active >= self.limit:
+                return False
+            self._active += 1
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    # ── Rate budgets ──
+
+    def _wait(self, seconds: float) -> None:
+        if seconds > 0:
+            with self._cond:
+                self.throttled_s += seconds
+            _sleep(seconds)
+
+    def before_query(self) -> None:
+        """Charge one statement against the queries-per-second budget."""
+        with self._cond:
+            self.queries += 1
+        if self._qps is not None:
+            self._wait(self._qps.take(1))
+
+    def charge_rows(self, rows: int) -> None:
+        """Charge a scan's rows against the rows-per-second budget before it runs."""
+        if self._rows is not None and rows > 0:
+            self._wait(self._rows.take(rows))
+
+    # ── Adaptive backoff (AIMD) ──
+
+    def observe(self, latency_s: float, shape: str = "") -> None:
+        """
+        Feed one statement's latency; may lower or raise the concurrency cap.
+        ``shape`` (the statement text) picks the baseline it is compared
+        with; a shape's first run only records its baseline.
+        """
+        if not self.adaptive:
+            return
+        with self._cond:
+            base = self._baselines.pop(shape, None)
+            if base is None:
+                self._baselines[shape] = latency_s
+                if len(self._baselines) > self._MAX_SHAPES:
+                    del self._baselines[next(iter(self._baselines))]
+                return
+            self._baselines[shape] = base + self._SLOW_ALPHA * (latency_s - base)
+            ratio = latency_s / max(base, self._MIN_LATENCY_S)
+            self._fast = ratio if self._fast is None else self._fast + self._FAST_ALPHA * (ratio - self._fast)
+            now = time.monotonic()
+            slow_down = latency_s > self._MIN_LATENCY_S and self._fast > self.backoff_ratio
+            if slow_down:
+                self._streak = 0
+                if self.limit > 1 and now - self._last_cut >= self.cooldown_s:
+                    self.limit = max(1, self.limit // 2)
+                    self._last_cut = now
+                    self.backoffs += 1
+                    logger.warning(
+                        f"Source latency rising ({self._fast:.1f}x the usual for the same queries); "
+                        f"profiling concurrency lowered to {self.limit}."
+                    )
+            else:
+                self._streak += 1
+                if self._streak >= self.recover_after and self.limit < self.max_concurrent:
+                    self.limit += 1
+                    self._streak = 0
+                    self._cond.notify_all()
+
+    # ── Engine hooks ──
+
+    def attach(self, engine: Engine) -> None:
+        """Throttle and time every statement run on ``engine`` (idempotent)."""
+        if event.contains(engine, "before_cursor_execute", self._before_execute):
+            return
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine, "handle_error", self._on_error)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.before_query()
+        conn.info.setdefault("governor_started", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("governor_started")
+        if started:
+            self.observe(time.perf_counter() - started.pop(), statement)
+
+    @staticmethod
+    def _on_error(context):
+        # A failed statement never reaches after_cursor_execute
+        conn = context.connection
+        if conn is not None and conn.info.get("governor_started"):
+            conn.info["governor_started"].pop()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "max_concurrent": self.max_concurrent,
+                "active": self._active,
+                "queries": self.queries,
+                "backoffs": self.backoffs,
+                "throttled_s": round(self.throttled_s, 3),
+            }
+
+
+class GovernorRegistry:
+    """One governor per source, so concurrent runs share its budgets."""
+
+    def __init__(self):
+        self._governors: Dict[str, QueryGovernor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, **limits) -> QueryGovernor:
+        """The source's governor, created on first use; ``limits`` are applied."""
+        with self._lock:
+            governor = self._governors.get(key)
+            if governor is None:
+                governor = self._governors[key] = QueryGovernor(**limits)
+                return governor
+        governor.configure(**limits)
+        return governor
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            governors = dict(self._governors)
+        return {key: g.stats() for key, g in governors.items()}
+
+
+# ── Singleton ──
+governor_registry = GovernorRegistry()
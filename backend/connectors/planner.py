@@ -0,0 +1,82 @@
+"""
+Profiling planner — picks a strategy per table before any table is read.
+
+Strategies, cheapest first:
+  - "catalog":     planner statistics only (PostgreSQL pg_stats), no scan;
+  - "sample":      aggregate over ~sample_rows rows;
+  - "full":        aggregate over the whole table;
+  - "partitioned": full scan split into slices profiled in parallel;
+  - "none":        structure only — the run's row budget is spent.
+
+Inputs are row estimates (catalog, or EXPLAIN where the catalog has none)
+and which tables have fresh catalog statistics.  With a rows-scanned
+budget, tables are planned smallest first so as many as possible get
+exact profiles; once a full scan no longer fits, tables are downgraded to
+a sample, then to catalog statistics, then to structure only.
+
+Every plan records its reason, so the run output shows why a table's
+stats are exact or estimated.
+"""
+from typing import Any, Dict, List, Optional, Set
+
+
+def plan_profiles(
+    table_names: List[str],
+    row_estimates: Dict[str, int],
+    estimate_sources: Dict[str, str],
+    catalog_ready: Set[str],
+    prefer_catalog: bool,
+    sample_threshold: Optional[int],
+    sample_rows: int,
+    partition_threshold: Optional[int],
+    row_budget: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    ``{table: {"strategy", "reason", "estimated_rows", "estimate_source",
+    "budgeted_rows"}}`` for every table in ``table_names``.
+
+    Tables without a row estimate are planned "full" and charged nothing
+    up front: their COUNT(*) still decides sampling at profile time.
+    """
+    def _size(t: str) -> int:
+        return row_estimates.get(t, -1)
+
+    plans: Dict[str, Dict[str, Any]] = {}
+    spent = 0
+    for t in sorted(table_names, key=_size):
+        est = row_estimates.get(t)
+        plan: Dict[str, Any] = {
+            "estimated_rows": est,
+            "estimate_source": estimate_sources.get(t) if est is not None else None,
+        }
+        if prefer_catalog and t in catalog_ready:
+            strategy, reason, cost = "catalog", "fresh planner statistics", 0
+        elif est is None:
+            strategy, reason, cost = "full", "no row estimate; COUNT(*) decides at profile time", 0
+        elif sample_threshold is not None and est > sample_threshold:
+            strategy = "sample"
+            reason = f"~{est:,} rows exceeds the sampling threshold of {sample_threshold:,}"
+            cost = min(sample_rows, est)
+        elif partition_threshold and est > partition_threshold:
+            strategy = "partitioned"
+            reason = f"~{est:,} rows exceeds the partitioning threshold of {partition_threshold:,}"
+            cost = est
+        else:
+            strategy, reason, cost = "full", "small enough to scan fully", est
+
+        if row_budget and cost and spent + cost > row_budget:
+            left = max(row_budget - spent, 0)
+            if strategy in ("full", "partitioned") and est > sample_rows and sample_rows <= left:
+                strategy, cost = "sample", sample_rows
+                reason = f"row budget: {left:,} of {row_budget:,} rows left, sampled instead of a full scan"
+            elif t in catalog_ready:
+                strategy, cost = "catalog", 0
+                reason = f"row budget exhausted ({row_budget:,} rows); planner statistics instead"
+            else:
+                strategy, cost = "none", 0
+                reason = f"row budget exhausted ({row_budget:,} rows); structure only"
+
+        spent += cost
+        plan.update(strategy=strategy, reason=reason, budgeted_rows=cost)
+        plans[t] = plan
+    return {t: plans[t] for t in table_names}
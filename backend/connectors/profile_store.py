@@ -0,0 +1,100 @@
+"""
+Profile Store — persists per-table profiles between extraction runs.
+
+Each source database gets its own directory, named by a hash of its
+connection string so credentials never reach disk.  Within it, named
+sections hold one entry per table:
+  - "tables":  per-table change fingerprint + the profile itself, which
+               lets SQLConnector skip re-profiling unchanged tables;
+  - "timings": per-table profiling duration of the last run, used to
+               schedule the slowest tables first;
+  - "watermarks": per-table high-watermark + mergeable column state for
+               append-only profiling (see watermarks).
+
+Entries are one JSON file each (``<source>/<section>/<table hash>.json``),
+written to a temp file and renamed into place like the enrichment cache's,
+so a run writes only the tables it profiled, concurrent runs never undo
+each other's entries, and readers need no lock.
+"""
+import json
+import os
+import shutil
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Iterable
+
+from backend.core.config import settings
+from backend.core.utils import DecimalEncoder
+
+logger = logging.getLogger(__name__)
+
+
+def source_key(connection_string: str, pg_schema: str | None = None) -> str:
+    """Stable, credential-free identifier for a source database."""
+    raw = f"{connection_string}|{pg_schema or ''}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+class ProfileStore:
+    """Directory of entries: source_key -> section -> table_name -> value."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def _section(self, key: str, section: str) -> Path:
+        return self.directory / key / section
+
+    @staticmethod
+    def _entry_name(table: str) -> str:
+        # Table names may hold any character; file names must not
+        return hashlib.sha256(table.encode()).hexdigest()[:32] + ".json"
+
+    def load(self, key: str, section: str = "tables") -> Dict[str, Any]:
+        """Return one stored section for a source (empty if never saved)."""
+        folder = self._section(key, section)
+        if not folder.is_dir():
+            return {}
+        out: Dict[str, Any] = {}
+        for path in folder.glob("*.json"):
+            try:
+                with open(path, "r") as f:
+                    entry = json.load(f)
+                out[entry["table"]] = entry["value"]
+            except FileNotFoundError:  # deleted by another run
+                continue
+            except Exception as e:
+                logger.warning(f"Profile store entry {path.name} unreadable ({e}); ignoring it.")
+        return out
+
+    def save(self, key: str, values: Dict[str, Any], section: str = "tables") -> None:
+        """
+        Store the given tables' entries in one section for a source; other
+        tables' entries are left as they are.  Writes are atomic per table.
+        """
+        folder = self._section(key, section)
+        folder.mkdir(parents=True, exist_ok=True)
+        for table, value in values.items():
+            fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"table": table, "value": value}, f, cls=DecimalEncoder)
+                os.replace(tmp, folder / self._entry_name(table))
+            except Exception:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+
+    def delete(self, key: str, tables: Iterable[str], section: str = "tables") -> None:
+        """Drop the given tables' entries from one section for a source."""
+        folder = self._section(key, section)
+        for table in tables:
+            (folder / self._entry_name(table)).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+# ── Singleton ──
+profile_store = ProfileStore(settings.DATA_DIR / "profile_store")
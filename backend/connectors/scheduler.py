@@ -0,0 +1,68 @@
+"""
+Table scheduling helpers for SQLConnector.get_live_schema.
+
+Profiling wall time is set by whichever worker finishes last.  Dispatching
+tables in catalog order lets one huge table submitted late dominate the
+run, so tables are ordered longest-processing-time (LPT) first: the
+biggest jobs start immediately and small ones fill the gaps.
+"""
+from typing import Dict, List, Optional
+from sqlalchemy.engine import Engine
+
+# Rough profiling throughput used to turn catalog row estimates into
+# seconds when no previous timing exists.  Only the relative order of
+# costs matters for LPT, so this does not need to be precise.
+CELLS_PER_SECOND = 5_000_000
+
+
+def estimate_costs(
+    table_names: List[str],
+    row_estimates: Dict[str, int],
+    column_counts: Dict[str, int],
+    previous_timings: Dict[str, float],
+) -> Dict[str, Optional[float]]:
+    """
+    Estimated profiling seconds per table.
+
+    A previous run's measured duration wins; otherwise rows x columns is
+    converted with CELLS_PER_SECOND.  Tables with neither get ``None``.
+    """
+    costs: Dict[str, Optional[float]] = {}
+    for t in table_names:
+        if t in previous_timings:
+            costs[t] = float(previous_timings[t])
+        elif t in row_estimates and row_estimates[t] >= 0:
+            cells = row_estimates[t] * max(column_counts.get(t, 1), 1)
+            costs[t] = cells / CELLS_PER_SECOND
+        else:
+            costs[t] = None
+    return costs
+
+
+def lpt_order(costs: Dict[str, Optional[float]]) -> List[str]:
+    """Most expensive first; unknown-cost tables go last in original order."""
+    known = sorted((t for t, c in costs.items() if c is not None), key=lambda t: -costs[t])
+    unknown = [t for t, c in costs.items() if c is None]
+    return known + unknown
+
+
+def pool_capacity(engine: Engine, cap: int) -> int:
+    """
+    Concurrent connections the engine's pool can hand out without waiting.
+
+    QueuePool: pool_size + max_overflow.  SingletonThreadPool (in-memory
+    SQLite), whose ``size`` is an attribute, not a method: 1, since each
+    thread would get its own connection, and so its own database.
+    Unbounded pools (NullPool, max_overflow=-1) fall back to ``cap``.
+    """
+    pool = engine.pool
+    size_fn = getattr(pool, "size", None)
+    if size_fn is None:
+        return cap
+    if not callable(size_fn):
+        return 1
+    size = size_fn()
+    overflow = getattr(pool, "_max_overflow", 0)
+    if overflow is None or overflow < 0:
+        return cap
+    return max(1, min(size + overflow, cap))
@@ -0,0 +1,410 @@
+"""
+Mergeable streaming sketches used by the profilers.
+
+All sketches hash values with ``hash_values`` so that sketches built by any
+profiling path (SQL streaming, partitions, later runs) over the same data
+agree and can be merged.
+"""
+import json
+import math
+import zlib
+import base64
+import random
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Longest value text kept by frequency summaries (top-k values)
+MAX_VALUE_CHARS = 100
+
+_BINARY_TYPES = (bytes, bytearray, memoryview)
+
+
+def _canonical(value: Any) -> str:
+    """String form used for hashing; bytes are hex-encoded."""
+    if isinstance(value, _BINARY_TYPES):
+        return bytes(value).hex()
+    return str(value)
+
+
+def render_sample(value: Any, max_bytes: int) -> str:
+    """
+    Display form of a sample value: binary values report only their size,
+    nested values (JSON, Parquet structs and lists) are compact JSON, and
+    text longer than ``max_bytes`` (UTF-8) is truncated with an ellipsis.
+    """
+    if isinstance(value, _BINARY_TYPES):
+        return f"<binary, {len(bytes(value))} bytes>"
+    if isinstance(value, (dict, list)):
+        text = json.dumps(value, separators=(",", ":"), default=str)
+    else:
+        text = str(value)
+    raw = text.encode("utf-8")
+    if len(raw) > max_bytes:
+        return raw[:max_bytes].decode("utf-8", errors="ignore") + "…"
+    return text
+
+
+def hash_values(values: Iterable[Any]) -> np.ndarray:
+    """64-bit hashes of the non-null values (pandas' vectorized SipHash)."""
+    arr = np.empty(0, dtype=object)
+    listed = values if isinstance(values, list) else list(values)
+    if listed:
+        arr = np.empty(len(listed), dtype=object)
+        arr[:] = listed
+        arr = arr[np.not_equal(arr, None)]
+    if arr.size == 0:
+        return np.empty(0, dtype=np.uint64)
+    # Homogeneous ints / floats / strings hash natively; anything else is
+    # hashed through its canonical string.  Column values are of one type
+    # in practice, so every profiling path takes the same branch.
+    types = set(map(type, arr))
+    if types == {int}:
+        try:
+            return pd.util.hash_array(arr.astype(np.int64), categorize=False)
+        except OverflowError:
+            pass
+    elif types == {float}:
+        return pd.util.hash_array(arr.astype(np.float64), categorize=False)
+    elif types == {str}:
+        return pd.util.hash_array(arr, categorize=False)
+    if any(issubclass(t, _BINARY_TYPES) for t in types):
+        arr = np.asarray([_canonical(v) for v in arr], dtype=object)
+    else:
+        arr = arr.astype(str).astype(object)
+    return pd.util.hash_array(arr, categorize=False)
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Vectorized int.bit_length() for uint64 arrays."""
+    x = x.copy()
+    n = np.zeros(x.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = (x >> np.uint64(shift)) != 0
+        n[mask] += shift
+        x[mask] >>= np.uint64(shift)
+    return n + (x != 0)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count sketch (Flajolet et al.).
+
+    2**p one-byte registers; standard error is about 1.04 / sqrt(2**p)
+    (p=12: 4 KiB, ~1.6%).  Sketches with the same ``p`` merge by taking the
+    register-wise maximum, so partitions or runs can be combined.
+    """
+
+    def __init__(self, p: int = 12):
+        if not 4 <= p <= 18:
+            raise ValueError("HyperLogLog precision p must be between 4 and 18")
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """Fold pre-computed 64-bit hashes into the sketch."""
+        if hashes.size == 0:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        width = 64 - self.p
+        idx = (hashes >> np.uint64(width)).astype(np.int64)
+        rest = hashes & np.uint64((1 << width) - 1)
+        rho = (width - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rho)
+
+    def add_values(self, values: Iterable[Any]) -> None:
+        self.add_hashes(hash_values(values))
+
+    def count(self) -> int:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        # Small-range correction: linear counting while registers are empty
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """In-place union with another sketch of the same precision."""
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        packed = base64.b64encode(zlib.compress(self.registers.tobytes())).decode()
+        return {"type": "hll", "p": self.p, "registers": packed}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HyperLogLog":
+        sketch = cls(data["p"])
+        raw = zlib.decompress(base64.b64decode(data["registers"]))
+        sketch.registers = np.frombuffer(raw, dtype=np.uint8).copy()
+        return sketch
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang & Liberty) over floats.
+
+    Level ``h`` holds items of weight 2**h; when a level overflows its
+    capacity it is sorted and every other item (random offset) is promoted
+    one level up.  Rank error is roughly 1.7 / k, independent of stream
+    length.  Two sketches merge by concatenating level-wise and compacting.
+    """
+
+    def __init__(self, k: int = 200, c: float = 2 / 3):
+        self.k = k
+        self.c = c
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.n = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self.levels) - h - 1
+        return max(int(math.ceil(self.k * self.c ** depth)), 2)
+
+    def add_array(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.n += int(values.size)
+        lo, hi = float(values.min()), float(values.max())
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                # An odd item out stays behind so weight is conserved
+                keep = level[-1:] if len(level) % 2 else level[:0]
+                pairs = level[: len(level) - len(keep)]
+                promoted = pairs[random.randint(0, 1)::2]
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+                self.levels[h] = keep
+            h += 1
+
+    def _weighted(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(lvl), 2 ** h, dtype=np.float64) for h, lvl in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.n == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        items, cum = self._weighted()
+        idx = int(np.searchsorted(cum, q * cum[-1], side="left"))
+        return float(items[min(idx, len(items) - 1)])
+
+    def cdf(self, x: float) -> float:
+        """Estimated fraction of items <= x."""
+        if self.n == 0:
+            return 0.0
+        items, cum = self._weighted()
+        idx = int(np.searchsorted(items, x, side="right"))
+        return float(cum[idx - 1] / cum[-1]) if idx else 0.0
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, lvl in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], lvl])
+        self.n += other.n
+        for attr, pick in (("min", min), ("max", max)):
+            ours, theirs = getattr(self, attr), getattr(other, attr)
+            setattr(self, attr, theirs if ours is None else ours if theirs is None else pick(ours, theirs))
+        self._compress()
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": "kll", "k": self.k, "n": self.n, "min": self.min, "max": self.max,
+            "levels": [lvl.tolist() for lvl in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        sketch = cls(data["k"])
+        sketch.n, sketch.min, sketch.max = data["n"], data["min"], data["max"]
+        sketch.levels = [np.asarray(lvl, dtype=np.float64) for lvl in data["levels"]] or [np.empty(0)]
+        return sketch
+
+
+class MisraGries:
+    """
+    Misra-Gries heavy hitters: at most ``k`` counters; any value occurring
+    more than n / (k + 1) times is guaranteed to be tracked, and each
+    reported count undercounts by at most that much.  Mergeable.
+    """
+
+    def __init__(self, k: int = 64):
+        self.k = k
+        self.counters: Dict[str, int] = {}
+        self.n = 0
+
+    def add_counts(self, counts: Dict[str, int]) -> None:
+        """Fold an exact count table (e.g. one batch) into the summary."""
+        for value, c in counts.items():
+            self.counters[value] = self.counters.get(value, 0) + c
+            self.n += c
+        self._prune()
+
+    def add_values(self, values: Iterable[Any]) -> None:
+        self.add_counts(Counter(_canonical(v)[:MAX_VALUE_CHARS] for v in values if v is not None))
+
+    def _prune(self) -> None:
+        if len(self.counters) <= self.k:
+            return
+        # Subtract the (k+1)-th largest count and drop counters that hit zero
+        cut = sorted(self.counters.values(), reverse=True)[self.k]
+        self.counters = {v: c - cut for v, c in self.counters.items() if c > cut}
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        return sorted(self.counters.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
+
+    def merge(self, other: "MisraGries") -> "MisraGries":
+        n = self.n
+        self.add_counts(other.counters)
+        self.n = n + other.n
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "misra_gries", "k": self.k, "n": self.n, "counters": self.counters}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MisraGries":
+        sketch = cls(data["k"])
+        sketch.n, sketch.counters = data["n"], dict(data["counters"])
+        return sketch
+
+
+class ColumnDistribution:
+    """
+    Streaming distribution profile of one column: top-k frequent values,
+    a quantile sketch (numeric columns) and string length stats.  Fed
+    batch by batch from the profiler's scan; mergeable and serializable.
+    """
+
+    def __init__(self, numeric: bool, top_k: int = 64):
+        self.numeric = numeric
+        self.top_k = MisraGries(top_k)
+        self.quantiles = KLLSketch() if numeric else None
+        self.len_count = 0
+        self.len_sum = 0
+        self.len_min: Optional[int] = None
+        self.len_max: Optional[int] = None
+
+    def add_values(self, values: List[Any]) -> None:
+        values = [v for v in values if v is not None]
+        if not values:
+            return
+        self.top_k.add_values(values)
+        if self.quantiles is not None:
+            nums = []
+            for v in values:
+                try:
+                    nums.append(float(v))
+                except (TypeError, ValueError):
+                    continue
+            self.quantiles.add_array(np.asarray(nums, dtype=np.float64))
+        else:
+            self.add_lengths([len(v) for v in values if isinstance(v, (str, bytes))])
+
+    def add_lengths(self, lengths: List[int]) -> None:
+        lengths = [int(n) for n in lengths if n is not None]
+        if not lengths:
+            return
+        self.len_count += len(lengths)
+        self.len_sum += sum(lengths)
+        lo, hi = min(lengths), max(lengths)
+        self.len_min = lo if self.len_min is None else min(self.len_min, lo)
+        self.len_max = hi if self.len_max is None else max(self.len_max, hi)
+
+    def merge(self, other: "ColumnDistribution") -> "ColumnDistribution":
+        self.top_k.merge(other.top_k)
+        if self.quantiles is not None and other.quantiles is not None:
+            self.quantiles.merge(other.quantiles)
+        if other.len_count:
+            self.len_count += other.len_count
+            self.len_sum += other.len_sum
+            self.len_min = other.len_min if self.len_min is None else min(self.len_min, other.len_min)
+            self.len_max = other.len_max if self.len_max is None else max(self.len_max, other.len_max)
+        return self
+
+    def summary(self, scale: float = 1.0, top_n: int = 5, bins: int = 10) -> Dict[str, Any]:
+        """
+        ColumnStats fields.  ``scale`` multiplies counts (1 / sample fraction
+        when the scan was a sample).
+        """
+        out: Dict[str, Any] = {
+            "top_values": [
+                {"value": v, "count": round(c * scale)} for v, c in self.top_k.top(top_n)
+            ],
+            "quantiles": None,
+            "histogram": None,
+            "length_stats": None,
+        }
+        q = self.quantiles
+        if q is not None and q.n:
+            out["quantiles"] = {
+                name: round(q.quantile(p), 4)
+                for name, p in (("p05", 0.05), ("p25", 0.25), ("p50", 0.5), ("p75", 0.75), ("p95", 0.95))
+            }
+            if q.max > q.min:
+                edges = np.linspace(q.min, q.max, bins + 1)
+                cdfs = [0.0] + [q.cdf(e) for e in edges[1:-1]] + [1.0]
+                out["histogram"] = [
+                    {
+                        "lower": round(float(edges[i]), 4),
+                        "upper": round(float(edges[i + 1]), 4),
+                        "count": round((cdfs[i + 1] - cdfs[i]) * q.n * scale),
+                    }
+                    for i in range(bins)
+                ]
+            else:
+                out["histogram"] = [{"lower": q.min, "upper": q.max, "count": round(q.n * scale)}]
+        if self.len_count:
+            out["length_stats"] = {
+                "min": self.len_min,
+                "max": self.len_max,
+                "mean": round(self.len_sum / self.len_count, 2),
+            }
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": "column_distribution",
+            "numeric": self.numeric,
+            "top_k": self.top_k.to_dict(),
+            "quantiles": self.quantiles.to_dict() if self.quantiles is not None else None,
+            "lengths": [self.len_count, self.len_sum, self.len_min, self.len_max],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnDistribution":
+        dist = cls(data["numeric"])
+        dist.top_k = MisraGries.from_dict(data["top_k"])
+        dist.quantiles = KLLSketch.from_dict(data["quantiles"]) if data["quantiles"] else None
+        dist.len_count, dist.len_sum, dist.len_min, dist.len_max = data["lengths"]
+        return dist
@@ -2,21 +2,86 @@
 SQL Connector — dialect-agnostic schema extraction + statistical profiling.
 Ported from src/backend/connectors/sql_connector.py with updated imports.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import os
+import math
+import random
+import json
+import hashlib
+import time
 import datetime
 import logging
+import threading
+from contextlib import contextmanager
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from sqlalchemy import create_engine, inspect, MetaData, Table, select, func, text, Column, case, literal, event
+import multiprocessing
+from concurrent.futures import (
+    ThreadPoolExecutor, ProcessPoolExecutor, as_completed, TimeoutError as FuturesTimeout,
+)
+from sqlalchemy import (
+    create_engine, inspect, MetaData, Table, select, func, text, Column, case, literal, event,
+    literal_column, tablesample, or_, cast, union_all, String, Text,
+    table as sql_table, column as sql_column,
+)
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql import sqltypes
 from sqlalchemy.exc import SQLAlchemyError
 from backend.core.state import TableSchema, ColumnMetadata, ColumnStats
+from backend.connectors.profile_store import ProfileStore, profile_store, source_key
+from backend.connectors.scheduler import estimate_costs, lpt_order, pool_capacity
+from backend.connectors.engine_registry import EngineRegistry, engine_registry, normalize_url
+from backend.connectors.sketches import HyperLogLog, ColumnDistribution, render_sample
+from backend.connectors.timeouts import (
+    ProfileTimeout, statement_timeout, is_timeout, deadline_after, earliest, rollback,
+)
+from backend.connectors.vectorized_profiler import ColumnAccumulator, profile_batches, aggregate_mapping
+from backend.connectors.catalog_stats import load_pg_catalog_stats, catalog_profile
+from backend.connectors.planner import plan_profiles
+from backend.connectors import watermarks
+from backend.connectors.governor import GovernorRegistry, governor_registry
+from backend.connectors import sqlite_fastpath
 
 logger = logging.getLogger(__name__)
 
 
 class SQLConnector:
-    def __init__(self, connection_string: str, pg_schema: str = None):
+    def __init__(
+        self,
+        connection_string: str,
+        pg_schema: str = None,
+        bulk_reflection: bool = True,
+        incremental: bool = False,
+        store: Optional[ProfileStore] = None,
+        max_workers: int = 16,
+        registry: Optional[EngineRegistry] = None,
+        sample_threshold: Optional[int] = None,
+        sample_rows: int = 100_000,
+        distinct_mode: str = "exact",
+        profile_mode: str = "scan",
+        stats_stale_fraction: float = 0.2,
+        column_group_size: int = 50,
+        column_group_workers: int = 4,
+        distributions: bool = False,
+        profile_engine: str = "auto",
+        table_timeout_s: Optional[float] = None,
+        run_budget_s: Optional[float] = None,
+        sample_values: int = 3,
+        sample_max_bytes: int = 256,
+        partition_threshold: Optional[int] = None,
+        partitions: int = 4,
+        row_budget: Optional[int] = None,
+        watermark: bool = False,
+        watermark_columns: Optional[Dict[str, str]] = None,
+        max_concurrent_queries: Optional[int] = None,
+        max_qps: Optional[float] = None,
+        max_rows_per_s: Optional[float] = None,
+        adaptive_backoff: bool = False,
+        read_only: bool = True,
+        governors: Optional[GovernorRegistry] = None,
+        sqlite_fast_path: bool = True,
+        sqlite_immutable: bool = False,
+        sqlite_processes: int = 0,
+    ):
         # Auto-detect pg_schema from custom URL query parameter
         if pg_schema is None and "pg_schema=" in connection_string:
             parsed = urlparse(connection_string)
@@ -41,27 +106,200 @@ class SQLConnector:
                 logger.info("Snowflake: no schema in URL, defaulting to PUBLIC")
 
         self.pg_schema = pg_schema
+        self._source_key = source_key(normalize_url(connection_string), pg_schema)
+        # Reflect the whole catalog in a few get_multi_* queries
+        self.bulk_reflection = bulk_reflection
+        # Re-profile only tables whose change fingerprint moved since last run
+        self.incremental = incremental
+        self.store = store or profile_store
+        # Upper bound on profiling threads; the pool's capacity may lower it
+        self.max_workers = max_workers
+        # Tables above sample_threshold rows are profiled from ~sample_rows rows
+        self.sample_threshold = sample_threshold
+        self.sample_rows = sample_rows
+        # "exact" = COUNT(DISTINCT); "approx" = native APPROX_COUNT_DISTINCT
+        # where available, else a client-side HyperLogLog per column
+        self.distinct_mode = distinct_mode
+        # table -> column -> HyperLogLog from the last run (approx mode only);
+        # serializable via to_dict() for merging across partitions or runs
+        self.column_sketches: Dict[str, Dict[str, HyperLogLog]] = {}
+        # "metadata" = build stats from planner statistics when fresh;
+        # "scan" = always query the tables
+        self.profile_mode = profile_mode
+        # Catalog stats are stale once this fraction of rows changed since ANALYZE
+        self.stats_stale_fraction = stats_stale_fraction
+        # Wide tables are aggregated in groups of this many columns, with up
+        # to column_group_workers groups in flight per table
+        self.column_group_size = column_group_size
+        self.column_group_workers = column_group_workers
+        # Also collect quantiles, histograms, top-k values and string lengths
+        # from one streamed scan that also yields the aggregates (and the
+        # HyperLogLogs in approx mode); it moves every row to the client
+        self.distributions = distributions
+        # table -> column -> ColumnDistribution from the last run
+        self.column_distributions: Dict[str, Dict[str, ColumnDistribution]] = {}
+        # "sql" = batched aggregate queries; "vectorized" = streamed batches
+        # profiled client-side with numpy/pandas; "auto" = per dialect
+        self.profile_engine = profile_engine
+        # table -> column -> ColumnAccumulator from the last run (vectorized
+        # engine only); mergeable across slices of a table
+        self.column_accumulators: Dict[str, Dict[str, ColumnAccumulator]] = {}
+        # Time budgets (seconds; None/0 = unlimited).  A table's queries are
+        # cancelled once its own or the run's budget runs out, and the table
+        # is returned with partial stats flagged profile_incomplete
+        self.table_timeout_s = table_timeout_s
+        self.run_budget_s = run_budget_s
+        # Up to sample_values non-null examples per column; text beyond
+        # sample_max_bytes is truncated, binary values report their size
+        self.sample_values = sample_values
+        self.sample_max_bytes = sample_max_bytes
+        # Fully scanned tables above partition_threshold rows are split into
+        # `partitions` slices (native partitions or key ranges) profiled
+        # concurrently (server-side aggregates per slice) and merged
+        self.partition_threshold = partition_threshold
+        self.partitions = partitions
+        # Rows the whole run may scan (None/0 = unlimited); the planner
+        # downgrades tables to samples, catalog stats or structure only
+        self.row_budget = row_budget
+        # Append-only tables profile only rows past a stored high-watermark
+        # (watermark_columns[table], else a single integer PK) and merge
+        # them into the stored accumulators
+        self.watermark = watermark
+        self.watermark_columns = watermark_columns or {}
+        self.read_only = read_only
+        # SQLite files: read-only URI, mmap + page cache PRAGMAs, bulk
+        # catalog reads; `immutable` also skips locking (file must not
+        # change mid-run).  Tables are profiled in sqlite_processes worker
+        # processes (0 = auto: large files on multi-core hosts; 1 = threads)
+        self.sqlite_fast_path = sqlite_fast_path
+        self.sqlite_immutable = sqlite_immutable
+        self.sqlite_processes = sqlite_processes
+        self.last_run_stats: Dict[str, int] = {"tables_reused": 0, "tables_rescanned": 0}
+        # Per-table dispatch order + start/end times of the last run
+        self.last_schedule: List[Dict[str, Any]] = []
+        # Engines (and their warm pools) are shared across runs per source
+        registry = registry or engine_registry
+        self.engine = registry.get(
+            connection_string,
+            pg_schema,
+            lambda url: self._create_engine(
+                url, pg_schema, read_only, sqlite_fast_path, sqlite_immutable
+            ),
+            options=(read_only, sqlite_fast_path, sqlite_immutable),
+        )
+
+        # Bounds concurrent profiling connections to what the pool can serve
+        self._query_slots = threading.BoundedSemaphore(pool_capacity(self.engine, max_workers))
+        # Load limits shared by every run against this source: concurrent
+        # queries (with adaptive_backoff, lowered as repeated queries slow
+        # down), queries/s, rows/s
+        self.governor = (governors or governor_registry).get(
+            self._source_key,
+            max_concurrent=max_concurrent_queries or max_workers,
+            max_qps=max_qps or None,
+            max_rows_per_s=max_rows_per_s or None,
+            adaptive=adaptive_backoff,
+        )
+        self.governor.attach(self.engine)
+
+        self._inspector = None
+        self.metadata = MetaData(schema=pg_schema if pg_schema else None)
+
+    @property
+    def inspector(self):
+        """Created on first use: inspecting an engine opens a connection."""
+        if self._inspector is None:
+            self._inspector = inspect(self.engine)
+        return self._inspector
+
+    @staticmethod
+    def _create_engine(
+        connection_string: str,
+        pg_schema: Optional[str],
+        read_only: bool = True,
+        sqlite_fast_path: bool = False,
+        sqlite_immutable: bool = False,
+    ) -> Engine:
+        """Build a new engine.  Only called by the registry on a cache miss."""
+        if sqlite_fast_path and read_only and connection_string.lower().startswith("sqlite"):
+            connection_string = sqlite_fastpath.fast_url(connection_string, sqlite_immutable)
         # Snowflake needs a bigger pool for concurrent table processing
-        if self.is_snowflake:
-            self.engine = create_engine(
+        if "snowflake" in connection_string.lower():
+            engine = create_engine(
                 connection_string,
                 pool_size=10,
                 max_overflow=5,
                 pool_pre_ping=True,
             )
         else:
-            self.engine = create_engine(connection_string)
+            # Cached engines outlive a single run, so validate pooled
+            # connections before reuse
+            engine = create_engine(connection_string, pool_pre_ping=True)
+        SQLConnector._configure_engine(engine, pg_schema, read_only, sqlite_fast_path)
+        return engine
 
+    @staticmethod
+    def _configure_engine(
+        engine: Engine,
+        pg_schema: Optional[str],
+        read_only: bool = True,
+        sqlite_fast_path: bool = False,
+    ) -> None:
+        """Per-connection setup: search_path, read-only sessions, SQLite PRAGMAs."""
         # Set search_path after every new connection (works with Neon pooler)
-        if pg_schema and "postgresql" in connection_string:
-            @event.listens_for(self.engine, "connect")
+        if pg_schema and engine.dialect.name == "postgresql":
+            @event.listens_for(engine, "connect")
             def set_search_path(dbapi_conn, connection_record):
                 cursor = dbapi_conn.cursor()
                 cursor.execute(f"SET search_path TO {pg_schema}")
                 cursor.close()
 
-        self.inspector = inspect(self.engine)
-        self.metadata = MetaData(schema=pg_schema if pg_schema else None)
+        # Profiling never writes: make every session read-only (and low
+        # priority where the dialect has such a setting)
+        session_sql = SQLConnector._SESSION_SETTINGS.get(engine.dialect.name, []) if read_only else []
+        if session_sql:
+            @event.listens_for(engine, "connect")
+            def set_session_limits(dbapi_conn, connection_record):
+                SQLConnector._apply_session_settings(dbapi_conn, session_sql)
+
+        if sqlite_fast_path and engine.dialect.name == "sqlite":
+            @event.listens_for(engine, "connect")
+            def set_sqlite_pragmas(dbapi_conn, connection_record):
+                cursor = dbapi_conn.cursor()
+                for stmt in sqlite_fastpath.PRAGMAS:
+                    cursor.execute(stmt)
+                cursor.close()
+
+    @staticmethod
+    def _apply_session_settings(dbapi_conn, statements: List[str]) -> None:
+        """
+        Run session settings in autocommit.  Otherwise psycopg2 opens an
+        implicit transaction for them, and the pool's rollback when the
+        connection is first returned undoes the settings with it.
+        """
+        previous = getattr(dbapi_conn, "autocommit", None)
+        toggle = isinstance(previous, bool)  # not pymysql's method or sqlite3's -1
+        if toggle:
+            dbapi_conn.autocommit = True
+        try:
+            cursor = dbapi_conn.cursor()
+            for stmt in statements:
+                try:
+                    cursor.execute(stmt)
+                except Exception as e:
+                    logger.warning(f"Session setting '{stmt}' not applied: {e}")
+            cursor.close()
+        finally:
+            if toggle:
+                dbapi_conn.autocommit = previous
+
+    # Per-connection settings for read-only, low-priority profiling sessions
+    _SESSION_SETTINGS = {
+        "postgresql": ["SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"],
+        "mysql": ["SET SESSION TRANSACTION READ ONLY"],
+        "sqlite": ["PRAGMA query_only = ON"],
+        "mssql": ["SET DEADLOCK_PRIORITY LOW"],
+    }
 
     # Internal / system tables that should never be documented
     _SYSTEM_TABLES = {
@@ -84,6 +322,59 @@ class SQLConnector:
         Orchestrates the full extraction: Structure + Statistics.
         Returns the 'schema_raw' state object.
         """
+        run = self._plan_run()
+        ordered = run["ordered"]
+
+        process_pool = None
+        processes = self._sqlite_processes(len(ordered))
+        if processes > 1:
+            # spawn, not fork: the parent already runs threads
+            process_pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Profiling {len(ordered)} SQLite tables across {processes} processes.")
+
+        # Process tables in parallel (I/O-bound SQL queries benefit from threads),
+        # with one worker per connection the pool can hand out without waiting
+        if ordered:
+            schema_out = run["schema_out"]
+            run_deadline = run["run_deadline"]
+            max_w = min(len(ordered), pool_capacity(self.engine, self.max_workers))
+            pool = ThreadPoolExecutor(max_workers=max_w)
+            futures = {pool.submit(self._process_table, run, t, process_pool): t for t in ordered}
+            # Statement timeouts normally end every query by the deadline;
+            # the wait is still bounded for dialects that lack them
+            wait_s = run_deadline - time.monotonic() + self._RUN_GRACE_S if run_deadline else None
+            try:
+                for future in as_completed(futures, timeout=wait_s):
+                    t_name = futures[future]
+                    try:
+                        name, data = future.result()
+                        schema_out[name] = data
+                    except Exception as e:
+                        logger.error(f"Error processing table '{t_name}': {e}")
+                        self._keep_structure(run, t_name)
+            except FuturesTimeout:
+                for future, t_name in futures.items():
+                    if t_name not in schema_out:
+                        future.cancel()
+                        logger.warning(f"Run budget exhausted; '{t_name}' left unprofiled.")
+                        self._keep_structure(run, t_name)
+            finally:
+                # Don't wait on a query the database never cancelled
+                pool.shutdown(wait=False, cancel_futures=True)
+                if process_pool is not None:
+                    process_pool.shutdown(wait=False, cancel_futures=True)
+
+        return self._finish_run(run)
+
+    def _plan_run(self) -> Dict[str, Any]:
+        """
+        Everything before the first table scan: catalog, reused profiles,
+        the planner's strategies, watermarks and the LPT schedule.  Returns
+        the run state that ``_process_table`` and ``_finish_run`` work on;
+        ``run["ordered"]`` lists the tables left to profile.
+        """
         schema_out: Dict[str, TableSchema] = {}
         all_tables = self.inspector.get_table_names(schema=self.pg_schema)
         # Filter out database-engine internal / system tables
@@ -93,59 +384,712 @@ class SQLConnector:
 
         logger.info(f"Connected to DB. Found tables: {table_names} (filtered {len(all_tables) - len(table_names)} system tables)")
 
-        def _process_table(t_name: str) -> tuple[str, dict]:
-            """Process one table (structure + profiling).  Thread-safe."""
+        # Reflect every table's catalog up front so neither structure
+        # extraction nor profiling goes back to the catalog per table.
+        catalog = self._load_catalog(table_names)
+
+        # ── Incremental mode: reuse stored profiles for unchanged tables ──
+        fingerprints: Dict[str, Optional[str]] = {}
+        stored: Dict[str, Dict[str, Any]] = {}
+        if self.incremental:
+            fingerprints = self._table_fingerprints(catalog)
+            stored = self.store.load(self._source_key)
+
+        run_deadline = deadline_after(self.run_budget_s)
+
+        to_scan: List[str] = []
+        reused = 0
+        run_plan: Dict[str, Dict[str, Any]] = {}
+        for t_name in catalog:
+            fp = fingerprints.get(t_name)
+            prev = stored.get(t_name)
+            if fp is not None and prev and prev.get("fingerprint") == fp:
+                columns_meta, fk_list = self._extract_structure(t_name, catalog[t_name])
+                schema_out[t_name] = self._reuse_profile(prev["profile"], columns_meta, fk_list)
+                run_plan[t_name] = {
+                    "strategy": "reuse",
+                    "reason": "unchanged since the last run",
+                    "estimated_rows": schema_out[t_name]["row_count"],
+                    "estimate_source": None,
+                    "budgeted_rows": 0,
+                }
+                reused += 1
+            else:
+                to_scan.append(t_name)
+
+        # ── Planner: a strategy per table within the run's row budget ──
+        row_estimates: Dict[str, int] = {}
+        estimate_sources: Dict[str, str] = {}
+        catalog_entries: Dict[str, Dict[str, Any]] = {}
+        if to_scan:
+            row_estimates = self._catalog_row_estimates()
+            estimate_sources = {t: "catalog" for t in row_estimates}
+            explained = self._explain_row_estimates([t for t in to_scan if t not in row_estimates])
+            row_estimates.update(explained)
+            estimate_sources.update({t: "explain" for t in explained})
+            # Catalog stats are the metadata tier, and the fallback once
+            # the row budget runs out
+            if self.profile_mode == "metadata" or self.row_budget:
+                catalog_entries = self._catalog_entries(to_scan, catalog)
+        plans = plan_profiles(
+            to_scan,
+            row_estimates,
+            estimate_sources,
+            set(catalog_entries),
+            prefer_catalog=self.profile_mode == "metadata",
+            sample_threshold=self.sample_threshold,
+            sample_rows=self.sample_rows,
+            partition_threshold=self.partition_threshold,
+            row_budget=self.row_budget,
+        )
+        # ── Append-only tables: profile only rows past the watermark ──
+        appends: Dict[str, Dict[str, Any]] = {}
+        if self.watermark and to_scan:
+            stored_marks = self.store.load(self._source_key, section="watermarks")
+            for t_name in to_scan:
+                column = self._watermark_column(t_name, catalog[t_name])
+                if column is None:
+                    continue
+                sig = watermarks.signature(catalog[t_name]["columns"], self.distributions)
+                resume = watermarks.load_state(
+                    stored_marks.get(t_name), column, sig, self.sample_values, self.sample_max_bytes
+                )
+                appends[t_name] = {
+                    "column": column,
+                    "signature": sig,
+                    **(resume or {"low": None, "accumulators": None}),
+                }
+                reason = (
+                    f"append-only: rows past {column} = {appends[t_name]['low']}"
+                    if resume else f"append-only: first run profiles every row and stores the {column} watermark"
+                )
+                plans[t_name] = {**plans[t_name], "strategy": "watermark", "reason": reason, "budgeted_rows": 0}
+        run_plan.update(plans)
+
+        from_catalog = 0
+        for t_name, plan in plans.items():
+            if plan["strategy"] == "catalog":
+                schema_out[t_name] = catalog_entries[t_name]
+                from_catalog += 1
+            elif plan["strategy"] == "none":
+                schema_out[t_name] = self._structure_only(
+                    t_name, catalog[t_name], row_estimates.get(t_name)
+                )
+            else:
+                continue
+            to_scan.remove(t_name)
+        if self.profile_mode == "metadata":
+            logger.info(f"Metadata tier: {from_catalog} tables profiled from catalog statistics.")
+
+        # ── Size-aware scheduling: largest tables first (LPT order) ──
+        previous_timings = self.store.load(self._source_key, section="timings")
+        costs = estimate_costs(
+            to_scan,
+            row_estimates,
+            {t: len(catalog[t]["columns"]) for t in to_scan},
+            previous_timings,
+        )
+        ordered = lpt_order(costs)
+        schedule: Dict[str, Dict[str, Any]] = {
+            t: {
+                "table": t,
+                "order": i,
+                "estimated_cost_s": round(costs[t], 4) if costs[t] is not None else None,
+                "started_at": None,
+                "finished_at": None,
+                "duration_s": None,
+                "worker": None,
+            }
+            for i, t in enumerate(ordered)
+        }
+
+        return {
+            "schema_out": schema_out,
+            "catalog": catalog,
+            "fingerprints": fingerprints,
+            "run_deadline": run_deadline,
+            "to_scan": to_scan,
+            "reused": reused,
+            "from_catalog": from_catalog,
+            "run_plan": run_plan,
+            "plans": plans,
+            "row_estimates": row_estimates,
+            "appends": appends,
+            "stored": set(stored),
+            "ordered": ordered,
+            "schedule": schedule,
+        }
+
+    def _process_table(
+        self, run: Dict[str, Any], t_name: str, process_pool: Optional[ProcessPoolExecutor] = None
+    ) -> tuple[str, dict]:
+        """Process one table (structure + profiling).  Thread-safe."""
+        entry = run["catalog"][t_name]
+        row_estimate = run["row_estimates"].get(t_name)
+        run_deadline = run["run_deadline"]
+        started = time.perf_counter()
+        timing = run["schedule"][t_name]
+        timing["started_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        timing["worker"] = self._worker_name()
+        if run_deadline is not None and time.monotonic() >= run_deadline:
+            # The run's budget is spent: keep the table, unprofiled
+            return t_name, self._structure_only(t_name, entry, row_estimate)
+        deadline = earliest(deadline_after(self.table_timeout_s), run_deadline)
+        columns_meta, fk_list = self._extract_structure(t_name, entry)
+        profile_args = (
+            row_estimate, deadline,
+            run["plans"][t_name]["strategy"], self._indexed_columns(entry), run["appends"].get(t_name),
+        )
+        if process_pool is not None:
+            row_count, health_score, col_stats, info = self._profile_in_process(
+                process_pool, t_name, entry, columns_meta, profile_args
+            )
+        else:
             # Each thread gets its own MetaData to avoid shared-state issues
             local_meta = MetaData(schema=self.pg_schema if self.pg_schema else None)
-            table_obj = Table(t_name, local_meta, autoload_with=self.engine)
-            columns_meta, fk_list = self._extract_structure(t_name, table_obj)
-            row_count, health_score, col_stats = self._profile_data(table_obj, columns_meta)
+            table_obj = self._build_table(t_name, entry, local_meta)
+            row_count, health_score, col_stats, info = self._profile_data(
+                table_obj, columns_meta, *profile_args
+            )
+        for col_name, stats in col_stats.items():
+            if col_name in columns_meta:
+                columns_meta[col_name]["stats"] = stats
+        timing["finished_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        timing["duration_s"] = round(time.perf_counter() - started, 4)
+        return t_name, {
+            "table_name": t_name,
+            "row_count": row_count,
+            "columns": columns_meta,
+            "health_score": health_score,
+            "description": None,
+            "foreign_keys": fk_list,
+            **info,
+        }
+
+    @staticmethod
+    def _worker_name() -> str:
+        """Recorded per table in the schedule."""
+        return threading.current_thread().name
+
+    def _keep_structure(self, run: Dict[str, Any], t_name: str) -> None:
+        """Fall back to a structure-only entry rather than dropping the table."""
+        try:
+            run["schema_out"][t_name] = self._structure_only(
+                t_name, run["catalog"][t_name], run["row_estimates"].get(t_name)
+            )
+        except Exception as e:
+            logger.error(f"Could not extract structure of '{t_name}': {e}")
+
+    def _finish_run(self, run: Dict[str, Any]) -> Dict[str, TableSchema]:
+        """Attach plans and indexes, persist timings/watermarks/profiles, record stats."""
+        schema_out = run["schema_out"]
+        catalog = run["catalog"]
+        schedule = run["schedule"]
+        plans = run["plans"]
+        to_scan = run["to_scan"]
+        fingerprints = run["fingerprints"]
+
+        self.last_schedule = [schedule[t] for t in run["ordered"]]
+        finished = {t: s["duration_s"] for t, s in schedule.items() if s["duration_s"] is not None}
+        if finished:
+            self.store.save(self._source_key, finished, section="timings")
+
+        for t_name, plan in run["run_plan"].items():
+            if t_name in schema_out:
+                schema_out[t_name]["profile_plan"] = plan
+        for t_name, table_out in schema_out.items():
+            table_out["indexes"] = self._index_list(catalog[t_name])
+
+        if run["appends"]:
+            marks = {}
+            for t_name, append in run["appends"].items():
+                out = schema_out.get(t_name) or {}
+                accs = self.column_accumulators.get(t_name)
+                if out.get("profile_incomplete") or append.get("high") is None or not accs:
+                    continue
+                marks[t_name] = watermarks.dump_state(
+                    append["column"], append["high"], append["signature"], accs
+                )
+            self.store.save(self._source_key, marks, section="watermarks")
+
+        rescanned = sum(1 for t in to_scan if t in schema_out)
+        incomplete = [t for t in to_scan if schema_out.get(t, {}).get("profile_incomplete")]
+        self.last_run_stats = {
+            "tables_reused": run["reused"],
+            "tables_rescanned": rescanned,
+            "tables_from_catalog": run["from_catalog"],
+            "tables_incomplete": len(incomplete),
+            "tables_over_budget": sum(1 for p in plans.values() if p["strategy"] == "none"),
+            "rows_budgeted": sum(p["budgeted_rows"] for p in plans.values()),
+            "plan": run["run_plan"],
+            "schedule": self.last_schedule,
+            "governor": self.governor.stats(),
+        }
+        if self.incremental:
+            logger.info(
+                f"Incremental extraction: {self.last_run_stats['tables_reused']} reused, "
+                f"{self.last_run_stats['tables_rescanned']} re-scanned."
+            )
+            # Only tables profiled this run are written; reused entries stand
+            fresh = {t for t in catalog if run["run_plan"].get(t, {}).get("strategy") != "reuse"}
+            complete = {
+                t for t in fresh
+                if t in schema_out and fingerprints.get(t) is not None
+                and not schema_out[t].get("profile_incomplete")
+            }
+            self.store.save(self._source_key, {
+                t: {"fingerprint": fingerprints[t], "profile": schema_out[t]} for t in complete
+            })
+            # Partial profiles are never reused: those tables re-scan next run.
+            # Entries of dropped tables go too.
+            stale = (fresh - complete) | (run["stored"] - set(catalog))
+            self.store.delete(self._source_key, stale & run["stored"])
+
+        return schema_out
+
+    def _structure_only(
+        self, t_name: str, entry: Dict[str, Any], row_estimate: Optional[int]
+    ) -> Dict[str, Any]:
+        """
+        A table entry without profiling (budget spent or profiling failed):
+        structure, the catalog row estimate if any, and profile_incomplete.
+        """
+        columns_meta, fk_list = self._extract_structure(t_name, entry)
+        return {
+            "table_name": t_name,
+            "row_count": row_estimate or 0,
+            "columns": columns_meta,
+            "health_score": 100.0,
+            "description": None,
+            "foreign_keys": fk_list,
+            "profile_strategy": "none",
+            "row_count_estimated": row_estimate is not None,
+            "profile_incomplete": True,
+        }
+
+    @staticmethod
+    def _reuse_profile(
+        profile: Dict[str, Any], columns_meta: Dict[str, ColumnMetadata], fk_list: List[dict]
+    ) -> Dict[str, Any]:
+        """Graft a stored table profile onto freshly extracted structure."""
+        for col_name, meta in columns_meta.items():
+            prev_col = profile.get("columns", {}).get(col_name) or {}
+            meta["stats"] = prev_col.get("stats")
+        return {
+            "table_name": profile["table_name"],
+            "row_count": profile["row_count"],
+            "columns": columns_meta,
+            "health_score": profile["health_score"],
+            "description": None,
+            "foreign_keys": fk_list,
+            "profile_strategy": profile.get("profile_strategy", "full"),
+            "row_count_estimated": profile.get("row_count_estimated", False),
+            "profile_incomplete": profile.get("profile_incomplete", False),
+        }
+
+    def _catalog_row_estimates(self) -> Dict[str, int]:
+        """
+        Planner row estimates per table, read from the catalog without
+        scanning any table.  Empty when the dialect keeps none (or stats
+        were never gathered, e.g. SQLite before ``ANALYZE``).
+        """
+        dialect = self.engine.dialect.name
+        queries = {
+            "postgresql": (
+                "SELECT c.relname, c.reltuples FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = COALESCE(:schema, current_schema()) "
+                "AND c.relkind IN ('r', 'p')"
+            ),
+            "mysql": (
+                "SELECT table_name, table_rows FROM information_schema.tables "
+                "WHERE table_schema = COALESCE(:schema, DATABASE())"
+            ),
+            "snowflake": (
+                "SELECT table_name, row_count FROM information_schema.tables "
+                "WHERE table_schema = UPPER(COALESCE(:schema, CURRENT_SCHEMA()))"
+            ),
+        }
+        estimates: Dict[str, int] = {}
+        try:
+            with self.engine.connect() as conn:
+                if dialect in queries:
+                    rows = conn.execute(text(queries[dialect]), {"schema": self.pg_schema})
+                    for name, n in rows:
+                        # reltuples is -1 for never-analyzed tables
+                        if n is not None and n >= 0:
+                            key = name.lower() if dialect == "snowflake" else name
+                            estimates[key] = int(n)
+                elif dialect == "sqlite":
+                    has_stat = conn.execute(text(
+                        "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+                    )).first()
+                    if has_stat:
+                        for tbl, stat in conn.execute(text("SELECT tbl, stat FROM sqlite_stat1")):
+                            n = int(str(stat).split()[0])
+                            estimates[tbl] = max(estimates.get(tbl, 0), n)
+        except SQLAlchemyError as e:
+            logger.warning(f"Catalog row estimates unavailable: {e}")
+        return estimates
+
+    def _explain_row_estimates(self, table_names: List[str]) -> Dict[str, int]:
+        """
+        Row estimates from the query planner for tables the catalog has none
+        for (e.g. never-analyzed PostgreSQL tables, which the planner still
+        sizes from their page count).  One ``EXPLAIN`` per table, no scan.
+        PostgreSQL and MySQL only; SQLite's plans carry no row estimates.
+        """
+        dialect = self.engine.dialect.name
+        if dialect not in ("postgresql", "mysql") or not table_names:
+            return {}
+        quote = self.engine.dialect.identifier_preparer.quote
+        prefix = f"{quote(self.pg_schema)}." if self.pg_schema else ""
+        estimates: Dict[str, int] = {}
+        try:
+            with self.engine.connect() as conn:
+                for t_name in table_names:
+                    target = f"{prefix}{quote(t_name)}"
+                    if dialect == "postgresql":
+                        raw = conn.execute(text(f"EXPLAIN (FORMAT JSON) SELECT * FROM {target}")).scalar()
+                        plan = json.loads(raw) if isinstance(raw, str) else raw
+                        rows = plan[0]["Plan"]["Plan Rows"]
+                    else:
+                        raw = conn.execute(text(f"EXPLAIN FORMAT=JSON SELECT * FROM {target}")).scalar()
+                        rows = json.loads(raw)["query_block"]["table"]["rows_examined_per_scan"]
+                    estimates[t_name] = int(rows)
+        except (SQLAlchemyError, KeyError, IndexError, TypeError, ValueError) as e:
+            logger.warning(f"EXPLAIN row estimates unavailable: {e}")
+        return estimates
+
+    def _catalog_entries(
+        self, table_names: List[str], catalog: Dict[str, dict]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Table entries built from fresh planner statistics, for the tables that have them."""
+        catalog_stats = self._catalog_statistics()
+        entries: Dict[str, Dict[str, Any]] = {}
+        for t_name in table_names:
+            if t_name not in catalog_stats:
+                continue
+            columns_meta, fk_list = self._extract_structure(t_name, catalog[t_name])
+            col_stats = catalog_profile(
+                catalog_stats[t_name], columns_meta, self._is_numeric, _proportion_margin,
+                distributions=self.distributions,
+            )
+            if col_stats is None:
+                continue  # missing or stale stats -> scan
             for col_name, stats in col_stats.items():
-                if col_name in columns_meta:
-                    columns_meta[col_name]["stats"] = stats
-            return t_name, {
+                columns_meta[col_name]["stats"] = stats
+            entries[t_name] = {
                 "table_name": t_name,
-                "row_count": row_count,
+                "row_count": catalog_stats[t_name]["row_count"],
                 "columns": columns_meta,
-                "health_score": health_score,
+                "health_score": self._score_health(col_stats),
                 "description": None,
                 "foreign_keys": fk_list,
+                "profile_strategy": "catalog",
+                "row_count_estimated": True,
+                "profile_incomplete": False,
             }
+        return entries
 
-        # Process tables in parallel (I/O-bound SQL queries benefit from threads)
-        # Snowflake needs lower concurrency to avoid connection exhaustion
-        max_w = min(len(table_names), 4) if self.is_snowflake else min(len(table_names), 8)
-        with ThreadPoolExecutor(max_workers=max_w) as pool:
-            futures = {pool.submit(_process_table, t): t for t in table_names}
-            for future in as_completed(futures):
-                t_name = futures[future]
-                try:
-                    name, data = future.result()
-                    schema_out[name] = data
-                except Exception as e:
-                    logger.error(f"Error processing table '{t_name}': {e}")
+    def _catalog_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Planner statistics per table (PostgreSQL only — see catalog_stats)."""
+        if self.engine.dialect.name != "postgresql":
+            return {}
+        with self.engine.connect() as conn:
+            return load_pg_catalog_stats(conn, self.pg_schema, self.stats_stale_fraction)
 
-        return schema_out
+    def _profile_options(self) -> Dict[str, Any]:
+        """The settings that shape a table's profile, as resolved for this source."""
+        return {
+            "engine": self._profile_engine(),
+            "distinct": self._distinct_method(),
+            "distributions": self.distributions,
+            "profile_mode": self.profile_mode,
+            "stats_stale_fraction": self.stats_stale_fraction,
+            "sample_threshold": self.sample_threshold,
+            "sample_rows": self.sample_rows,
+            "sample_values": self.sample_values,
+            "sample_max_bytes": self.sample_max_bytes,
+            "partition_threshold": self.partition_threshold,
+            "partitions": self.partitions,
+            "row_budget": self.row_budget,
+        }
+
+    def _table_fingerprints(self, catalog: Dict[str, dict]) -> Dict[str, Optional[str]]:
+        """
+        Per-table change fingerprint: column names/types, a data-change
+        token from the engine, and the profiling options (a profile taken
+        without distributions, say, is not reused by a run that wants
+        them).  A table whose token cannot be determined gets ``None`` and
+        is always re-profiled — structure alone says nothing about whether
+        rows changed.
+
+        - PostgreSQL: ``pg_stat_user_tables`` insert/update/delete counters.
+        - SQLite: file mtime + size (including the WAL file).  Database
+          level, so any write re-profiles every table.  ``PRAGMA
+          data_version`` is not usable here: it is per-connection and does
+          not survive across runs.
+        """
+        dialect = self.engine.dialect.name
+        tokens: Dict[str, str] = {}
+        try:
+            if dialect == "postgresql":
+                with self.engine.connect() as conn:
+                    rows = conn.execute(
+                        text(
+                            "SELECT relname, n_tup_ins, n_tup_upd, n_tup_del "
+                            "FROM pg_stat_user_tables "
+                            "WHERE schemaname = COALESCE(:schema, current_schema())"
+                        ),
+                        {"schema": self.pg_schema},
+                    ).fetchall()
+                tokens = {r[0]: f"{r[1]}:{r[2]}:{r[3]}" for r in rows}
+            elif dialect == "sqlite":
+                db_path = sqlite_fastpath.database_path(self.engine.url)
+                if db_path and db_path != ":memory:" and os.path.exists(db_path):
+                    parts = []
+                    for p in (db_path, f"{db_path}-wal"):
+                        if os.path.exists(p):
+                            st = os.stat(p)
+                            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+                    token = "|".join(parts)
+                    tokens = {t: token for t in catalog}
+        except SQLAlchemyError as e:
+            logger.warning(f"Change counters unavailable ({e}); re-profiling all tables.")
+            tokens = {}
+
+        options = self._profile_options()
+        fingerprints: Dict[str, Optional[str]] = {}
+        for t_name, entry in catalog.items():
+            if t_name not in tokens:
+                fingerprints[t_name] = None
+                continue
+            structure = [(c["name"], str(c["type"])) for c in entry["columns"]]
+            raw = json.dumps([structure, tokens[t_name], options], sort_keys=True)
+            fingerprints[t_name] = hashlib.sha256(raw.encode()).hexdigest()
+        return fingerprints
+
+    def _load_catalog(self, table_names: List[str]) -> Dict[str, dict]:
+        """
+        Reflect columns, PKs, FKs and unique constraints for ALL tables.
+
+        With bulk reflection (the default) this uses SQLAlchemy 2.0's
+        ``get_multi_*`` inspector APIs, which dialects such as PostgreSQL
+        answer with one catalog query per object kind instead of one per
+        table.  Dialects without a bulk implementation fall back to
+        SQLAlchemy's own per-table loop, so the result shape is identical.
+
+        Returns ``{table_name: {"columns", "pk", "foreign_keys", "unique", "indexes"}}``.
+        """
+        if not table_names:
+            return {}
+        if not self.bulk_reflection:
+            return {t: self._reflect_table(t) for t in table_names}
+        if self.sqlite_fast_path and self.engine.dialect.name == "sqlite" and not self.pg_schema:
+            try:
+                with self.engine.connect() as conn:
+                    catalog = sqlite_fastpath.load_catalog(conn, self.engine.dialect, table_names)
+                logger.info(f"Bulk-reflected SQLite catalog for {len(catalog)} tables.")
+                return catalog
+            except SQLAlchemyError as e:
+                logger.warning(f"SQLite bulk catalog unavailable ({e}); using the inspector.")
+
+        kw = {"schema": self.pg_schema, "filter_names": table_names}
+        try:
+            columns = self.inspector.get_multi_columns(**kw)
+            pks = self.inspector.get_multi_pk_constraint(**kw)
+            fks = self.inspector.get_multi_foreign_keys(**kw)
+        except (NotImplementedError, SQLAlchemyError) as e:
+            logger.warning(f"Bulk reflection unavailable ({e}); reflecting per table.")
+            return {t: self._reflect_table(t) for t in table_names}
+        try:
+            uniques = self.inspector.get_multi_unique_constraints(**kw)
+        except (NotImplementedError, SQLAlchemyError):
+            uniques = {}  # Some dialects may not support this
+        try:
+            indexes = self.inspector.get_multi_indexes(**kw)
+        except (NotImplementedError, SQLAlchemyError):
+            indexes = {}  # e.g. Snowflake keeps no indexes
+
+        # get_multi_* results are keyed by (schema, table_name)
+        catalog: Dict[str, dict] = {}
+        for t_name in table_names:
+            key = (self.pg_schema, t_name)
+            if key not in columns:
+                logger.warning(f"Table '{t_name}' missing from catalog; skipping.")
+                continue
+            catalog[t_name] = {
+                "columns": columns[key],
+                "pk": pks.get(key) or {},
+                "foreign_keys": fks.get(key) or [],
+                "unique": uniques.get(key) or [],
+                "indexes": indexes.get(key) or [],
+            }
+        logger.info(f"Bulk-reflected catalog for {len(catalog)} tables.")
+        return catalog
+
+    def _reflect_table(self, table_name: str) -> dict:
+        """Per-table reflection — same shape as one ``_load_catalog`` entry."""
+        try:
+            unique = self.inspector.get_unique_constraints(table_name, schema=self.pg_schema)
+        except Exception:
+            unique = []  # Some dialects may not support this
+        try:
+            indexes = self.inspector.get_indexes(table_name, schema=self.pg_schema)
+        except Exception:
+            indexes = []
+        return {
+            "columns": self.inspector.get_columns(table_name, schema=self.pg_schema),
+            "pk": self.inspector.get_pk_constraint(table_name, schema=self.pg_schema),
+            "foreign_keys": self.inspector.get_foreign_keys(table_name, schema=self.pg_schema),
+            "unique": unique,
+            "indexes": indexes,
+        }
+
+    # SQLite files below this size profile faster on threads than after
+    # paying worker-process start-up
+    _SQLITE_PROCESS_MIN_BYTES = 64 * 1024 * 1024
+
+    def _sqlite_processes(self, table_count: int) -> int:
+        """Worker processes for profiling this run's tables (1 = threads only)."""
+        if not self.sqlite_fast_path or self.engine.dialect.name != "sqlite" or table_count < 2:
+            return 1
+        if self.sqlite_processes:
+            return max(1, min(self.sqlite_processes, table_count))
+        path = sqlite_fastpath.database_path(self.engine.url)
+        cpus = os.cpu_count() or 1
+        if cpus < 2 or not path or not os.path.exists(path):
+            return 1
+        if os.path.getsize(path) < self._SQLITE_PROCESS_MIN_BYTES:
+            return 1
+        return min(cpus, table_count)
+
+    def _profile_in_process(
+        self, process_pool, t_name: str, entry: dict, columns_meta: dict, profile_args: tuple
+    ):
+        """``_profile_data`` for one table in a worker process (see sqlite_fastpath)."""
+        options = {
+            "pg_schema": self.pg_schema,
+            "sample_threshold": self.sample_threshold,
+            "sample_rows": self.sample_rows,
+            "distinct_mode": self.distinct_mode,
+            "column_group_size": self.column_group_size,
+            "column_group_workers": self.column_group_workers,
+            "distributions": self.distributions,
+            "profile_engine": self.profile_engine,
+            "sample_values": self.sample_values,
+            "sample_max_bytes": self.sample_max_bytes,
+            "partition_threshold": self.partition_threshold,
+            "partitions": self.partitions,
+            "read_only": self.read_only,
+            "sqlite_fast_path": True,
+            "sqlite_immutable": self.sqlite_immutable,
+            "sqlite_processes": 1,
+        }
+        url = self.engine.url.render_as_string(hide_password=False)
+        future = process_pool.submit(
+            sqlite_fastpath.profile_in_process, url, options, t_name, entry, columns_meta, profile_args
+        )
+        result, accs, sketches, dists, append = future.result()
+        if accs is not None:
+            self.column_accumulators[t_name] = accs
+        if sketches is not None:
+            self.column_sketches[t_name] = sketches
+        if dists is not None:
+            self.column_distributions[t_name] = dists
+        if append is not None and profile_args[-1] is not None:
+            profile_args[-1].update(append)
+        return result
+
+    def _watermark_column(self, t_name: str, entry: dict) -> Optional[str]:
+        """
+        The table's watermark column: the configured one, else a single
+        integer primary key.  Must be NOT NULL — rows with a NULL watermark
+        would never be profiled.
+        """
+        columns = {c["name"]: c for c in entry["columns"]}
+        pk_cols = entry["pk"].get("constrained_columns") or []
+        column = self.watermark_columns.get(t_name)
+        if column is None:
+            if len(pk_cols) != 1 or "INT" not in str(columns[pk_cols[0]]["type"]).upper():
+                return None
+            column = pk_cols[0]
+        if column not in columns:
+            logger.warning(f"Watermark column '{column}' not found in '{t_name}'; profiling in full.")
+            return None
+        if column not in pk_cols and columns[column].get("nullable", True):
+            logger.warning(f"Watermark column '{t_name}.{column}' is nullable; profiling in full.")
+            return None
+        return column
+
+    @staticmethod
+    def _index_list(entry: dict) -> List[dict]:
+        """Reflected indexes as ``{"name", "columns", "unique"}`` for the data dictionary."""
+        out = []
+        for ix in entry.get("indexes") or []:
+            # Expression index members reflect as None column names
+            expressions = ix.get("expressions") or []
+            columns = [
+                c if c is not None else (expressions[i] if i < len(expressions) else "<expression>")
+                for i, c in enumerate(ix.get("column_names") or [])
+            ]
+            out.append({"name": ix.get("name"), "columns": columns, "unique": bool(ix.get("unique"))})
+        return out
+
+    @staticmethod
+    def _indexed_columns(entry: dict) -> Dict[str, str]:
+        """
+        Columns that lead a B-tree index (primary key, unique constraint or
+        plain index): ``"unique"`` when they alone are unique — distinct
+        count = non-null count — else ``"leading"``.
+        """
+        keys: List[tuple] = []
+        pk_cols = (entry.get("pk") or {}).get("constrained_columns") or []
+        if pk_cols:
+            keys.append((pk_cols, True))
+        keys += [(uc.get("column_names") or [], True) for uc in entry.get("unique") or []]
+        keys += [
+            (ix.get("column_names") or [], bool(ix.get("unique")))
+            for ix in entry.get("indexes") or []
+            # Partial indexes don't cover every row
+            if not (ix.get("dialect_options") or {}).get("postgresql_where")
+            and not (ix.get("dialect_options") or {}).get("sqlite_where")
+        ]
+        indexed: Dict[str, str] = {}
+        for cols, unique in keys:
+            if not cols or cols[0] is None:
+                continue
+            if unique and len(cols) == 1:
+                indexed[cols[0]] = "unique"
+            else:
+                indexed.setdefault(cols[0], "leading")
+        return indexed
+
+    @staticmethod
+    def _build_table(table_name: str, entry: dict, metadata: MetaData) -> Table:
+        """Build a ``Table`` for profiling from reflected columns (no autoload)."""
+        return Table(
+            table_name,
+            metadata,
+            *[Column(col["name"], col["type"]) for col in entry["columns"]],
+        )
 
     def _extract_structure(
-        self, table_name: str, table_obj: Table
+        self, table_name: str, entry: dict
     ) -> tuple[Dict[str, ColumnMetadata], List[dict]]:
         """Extracts names, types, constraints, and Foreign Keys."""
         cols_out = {}
 
-        columns = self.inspector.get_columns(table_name, schema=self.pg_schema)
-        pk_constraint = self.inspector.get_pk_constraint(table_name, schema=self.pg_schema)
-        pk_cols = pk_constraint.get("constrained_columns", [])
-        fks = self.inspector.get_foreign_keys(table_name, schema=self.pg_schema)
+        columns = entry["columns"]
+        pk_cols = entry["pk"].get("constrained_columns") or []
+        fks = entry["foreign_keys"]
 
         # Extract unique constraints
         unique_cols: set = set()
-        try:
-            for uc in self.inspector.get_unique_constraints(table_name, schema=self.pg_schema):
-                for col_name in uc.get("column_names", []):
-                    unique_cols.add(col_name)
-        except Exception:
-            pass  # Some dialects may not support this
+        for uc in entry["unique"]:
+            for col_name in uc.get("column_names", []):
+                unique_cols.add(col_name)
 
         fk_list = []
         fk_map = {}
@@ -187,110 +1131,1070 @@ class SQLConnector:
 
         return cols_out, fk_list
 
-    def _profile_data(self, table_obj: Table, cols_meta: Dict[str, ColumnMetadata]):
+    def _profile_data(
+        self,
+        table_obj: Table,
+        cols_meta: Dict[str, ColumnMetadata],
+        row_estimate: Optional[int] = None,
+        deadline: Optional[float] = None,
+        strategy: Optional[str] = None,
+        indexes: Optional[Dict[str, str]] = None,
+        append: Optional[Dict[str, Any]] = None,
+    ):
         """
-        Profile all columns in ONE batched SQL query per table instead of
-        3-4 queries per column.  This cuts total DB round-trips from
-        ~4*cols to just 2 per table (one aggregate + one sample).
+        Profile all columns with batched SQL aggregates instead of 3-4
+        queries per column.  Columns are split into groups (see
+        ``_column_group_size``) whose aggregate queries run concurrently on
+        separate pooled connections, so wide tables stay within dialect
+        expression limits; narrow tables still take one aggregate + one
+        sample query.  With the vectorized engine (``_profile_engine``), or
+        when client-side sketches are wanted (HyperLogLog distinct counts,
+        distributions), the aggregates, sketches and samples instead come
+        from one streamed scan profiled client-side: every row crosses the
+        wire, once.
+
+        Tables above ``sample_threshold`` rows are profiled from a sample
+        instead (see ``_sample_source``); their stats are scaled to the
+        full table and flagged ``is_estimate`` with the sample fraction, a
+        95% margin on the null percentage and a range for the distinct
+        count (see ``_estimate_distinct``).  Fully scanned tables above
+        ``partition_threshold`` rows are split into slices aggregated in
+        parallel and merged (see ``_partition_slices`` and
+        ``_run_partitioned_aggregates``).  A planned
+        ``strategy`` of "sample" (see planner) samples whatever the size.
+
+        ``indexes`` (see ``_indexed_columns``) routes indexed columns to
+        index-backed lookups: exact min/max by ``ORDER BY col LIMIT 1``,
+        distinct = non-null count for single-column unique keys, and a
+        capped loose index scan instead of ``COUNT(DISTINCT)`` for other
+        leading index columns.
+
+        With ``append`` (see watermarks) only rows past the stored watermark
+        are scanned, through the vectorized engine, and merged into the
+        stored accumulators; the table is neither counted nor sampled.
+
+        Every query is bounded by ``deadline`` (see timeouts).  When it
+        passes, whatever was gathered — the row count, column groups that
+        finished — is returned with ``profile_incomplete`` set.
+
+        Returns ``(row_count, health_score, stats, info)`` where ``info``
+        records the profile strategy and whether the row count is estimated.
         """
         stats_out: Dict[str, ColumnStats] = {}
         row_count = 0
         health_score = 100.0
+        info: Dict[str, Any] = {
+            "profile_strategy": "full", "row_count_estimated": False, "profile_incomplete": False,
+        }
 
         try:
-            with self.engine.connect() as conn:
-                # ── 1. Row count ────────────────────────────────────
-                count_query = select(func.count()).select_from(table_obj)
-                row_count = conn.execute(count_query).scalar() or 0
+            with self._connect(deadline) as conn:
+                source = table_obj
+                slices = None
+                sampling = False
+                if append is not None:
+                    # ── 1-2. Append-only: rows past the stored watermark ─
+                    # No COUNT(*): the merged accumulators give the row count
+                    source = self._append_source(conn, table_obj, append)
+                    if source is None:
+                        return 0, 100.0, {}, info
+                    info["profile_strategy"] = "watermark"
+                else:
+                    # ── 1. Row count ────────────────────────────────────
+                    # Above the sampling threshold the catalog estimate stands in
+                    # for COUNT(*), which would itself be a full scan.
+                    threshold = self.sample_threshold
+                    sampling = strategy == "sample" or (
+                        threshold is not None and (row_estimate or 0) > threshold
+                    )
+                    if sampling and row_estimate is not None:
+                        row_count = int(row_estimate)
+                        info["row_count_estimated"] = True
+                    else:
+                        count_query = select(func.count()).select_from(table_obj)
+                        row_count = conn.execute(count_query).scalar() or 0
+                        sampling = sampling or (threshold is not None and row_count > threshold)
 
-                if row_count == 0:
-                    return 0, 100.0, {}
+                    if row_count == 0:
+                        return 0, 100.0, {}, info
 
-                # ── 2. Build ONE aggregation query for ALL columns ──
-                agg_exprs = []
-                col_order: List[str] = []  # tracks column names in query order
-                numeric_flags: List[bool] = []
+                    # ── 2. Pick the scan source: whole table, a sample, or slices ─
+                    if sampling:
+                        source, method = self._sample_source(conn, table_obj, cols_meta, row_count, deadline)
+                        info["profile_strategy"] = "sample"
+                        info["sample_method"] = method
+                    elif self.partition_threshold and row_count > self.partition_threshold:
+                        slices, method = self._partition_slices(conn, table_obj, cols_meta, deadline)
+                        if slices:
+                            info["profile_strategy"] = "partitioned"
+                            info["partition_method"] = method
+                            info["partitions"] = len(slices)
 
-                for col_name, meta in cols_meta.items():
-                    col_obj = table_obj.c[col_name]
-                    col_order.append(col_name)
+                # ── 2b. Index-backed lookups (exact, whatever the source) ─
+                distinct = self._distinct_method()
+                # Appends merge through the vectorized engine's accumulators.
+                # Client-side sketches (HyperLogLog, distributions) need every
+                # row on the client anyway, so one streamed scan builds them
+                # along with the aggregates instead of a second pass
+                vectorized = (
+                    append is not None
+                    or self._profile_engine() == "vectorized"
+                    or distinct == "hll"
+                    or self.distributions
+                )
+                indexes = indexes or {}
+                loose = distinct == "exact" and not vectorized
+                index_ranges, index_distinct = self._index_lookups(
+                    conn, table_obj, cols_meta, indexes, loose
+                )
 
-                    # null count  &  unique count (always)
-                    agg_exprs.append(
-                        func.sum(case((col_obj == None, 1), else_=0)).label(f"{col_name}__nulls")
+            # ── 3. Aggregates: SQL per column group (and slice), or one vectorized scan
+            known_distinct = {c for c, kind in indexes.items() if kind == "unique"} | set(index_distinct)
+
+            def _aggregate(src):
+                if slices is not None and vectorized:
+                    accs = self._run_partitioned(slices, cols_meta, distinct, deadline)
+                    numeric = {c for c, a in accs.items() if a.numeric}
+                    return aggregate_mapping(accs), numeric, accs, False
+                if slices is not None:
+                    agg, numeric, incomplete = self._run_partitioned_aggregates(
+                        slices, table_obj, cols_meta, distinct, deadline,
+                        known_distinct=known_distinct, known_range=set(index_ranges),
                     )
-                    agg_exprs.append(
-                        func.count(func.distinct(col_obj)).label(f"{col_name}__uniq")
+                    return agg, numeric, {}, incomplete
+                if vectorized:
+                    accs = self._run_vectorized(src, cols_meta, distinct, deadline)
+                    if append is not None:
+                        info["rows_appended"] = next(iter(accs.values())).rows if accs else 0
+                        for c, base in (append["accumulators"] or {}).items():
+                            if c in accs:
+                                accs[c] = base.merge(accs[c])
+                    numeric = {c for c, a in accs.items() if a.numeric}
+                    return aggregate_mapping(accs), numeric, accs, False
+                agg, numeric, incomplete = self._run_aggregates(
+                    src, cols_meta, distinct, deadline,
+                    known_distinct=known_distinct, known_range=set(index_ranges),
+                )
+                return agg, numeric, {}, incomplete
+
+            if append is None:
+                # Rows about to be scanned, against the source's rows/s budget
+                self.governor.charge_rows(min(row_count, self.sample_rows) if sampling else row_count)
+            agg, numeric_cols, accs, incomplete = _aggregate(source)
+            if append is not None:
+                self.governor.charge_rows(info.get("rows_appended", 0))
+                row_count = int(agg["__rows"] or 0)
+                if row_count == 0:
+                    return 0, 100.0, {}, info
+
+            # Rows actually aggregated: the sample size when sampling
+            scanned = int(agg["__rows"] or 0) if sampling else row_count
+            if sampling and scanned == 0:
+                # Block sampling can miss every block on sparse tables
+                logger.warning(f"Empty sample for '{table_obj.name}'; profiling first rows.")
+                source = self._first_rows_source(table_obj)
+                info["sample_method"] = "first_rows"
+                agg, numeric_cols, accs, incomplete = _aggregate(source)
+                scanned = max(int(agg["__rows"] or 0), 1)
+            fraction = min(scanned / row_count, 1.0)
+
+            col_order = list(cols_meta)
+            sketches: Dict[str, HyperLogLog] = {}
+            dists: Dict[str, ColumnDistribution] = {}
+            samples_by_col: Dict[str, List[str]] = {}
+            frequencies: Dict[str, Tuple[int, int]] = {}
+            if incomplete:
+                # Out of time: unpack the column groups that finished
+                info["profile_incomplete"] = True
+                logger.warning(f"Time budget hit profiling '{table_obj.name}'; keeping partial stats.")
+            elif vectorized:
+                # The scan already produced sketches and samples
+                self.column_accumulators[table_obj.name] = accs
+                sketches = {c: a.hll for c, a in accs.items()}
+                dists = {c: a.distribution for c, a in accs.items()}
+                if distinct == "hll":
+                    self.column_sketches[table_obj.name] = sketches
+                if self.distributions:
+                    self.column_distributions[table_obj.name] = dists
+            else:
+                # ── 4. Non-null example values for every column ─
+                with self._connect(deadline) as conn:
+                    samples_by_col = self._sample_values(conn, source, cols_meta)
+                    if sampling:
+                        # Value frequencies in the sample, to extrapolate distinct counts
+                        estimated = {
+                            c: m for c, m in cols_meta.items()
+                            if indexes.get(c) != "unique" and c not in index_distinct
+                        }
+                        if estimated:
+                            frequencies = self._value_frequencies(conn, source, estimated)
+
+            # ── 5. Unpack results ───────────────────────────────
+            for col_name in col_order:
+                if f"{col_name}__nulls" not in agg:
+                    continue  # its column group timed out
+                null_count = int(agg[f"{col_name}__nulls"] or 0)
+                col_distinct = accs[col_name].distinct_method if vectorized else distinct
+                if indexes.get(col_name) == "unique":
+                    # Unique key: every non-null value is distinct
+                    unique_count = scanned - null_count
+                    col_distinct = "exact"
+                elif f"{col_name}__uniq" in agg:
+                    unique_count = int(agg[f"{col_name}__uniq"] or 0)
+                else:
+                    unique_count = index_distinct[col_name]
+                margin = 0.0
+                bounds = None
+                if sampling:
+                    margin = _proportion_margin(null_count, scanned, row_count)
+                    freqs = accs[col_name].frequency_counts if vectorized else frequencies.get(col_name)
+                    unique_count, bounds = _estimate_distinct(
+                        unique_count, scanned - null_count, scanned, row_count, freqs
                     )
+                    null_count = round(null_count / scanned * row_count)
+                if col_name in index_distinct:
+                    unique_count = index_distinct[col_name]  # whole table, not the sample
+                    bounds = None
+                null_percentage = round((null_count / row_count) * 100, 2)
+                unique_percentage = round((unique_count / row_count) * 100, 2)
+
+                # reservoir samples (vectorized) or the per-column sample query
+                if vectorized:
+                    samples = accs[col_name].samples
+                else:
+                    samples = samples_by_col.get(col_name, [])
+
+                col_stat: ColumnStats = {
+                    "null_count": null_count,
+                    "null_percentage": null_percentage,
+                    "unique_count": unique_count,
+                    "unique_percentage": unique_percentage,
+                    "sample_values": samples,
+                    "min_value": None,
+                    "max_value": None,
+                    "mean_value": None,
+                    "is_estimate": sampling or col_distinct != "exact",
+                    "sample_fraction": round(fraction, 6),
+                    "null_percentage_margin": round(margin, 2),
+                    "unique_count_bounds": bounds,
+                    "distinct_method": col_distinct,
+                    "quantiles": None,
+                    "histogram": None,
+                    "top_values": None,
+                    "length_stats": None,
+                }
+                if self.distributions and dists.get(col_name) is not None:
+                    col_stat.update(dists[col_name].summary(scale=row_count / scanned))
+
+                if col_name in numeric_cols:
+                    try:
+                        if col_name in index_ranges:
+                            min_v, max_v = index_ranges[col_name]
+                        else:
+                            min_v = agg[f"{col_name}__min"]
+                            max_v = agg[f"{col_name}__max"]
+                        avg_v = agg[f"{col_name}__avg"]
+                        col_stat["min_value"] = float(min_v) if min_v is not None else None
+                        col_stat["max_value"] = float(max_v) if max_v is not None else None
+                        col_stat["mean_value"] = round(float(avg_v), 4) if avg_v is not None else None
+                    except Exception:
+                        pass  # leave numeric stats empty on error
+
+                stats_out[col_name] = col_stat
+
+            health_score = self._score_health(stats_out)
+
+        except (SQLAlchemyError, ProfileTimeout) as e:
+            if not is_timeout(e, deadline):
+                logger.error(f"Profiling error: {e}")
+                # Stats are partial or missing: say so rather than pass them as complete
+                info["profile_incomplete"] = True
+                return row_count, self._score_health(stats_out), stats_out, info
+            logger.warning(f"Time budget hit profiling '{table_obj.name}': {e}")
+            info["profile_incomplete"] = True
+            return row_count, self._score_health(stats_out), stats_out, info
+
+        return row_count, health_score, stats_out, info
+
+    @contextmanager
+    def _connect(self, deadline: Optional[float] = None):
+        """
+        A pooled connection for profiling, gated by a semaphore sized to the
+        pool's capacity and by the source's governor: threads queue here
+        (without a timeout) rather than inside the pool, where waiting past
+        pool_timeout raises.  Callers
+        never hold one of these while waiting on another.  Statements on it
+        are cancelled by the server once ``deadline`` passes.
+        """
+        with self._query_slots, self.governor.slot():
+            with self.engine.connect() as conn:
+                with statement_timeout(conn, deadline):
+                    yield conn
+
+    # Dialects whose indexes are ordered B-trees that answer ORDER BY ... LIMIT 1
+    _BTREE_DIALECTS = {"postgresql", "sqlite", "mysql", "mssql"}
+    # Dialects that run the recursive-CTE loose index scan with index seeks
+    _LOOSE_SCAN_DIALECTS = {"postgresql", "sqlite"}
+    # Index seeks a loose scan may take before falling back to COUNT(DISTINCT);
+    # past this the column is not low-cardinality enough to profit
+    _LOOSE_SCAN_MAX_STEPS = 1_000
+
+    def _index_lookups(
+        self,
+        conn,
+        table_obj: Table,
+        cols_meta: Dict[str, ColumnMetadata],
+        indexes: Dict[str, str],
+        loose: bool,
+    ) -> tuple[Dict[str, tuple], Dict[str, int]]:
+        """
+        Exact stats read from indexes instead of the scan: ``(ranges,
+        distinct)``.  ``ranges`` maps indexed numeric columns to ``(min,
+        max)`` from one index seek at each end; with ``loose``, ``distinct``
+        maps non-unique leading index columns to their distinct count from a
+        loose index scan (one seek per distinct value), for columns that
+        turn out to have at most ``_LOOSE_SCAN_MAX_STEPS`` values.
+        """
+        dialect = self.engine.dialect.name
+        ranges: Dict[str, tuple] = {}
+        distinct: Dict[str, int] = {}
+        if dialect not in self._BTREE_DIALECTS:
+            return ranges, distinct
+
+        for col_name, kind in indexes.items():
+            if col_name not in cols_meta:
+                continue
+            col = table_obj.c[col_name]
+            if self._is_numeric(cols_meta[col_name]["original_type"]):
+                base = select(col).where(col.isnot(None)).limit(1)
+                lo = conn.execute(base.order_by(col.asc())).scalar()
+                hi = conn.execute(base.order_by(col.desc())).scalar()
+                ranges[col_name] = (lo, hi)
+            if loose and kind == "leading" and dialect in self._LOOSE_SCAN_DIALECTS:
+                n = self._loose_distinct(conn, table_obj, col_name)
+                if n is not None:
+                    distinct[col_name] = n
+        return ranges, distinct
+
+    def _loose_distinct(self, conn, table_obj: Table, col_name: str) -> Optional[int]:
+        """
+        Distinct count of an indexed column by skipping from each value to
+        the next (``MIN(col) WHERE col > previous``), or None once it takes
+        more than ``_LOOSE_SCAN_MAX_STEPS`` seeks.
+        """
+        preparer = self.engine.dialect.identifier_preparer
+        tbl = preparer.format_table(table_obj)
+        col = preparer.quote(col_name)
+        query = text(
+            f"WITH RECURSIVE loose(v, n) AS ("
+            f" SELECT MIN({col}), 1 FROM {tbl}"
+            f" UNION ALL"
+            f" SELECT (SELECT MIN({col}) FROM {tbl} WHERE {col} > loose.v), n + 1"
+            f" FROM loose WHERE loose.v IS NOT NULL AND n <= :cap"
+            f") SELECT COUNT(v), COUNT(*) FROM loose"
+        )
+        found, steps = conn.execute(query, {"cap": self._LOOSE_SCAN_MAX_STEPS}).one()
+        # A run that ends on a non-NULL value was cut off by the cap
+        return None if found == steps else int(found)
+
+    # Max select-list expressions per dialect (PostgreSQL's target list is
+    # capped at 1664 entries; SQLite's SQLITE_MAX_COLUMN defaults to 2000)
+    _MAX_SELECT_EXPRESSIONS = {
+        "postgresql": 1664, "sqlite": 2000, "mysql": 4096, "mssql": 4096,
+    }
+    # Each column contributes at most 5 aggregates (nulls, distinct, min, max, avg)
+    _EXPRS_PER_COLUMN = 5
+
+    def _column_group_size(self) -> int:
+        """Columns per aggregate query: the configured size, capped by the dialect."""
+        limit = self._MAX_SELECT_EXPRESSIONS.get(self.engine.dialect.name, 1000)
+        return max(1, min(self.column_group_size, (limit - 1) // self._EXPRS_PER_COLUMN))
+
+    def _run_aggregates(
+        self,
+        source,
+        cols_meta: Dict[str, ColumnMetadata],
+        distinct: str,
+        deadline: Optional[float] = None,
+        known_distinct: Optional[set] = None,
+        known_range: Optional[set] = None,
+    ):
+        """
+        Run the profiling aggregates over ``source`` in column groups, in
+        parallel on separate connections, and merge the result rows into one
+        mapping keyed by aggregate label.  Groups cancelled by ``deadline``
+        are left out.  Columns in ``known_distinct`` / ``known_range`` were
+        already answered from an index and skip those aggregates.
+        Returns ``(mapping, numeric_cols, incomplete)``; raises
+        ProfileTimeout if no group finished.
+        """
+        names = list(cols_meta)
+        size = self._column_group_size()
+        groups = [names[i:i + size] for i in range(0, len(names), size)] or [[]]
+
+        def _run(group: List[str]):
+            exprs, numeric = self._aggregate_exprs(
+                source, {c: cols_meta[c] for c in group}, distinct, known_distinct, known_range
+            )
+            try:
+                with self._connect(deadline) as conn:
+                    row = conn.execute(select(*exprs).select_from(source)).fetchone()
+            except (SQLAlchemyError, ProfileTimeout) as e:
+                if not is_timeout(e, deadline):
+                    raise
+                return None
+            return dict(row._mapping), numeric
+
+        if len(groups) == 1 or self.column_group_workers <= 1:
+            # Inline on the calling thread, which may be an asyncio engine's
+            # greenlet (AsyncSQLConnector): a worker thread would not be
+            results = [_run(g) for g in groups]
+        else:
+            workers = min(len(groups), self.column_group_workers)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_run, groups))
+
+        finished = [r for r in results if r is not None]
+        if not finished:
+            raise ProfileTimeout("no column group finished")
+        merged: Dict[str, Any] = {}
+        numeric_cols: set = set()
+        for row, numeric in finished:
+            merged.update(row)
+            numeric_cols |= numeric
+        return merged, numeric_cols, len(finished) < len(results)
 
-                    # min / max / avg for numeric columns
-                    type_str = meta["original_type"].upper()
-                    is_numeric = any(
-                        t in type_str
-                        for t in ["INT", "FLOAT", "DECIMAL", "NUMERIC", "REAL",
-                                  "NUMBER", "DOUBLE", "BIGINT", "SMALLINT",
-                                  "TINYINT", "BYTEINT"]
+    @staticmethod
+    def _score_health(stats: Dict[str, ColumnStats]) -> float:
+        """100 minus penalties for negative IDs and heavily-null columns."""
+        health_score = 100.0
+        for col_name, st in stats.items():
+            min_v = st.get("min_value")
+            if min_v is not None and min_v < 0 and "ID" in col_name.upper():
+                health_score -= 5
+            if st["null_percentage"] > 10.0:
+                health_score -= 2.5
+            if st["null_percentage"] > 50.0:
+                health_score -= 5.0
+        return max(0.0, health_score)
+
+    @staticmethod
+    def _is_numeric(type_str: str) -> bool:
+        type_str = type_str.upper()
+        return any(
+            t in type_str
+            for t in ["INT", "FLOAT", "DECIMAL", "NUMERIC", "REAL",
+                      "NUMBER", "DOUBLE", "BIGINT", "SMALLINT",
+                      "TINYINT", "BYTEINT"]
+        )
+
+    def _aggregate_exprs(
+        self,
+        source,
+        cols_meta: Dict[str, ColumnMetadata],
+        distinct: str = "exact",
+        known_distinct: Optional[set] = None,
+        known_range: Optional[set] = None,
+    ):
+        """
+        Aggregate expressions for one batched profiling query over ``source``
+        (a table or a sample subquery).  Slot 0 is COUNT(*); each column then
+        contributes ``<col>__nulls`` and, unless distinct counting happens
+        client-side (``distinct="hll"``) or from an index
+        (``known_distinct``), ``<col>__uniq`` — plus ``__avg`` when numeric,
+        and ``__min``/``__max`` unless in ``known_range``.
+
+        Returns ``(exprs, numeric_column_names)``.
+        """
+        agg_exprs = [func.count().label("__rows")]
+        numeric_cols: set = set()
+        known_distinct = known_distinct or set()
+        known_range = known_range or set()
+
+        for col_name, meta in cols_meta.items():
+            col_obj = source.c[col_name]
+
+            # null count  &  unique count
+            agg_exprs.append(
+                func.sum(case((col_obj == None, 1), else_=0)).label(f"{col_name}__nulls")
+            )
+            if col_name not in known_distinct and distinct != "hll":
+                agg_exprs.append(self._distinct_expr(col_obj, meta, distinct))
+
+            # min / max / avg for numeric columns
+            if self._is_numeric(meta["original_type"]):
+                numeric_cols.add(col_name)
+                if col_name not in known_range:
+                    agg_exprs.append(func.min(col_obj).label(f"{col_name}__min"))
+                    agg_exprs.append(func.max(col_obj).label(f"{col_name}__max"))
+                agg_exprs.append(func.avg(col_obj).label(f"{col_name}__avg"))
+
+        return agg_exprs, numeric_cols
+
+    def _distinct_expr(self, col_obj, meta: ColumnMetadata, distinct: str):
+        """``<col>__uniq``: COUNT(DISTINCT) or, for "native", APPROX_COUNT_DISTINCT."""
+        value = self._hash_large_object(col_obj, meta["original_type"])
+        if distinct == "native":
+            return func.approx_count_distinct(value).label(f"{col_obj.name}__uniq")
+        return func.count(func.distinct(value)).label(f"{col_obj.name}__uniq")
+
+    def _partial_exprs(self, source, cols_meta: Dict[str, ColumnMetadata], known_range: set):
+        """
+        Aggregates over one slice that merge exactly across disjoint slices:
+        COUNT(*), null counts, and for numeric columns MIN/MAX (unless in
+        ``known_range``), SUM and COUNT(col) — the mean is their ratio.
+        """
+        exprs = [func.count().label("__rows")]
+        for col_name, meta in cols_meta.items():
+            col_obj = source.c[col_name]
+            exprs.append(func.sum(case((col_obj == None, 1), else_=0)).label(f"{col_name}__nulls"))
+            if self._is_numeric(meta["original_type"]):
+                if col_name not in known_range:
+                    exprs.append(func.min(col_obj).label(f"{col_name}__min"))
+                    exprs.append(func.max(col_obj).label(f"{col_name}__max"))
+                exprs.append(func.sum(col_obj).label(f"{col_name}__sum"))
+                exprs.append(func.count(col_obj).label(f"{col_name}__n"))
+        return exprs
+
+    # Dialects with a built-in APPROX_COUNT_DISTINCT aggregate
+    _NATIVE_APPROX_DISTINCT = {"snowflake", "mssql", "oracle", "bigquery"}
+    # Dialects with a server-side MD5() usable to shrink large values
+    _SERVER_MD5 = {"postgresql", "mysql", "snowflake"}
+    _LARGE_OBJECT_TYPES = ("TEXT", "CLOB", "BLOB", "BYTEA", "BINARY", "JSON", "XML", "VARIANT")
+    # Rows fetched per round trip by streaming profiling passes
+    _STREAM_BATCH = 10_000
+    # Dialects where the vectorized engine beats SQL aggregates; measured
+    # with data/scripts/bench_profilers.py.  None so far: on SQLite the
+    # aggregates win (1.96s vs 2.93s at 200k rows)
+    _VECTORIZED_DIALECTS: set = set()
+
+    def _distinct_method(self) -> str:
+        """How unique counts are computed: "exact", "native" or "hll"."""
+        if self.distinct_mode != "approx":
+            return "exact"
+        if self.engine.dialect.name in self._NATIVE_APPROX_DISTINCT:
+            return "native"
+        return "hll"
+
+    def _hashes_large_objects(self, type_str: str) -> bool:
+        return self.engine.dialect.name in self._SERVER_MD5 and self._is_large_object(type_str)
+
+    def _hash_large_object(self, col_obj, type_str: str):
+        """
+        MD5 large-object columns server-side so only digests are compared or
+        shipped — for distinct counting only; never a value shown to anyone.
+        Non-binary values are cast to text first: PostgreSQL has no md5()
+        for json, jsonb or xml.
+        """
+        if not self._hashes_large_objects(type_str):
+            return col_obj
+        return func.md5(col_obj if self._is_binary(type_str) else cast(col_obj, Text))
+
+    def _large_object_length(self, col_obj, type_str: str):
+        """Server-side LENGTH() of a large object (PostgreSQL has none for jsonb)."""
+        return func.length(col_obj if self._is_binary(type_str) else cast(col_obj, Text))
+
+    def _large_object_sample(self, col_obj, type_str: str):
+        """What a digested column's example values are drawn from, capped server-side."""
+        if self._is_binary(type_str):
+            return func.concat("<binary, ", func.length(col_obj), " bytes>")
+        return func.substr(cast(col_obj, Text), 1, self.sample_max_bytes + 1)
+
+    def _is_large_object(self, type_str: str) -> bool:
+        return any(t in type_str.upper() for t in self._LARGE_OBJECT_TYPES)
+
+    def _is_binary(self, type_str: str) -> bool:
+        return any(t in type_str.upper() for t in self._BINARY_TYPES)
+
+    def _stream_column(self, col_obj, type_str: str):
+        """
+        A column as streamed: large objects as digests where the server has
+        MD5(), and JSON / ARRAY values as their text, as the SQL engine's
+        samples show them, instead of the dicts and lists the driver
+        would decode them into.
+        """
+        if self._hashes_large_objects(type_str):
+            return self._hash_large_object(col_obj, type_str)
+        if isinstance(col_obj.type, (sqltypes.JSON, sqltypes.ARRAY)):
+            return cast(col_obj, Text)
+        return col_obj
+
+    def _stream_query(
+        self,
+        source,
+        cols_meta: Dict[str, ColumnMetadata],
+        lengths: bool = False,
+        samples: bool = False,
+    ):
+        """
+        The streamed SELECT shared by client-side passes: one field per
+        column (large objects as server-side digests), then — with
+        ``lengths`` — a LENGTH() per large-object column, then — with
+        ``samples`` — the truncated value of each digested column.
+        Returns ``(query, {column: length index}, {column: sample index})``.
+        """
+        exprs = [
+            self._stream_column(source.c[c], meta["original_type"]).label(c)
+            for c, meta in cols_meta.items()
+        ]
+        length_idx: Dict[str, int] = {}
+        if lengths:
+            for c, meta in cols_meta.items():
+                if self._is_large_object(meta["original_type"]):
+                    length_idx[c] = len(exprs)
+                    exprs.append(
+                        self._large_object_length(source.c[c], meta["original_type"]).label(f"{c}__len")
                     )
-                    numeric_flags.append(is_numeric)
-                    if is_numeric:
-                        agg_exprs.append(func.min(col_obj).label(f"{col_name}__min"))
-                        agg_exprs.append(func.max(col_obj).label(f"{col_name}__max"))
-                        agg_exprs.append(func.avg(col_obj).label(f"{col_name}__avg"))
-
-                agg_query = select(*agg_exprs).select_from(table_obj)
-                agg_row = conn.execute(agg_query).fetchone()
-
-                # ── 3. ONE sample query — grab first 3 non-null rows ─
-                sample_query = select(*[table_obj.c[c] for c in col_order]).limit(3)
-                sample_rows = conn.execute(sample_query).fetchall()
-
-                # ── 4. Unpack results ───────────────────────────────
-                idx = 0  # cursor into agg_row
-                for i, col_name in enumerate(col_order):
-                    null_count = int(agg_row[idx] or 0); idx += 1
-                    unique_count = int(agg_row[idx] or 0); idx += 1
-                    null_percentage = round((null_count / row_count) * 100, 2)
-                    unique_percentage = round((unique_count / row_count) * 100, 2)
-
-                    # samples from the batch sample query
-                    samples = [
-                        str(row[i]) for row in sample_rows
-                        if row[i] is not None
-                    ][:3]
-
-                    col_stat: ColumnStats = {
-                        "null_count": null_count,
-                        "null_percentage": null_percentage,
-                        "unique_count": unique_count,
-                        "unique_percentage": unique_percentage,
-                        "sample_values": samples,
-                        "min_value": None,
-                        "max_value": None,
-                        "mean_value": None,
-                    }
+        sample_idx: Dict[str, int] = {}
+        if samples:
+            for c, meta in cols_meta.items():
+                if self._hashes_large_objects(meta["original_type"]):
+                    sample_idx[c] = len(exprs)
+                    exprs.append(
+                        self._large_object_sample(source.c[c], meta["original_type"]).label(f"{c}__sample")
+                    )
+        query = select(*exprs).select_from(source).execution_options(
+            stream_results=True, yield_per=self._STREAM_BATCH
+        )
+        return query, length_idx, sample_idx
 
-                    if numeric_flags[i]:
-                        try:
-                            min_v = agg_row[idx]; idx += 1
-                            max_v = agg_row[idx]; idx += 1
-                            avg_v = agg_row[idx]; idx += 1
-                            col_stat["min_value"] = float(min_v) if min_v is not None else None
-                            col_stat["max_value"] = float(max_v) if max_v is not None else None
-                            col_stat["mean_value"] = round(float(avg_v), 4) if avg_v is not None else None
-                            if min_v is not None and min_v < 0 and "ID" in col_name.upper():
-                                health_score -= 5
-                        except Exception:
-                            idx += 3  # skip the 3 numeric slots on error
-
-                    stats_out[col_name] = col_stat
-
-                    if null_percentage > 10.0:
-                        health_score -= 2.5
-                    if null_percentage > 50.0:
-                        health_score -= 5.0
+    def _run_vectorized(
+        self,
+        source,
+        cols_meta: Dict[str, ColumnMetadata],
+        distinct: str = "exact",
+        deadline: Optional[float] = None,
+    ) -> Dict[str, ColumnAccumulator]:
+        """
+        The vectorized engine: one streamed scan of ``source`` folded into a
+        ColumnAccumulator per column (see vectorized_profiler).  Distinct
+        counts are exact up to a cap unless approximate counting was asked for.
+        """
+        query, length_idx, sample_idx = self._stream_query(
+            source, cols_meta, lengths=self.distributions, samples=True
+        )
+        numeric = {c for c, m in cols_meta.items() if self._is_numeric(m["original_type"])}
+        with self._connect(deadline) as conn:
+            return profile_batches(
+                conn.execute(query).partitions(),
+                list(cols_meta),
+                numeric,
+                length_columns=length_idx,
+                distributions=self.distributions,
+                exact_distinct=distinct == "exact",
+                sample_size=self.sample_values,
+                sample_max_bytes=self.sample_max_bytes,
+                sample_columns=sample_idx,
+                run=self._offload,
+            )
 
-        except SQLAlchemyError as e:
-            logger.error(f"Profiling error: {e}")
-            return row_count, health_score, stats_out
+    @staticmethod
+    def _offload(fn, *args):
+        """
+        Run CPU-bound profiling work (folding batches into accumulators and
+        sketches).  Inline here: the caller is already a worker thread;
+        AsyncSQLConnector moves it off the event loop.
+        """
+        return fn(*args)
+
+    def _profile_engine(self) -> str:
+        """"sql" (batched aggregates) or "vectorized" (client-side scan)."""
+        if self.profile_engine != "auto":
+            return self.profile_engine
+        return "vectorized" if self.engine.dialect.name in self._VECTORIZED_DIALECTS else "sql"
+
+    _BINARY_TYPES = ("BLOB", "BYTEA", "BINARY", "IMAGE", "RAW")
+    # Per-column branches per UNION ALL (SQLite caps compound selects at 500)
+    _SAMPLE_BRANCHES = 100
+
+    def _sample_values(self, conn, source, cols_meta: Dict[str, ColumnMetadata]) -> Dict[str, List[str]]:
+        """
+        Up to ``sample_values`` non-null example values per column.
+
+        Each column gets its own ``WHERE col IS NOT NULL LIMIT n`` branch, so
+        sparse columns still find values, and the branches are combined with
+        UNION ALL into a few queries per table.  Values are cast to text
+        server-side with a length cap, so wide TEXT values are truncated
+        before they cross the wire; binary columns ship only their length.
+        """
+        cap = self.sample_max_bytes
+        branches = []
+        binary = set()
+        for c, meta in cols_meta.items():
+            col = source.c[c]
+            if any(t in meta["original_type"].upper() for t in self._BINARY_TYPES):
+                binary.add(c)
+                value = func.length(col)
+            else:
+                value = col
+            inner = select(value.label("v")).where(col.isnot(None)).limit(self.sample_values).subquery()
+            branches.append(
+                select(literal(c).label("col"), cast(inner.c.v, String(cap + 1)).label("v"))
+            )
+
+        out: Dict[str, List[str]] = {c: [] for c in cols_meta}
+        for i in range(0, len(branches), self._SAMPLE_BRANCHES):
+            chunk = branches[i:i + self._SAMPLE_BRANCHES]
+            query = chunk[0] if len(chunk) == 1 else union_all(*chunk)
+            for col_name, v in conn.execute(query):
+                if v is None:
+                    continue
+                out[col_name].append(
+                    f"<binary, {v} bytes>" if col_name in binary else render_sample(v, cap)
+                )
+        return out
+
+    def _value_frequencies(
+        self, conn, source, cols_meta: Dict[str, ColumnMetadata]
+    ) -> Dict[str, Tuple[int, int]]:
+        """
+        ``(f1, f2)`` per column of a sample: how many values occur in it
+        exactly once and exactly twice (see ``_estimate_distinct``).  One
+        GROUP BY branch per column, combined with UNION ALL like
+        ``_sample_values``; large objects are grouped by digest.
+        """
+        branches = []
+        for c, meta in cols_meta.items():
+            col = source.c[c]
+            value = self._hash_large_object(col, meta["original_type"])
+            inner = select(func.count().label("n")).where(col.isnot(None)).group_by(value).subquery()
+            branches.append(select(
+                literal(c).label("col"),
+                func.sum(case((inner.c.n == 1, 1), else_=0)).label("f1"),
+                func.sum(case((inner.c.n == 2, 1), else_=0)).label("f2"),
+            ))
+
+        out: Dict[str, Tuple[int, int]] = {}
+        for i in range(0, len(branches), self._SAMPLE_BRANCHES):
+            chunk = branches[i:i + self._SAMPLE_BRANCHES]
+            query = chunk[0] if len(chunk) == 1 else union_all(*chunk)
+            for col_name, f1, f2 in conn.execute(query):
+                out[col_name] = (int(f1 or 0), int(f2 or 0))
+        return out
+
+    # Extra seconds the run waits past its budget for cancelled queries to return
+    _RUN_GRACE_S = 5.0
+
+    # Random-key sampling draws this many key ranges, one per stratum
+    _SAMPLE_BLOCKS = 16
+
+    def _sample_source(
+        self,
+        conn,
+        table_obj: Table,
+        cols_meta: Dict[str, ColumnMetadata],
+        row_count: int,
+        deadline: Optional[float] = None,
+    ):
+        """
+        A selectable over roughly ``sample_rows`` rows of the table.
+
+        - PostgreSQL: ``TABLESAMPLE SYSTEM`` (reads only the sampled pages).
+        - Snowflake:  ``TABLESAMPLE BERNOULLI``.
+        - Elsewhere:  random-key sampling — the key space of a single integer
+          PK (or SQLite's rowid) is split into strata and one random key
+          range is read from each, so only sampled ranges are touched.
+        - No usable key: the first ``sample_rows`` rows (biased, but cheap).
+
+        Returns ``(selectable, method)``.
+        """
+        fraction = min(1.0, self.sample_rows / row_count)
+        pct = literal_column(f"{fraction * 100:.6f}")
+        # A fixed seed (REPEATABLE) makes every column group see the same rows
+        seed = literal_column(str(random.randint(1, 2**31 - 1)))
+        dialect = self.engine.dialect.name
+        if dialect == "postgresql":
+            sample = tablesample(table_obj, func.system(pct), name="profile_sample", seed=seed)
+            return sample, "tablesample_system"
+        if dialect == "snowflake":
+            sample = tablesample(table_obj, func.bernoulli(pct), name="profile_sample", seed=seed)
+            return sample, "tablesample_bernoulli"
+
+        key = self._range_key(table_obj, cols_meta)
+        if key is None:
+            return self._first_rows_source(table_obj), "first_rows"
+
+        try:
+            lo, hi = conn.execute(select(func.min(key), func.max(key)).select_from(table_obj)).one()
+        except SQLAlchemyError:
+            rollback(conn, deadline)
+            return self._first_rows_source(table_obj), "first_rows"
+        if lo is None:
+            return self._first_rows_source(table_obj), "first_rows"
+
+        lo, hi = int(lo), int(hi)
+        blocks = self._SAMPLE_BLOCKS
+        stratum = max((hi - lo + 1) // blocks, 1)
+        width = max(int(stratum * fraction), 1)
+        ranges = []
+        for i in range(blocks):
+            s_lo = lo + i * stratum
+            if s_lo > hi:
+                break
+            start = s_lo + random.randint(0, max(stratum - width, 0))
+            ranges.append(key.between(start, start + width - 1))
+        query = select(*table_obj.c).where(or_(*ranges))
+        return query.subquery("profile_sample"), "random_key_ranges"
+
+    def _range_key(self, table_obj: Table, cols_meta: Dict[str, ColumnMetadata]):
+        """A single integer PK column (or SQLite's rowid) to split by range, else None."""
+        pk_cols = [c for c, m in cols_meta.items() if "PK" in m["tags"]]
+        if len(pk_cols) == 1 and "INT" in cols_meta[pk_cols[0]]["original_type"].upper():
+            return table_obj.c[pk_cols[0]]
+        if self.engine.dialect.name == "sqlite":
+            return literal_column("rowid")
+        return None
+
+    # PostgreSQL leaf partitions of a (possibly multi-level) partitioned table
+    _PG_LEAF_PARTITIONS = """
+    SELECT c.relname, n.nspname
+    FROM pg_partition_tree(CAST(:qualified AS regclass)) t
+    JOIN pg_class c ON c.oid = t.relid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE t.isleaf
+    """
+
+    def _partition_slices(
+        self, conn, table_obj: Table, cols_meta: Dict[str, ColumnMetadata], deadline: Optional[float] = None
+    ):
+        """
+        Disjoint slices covering the table, for intra-table parallelism.
+
+        - PostgreSQL declarative partitions: one slice per leaf partition.
+        - Otherwise: ``partitions`` equal-width ranges over a single integer
+          PK (or SQLite's rowid).
+
+        Returns ``(slices, method)``, or ``(None, None)`` when the table
+        cannot be split.
+        """
+        if self.engine.dialect.name == "postgresql":
+            qualified = conn.dialect.identifier_preparer.format_table(table_obj)
+            try:
+                leaves = conn.execute(text(self._PG_LEAF_PARTITIONS), {"qualified": qualified}).all()
+            except SQLAlchemyError:
+                rollback(conn, deadline)
+                leaves = []
+            if len(leaves) > 1:
+                slices = [
+                    sql_table(name, *[sql_column(c) for c in cols_meta], schema=schema)
+                    for name, schema in leaves
+                ]
+                return slices, "native_partitions"
+
+        key = self._range_key(table_obj, cols_meta)
+        if key is None:
+            return None, None
+        try:
+            lo, hi = conn.execute(select(func.min(key), func.max(key)).select_from(table_obj)).one()
+        except SQLAlchemyError:
+            rollback(conn, deadline)
+            return None, None
+        if lo is None or hi - lo < self.partitions:
+            return None, None
+        step = (hi - lo + 1) / self.partitions
+        bounds = [lo + round(i * step) for i in range(self.partitions)] + [hi + 1]
+        slices = [
+            select(*table_obj.c)
+            .where(key >= bounds[i], key < bounds[i + 1])
+            .subquery(f"profile_slice_{i}")
+            for i in range(self.partitions)
+        ]
+        return slices, "key_ranges"
+
+    def _run_partitioned(
+        self,
+        slices,
+        cols_meta: Dict[str, ColumnMetadata],
+        distinct: str,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, ColumnAccumulator]:
+        """
+        Profile each slice concurrently on its own connection with the
+        vectorized engine, then merge the accumulators — for runs that
+        stream anyway (the vectorized engine, HyperLogLog, distributions).
+        Counts, min/max, sums and distinct-hash sets / HyperLogLogs all
+        merge exactly across disjoint slices.
+        """
+        workers = min(len(slices), self.partitions)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(
+                lambda s: self._run_vectorized(s, cols_meta, distinct, deadline), slices
+            ))
+        merged = parts[0]
+        for part in parts[1:]:
+            for c, acc in part.items():
+                merged[c].merge(acc)
+        return merged
+
+    def _run_partitioned_aggregates(
+        self,
+        slices,
+        table_obj: Table,
+        cols_meta: Dict[str, ColumnMetadata],
+        distinct: str,
+        deadline: Optional[float] = None,
+        known_distinct: Optional[set] = None,
+        known_range: Optional[set] = None,
+    ):
+        """
+        Server-side aggregates per slice and column group, concurrently on
+        separate connections, merged into the mapping ``_run_aggregates``
+        returns.  Counts, null counts, MIN/MAX and SUM/COUNT merge exactly
+        across disjoint slices; distinct counts do not, so COUNT(DISTINCT)
+        (or APPROX_COUNT_DISTINCT) runs once per column group over the whole
+        table, alongside the slices.  A column group is kept only if all its
+        queries finished.  Returns ``(mapping, numeric_cols, incomplete)``;
+        raises ProfileTimeout if no group finished.
+        """
+        known_distinct = known_distinct or set()
+        known_range = known_range or set()
+        names = list(cols_meta)
+        size = self._column_group_size()
+        groups = [names[i:i + size] for i in range(0, len(names), size)] or [[]]
+
+        tasks = []  # (group index, query)
+        for g, group in enumerate(groups):
+            group_meta = {c: cols_meta[c] for c in group}
+            for part in slices:
+                tasks.append((g, select(*self._partial_exprs(part, group_meta, known_range)).select_from(part)))
+            uniq = [
+                self._distinct_expr(table_obj.c[c], cols_meta[c], distinct)
+                for c in group if c not in known_distinct and distinct != "hll"
+            ]
+            # Spread over as many queries as there are slices, so the
+            # whole-table scans for distinct counts run in parallel too
+            for i in range(min(len(uniq), len(slices))):
+                tasks.append((g, select(*uniq[i::len(slices)]).select_from(table_obj)))
+
+        def _run(task):
+            try:
+                with self._connect(deadline) as conn:
+                    return dict(conn.execute(task[1]).fetchone()._mapping)
+            except (SQLAlchemyError, ProfileTimeout) as e:
+                if not is_timeout(e, deadline):
+                    raise
+                return None
+
+        workers = min(len(tasks), self.partitions)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run, tasks))
+
+        rows_by_group: Dict[int, List[Dict[str, Any]]] = {g: [] for g in range(len(groups))}
+        failed = set()
+        for (g, _), row in zip(tasks, results):
+            if row is None:
+                failed.add(g)
+            else:
+                rows_by_group[g].append(row)
+        finished = [g for g in range(len(groups)) if g not in failed]
+        if not finished:
+            raise ProfileTimeout("no column group finished")
+
+        merged: Dict[str, Any] = {}
+        numeric_cols: set = set()
+        for g in finished:
+            rows = rows_by_group[g]
+            parts = [r for r in rows if "__rows" in r]
+            merged["__rows"] = sum(int(r["__rows"] or 0) for r in parts)
+            for r in rows:
+                if "__rows" not in r:
+                    merged.update(r)  # whole-table distinct counts
+            for c in groups[g]:
+                merged[f"{c}__nulls"] = sum(int(r[f"{c}__nulls"] or 0) for r in parts)
+                if not self._is_numeric(cols_meta[c]["original_type"]):
+                    continue
+                numeric_cols.add(c)
+                if c not in known_range:
+                    mins = [r[f"{c}__min"] for r in parts if r[f"{c}__min"] is not None]
+                    maxs = [r[f"{c}__max"] for r in parts if r[f"{c}__max"] is not None]
+                    merged[f"{c}__min"] = min(mins) if mins else None
+                    merged[f"{c}__max"] = max(maxs) if maxs else None
+                n = sum(int(r[f"{c}__n"] or 0) for r in parts)
+                total = sum(float(r[f"{c}__sum"]) for r in parts if r[f"{c}__sum"] is not None)
+                merged[f"{c}__avg"] = total / n if n else None
+        return merged, numeric_cols, len(finished) < len(groups)
+
+    def _append_source(self, conn, table_obj: Table, append: Dict[str, Any]):
+        """
+        Rows past ``append["low"]`` up to the current maximum of the
+        watermark column, which is recorded as ``append["high"]`` so rows
+        appended mid-run are picked up next time.  Without usable stored
+        state (no ``low``, or the maximum went backwards) the whole table up
+        to the maximum is profiled from scratch.  None for an empty table.
+        """
+        col = table_obj.c[append["column"]]
+        high = conn.execute(select(func.max(col))).scalar()
+        append["high"] = high
+        if high is None:
+            return None
+        low = append.get("low")
+        if low is not None and high < low:
+            logger.warning(
+                f"Watermark of '{table_obj.name}' went backwards; re-profiling it in full."
+            )
+            low = append["low"] = None
+            append["accumulators"] = None
+        bounds = col <= high if low is None else (col > low) & (col <= high)
+        return select(*table_obj.c).where(bounds).subquery("profile_append")
+
+    def _first_rows_source(self, table_obj: Table):
+        return select(*table_obj.c).limit(self.sample_rows).subquery("profile_sample")
+
+
+def _proportion_margin(k: int, n: int, population: int) -> float:
+    """
+    Half-width (in percentage points) of the 95% Wilson interval for a
+    proportion k/n measured on a sample of n out of ``population`` rows,
+    with finite-population correction.  Wilson stays informative at
+    k = 0 or k = n, where the normal approximation collapses to zero.
+    """
+    if n <= 0:
+        return 100.0
+    z = 1.96
+    p = k / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    fpc = math.sqrt(max(population - n, 0) / max(population - 1, 1))
+    lower, upper = centre - half * fpc, centre + half * fpc
+    return max(p - lower, upper - p) * 100
+
+
+def _estimate_distinct(
+    distinct: int,
+    non_null: int,
+    scanned: int,
+    population: int,
+    frequencies: Optional[Tuple[int, int]] = None,
+) -> Tuple[int, List[int]]:
+    """
+    Extrapolate a sample's distinct count to the full table.  ``distinct``
+    values were seen among ``non_null`` non-null values of ``scanned``
+    rows sampled from ``population``; ``frequencies`` is ``(f1, f2)``, how
+    many of them occur in the sample exactly once and exactly twice.
 
-        return row_count, max(0.0, health_score), stats_out
+    Returns ``(estimate, [low, high])``.  ``low`` is the values seen;
+    ``high`` is GEE's upper bracket, every sample singleton standing for
+    ``population / scanned`` values (Charikar et al., 2000).  The estimate
+    is Chao1 for sampling without replacement (Chao & Lin, 2012), clamped
+    to that range.  Without frequencies (HyperLogLog counts) only key-like
+    columns — nearly every sampled value distinct — are scaled, and the
+    range is everything up to the table's non-null rows.
+    """
+    if non_null <= 0 or scanned >= population:
+        return distinct, [distinct, distinct]
+    q = scanned / population
+    ceiling = max(round(non_null / q), distinct)  # non-null rows in the table
+    if frequencies is None:
+        estimate = distinct
+        if distinct >= 0.95 * non_null:
+            estimate = min(round(distinct / q), ceiling)
+        return estimate, [distinct, ceiling]
+    f1 = min(frequencies[0], distinct)
+    f2 = min(frequencies[1], distinct - f1)
+    if f1 == 0:
+        return distinct, [distinct, distinct]
+    high = min(round(distinct + f1 * (1 / q - 1)), ceiling)
+    pairs = 2 * f2 * non_null / (non_null - 1) if f2 else 0.0
+    unseen = f1 * f1 / (pairs + f1 * q / (1 - q))
+    return min(max(round(distinct + unseen), distinct), high), [distinct, high]
@@ -0,0 +1,133 @@
+"""
+Profiling time budgets — deadlines enforced as database statement timeouts.
+
+A deadline is an absolute ``time.monotonic()`` value.  ``statement_timeout``
+bounds every statement on a connection by the time left until it, using
+the dialect's own mechanism so the server actually cancels the query:
+
+- PostgreSQL: ``SET LOCAL statement_timeout`` (reverts with the transaction,
+              so callers that roll back use ``rollback`` to set it again).
+- MySQL:      ``SET SESSION max_execution_time`` (SELECTs only), reset after.
+- Snowflake:  ``ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS``, unset after.
+- SQLite:     a watchdog timer calling ``sqlite3.Connection.interrupt()``
+              (not available through aiosqlite).
+- Others:     no server-side timeout; the deadline is still checked before
+              each query, and the run-level wait is bounded by the caller.
+"""
+import math
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+# Substrings of driver errors raised when a statement is cancelled on timeout
+_TIMEOUT_MESSAGES = (
+    "canceling statement due to statement timeout",  # PostgreSQL
+    "maximum statement execution time exceeded",     # MySQL max_execution_time
+    "interrupted",                                   # SQLite interrupt()
+    "statement or warehouse timeout",                # Snowflake
+)
+# SQLSTATE of a cancelled PostgreSQL query (query_canceled); its message is
+# translated under a non-English lc_messages
+_PG_QUERY_CANCELED = "57014"
+
+
+class ProfileTimeout(Exception):
+    """A profiling deadline passed before (or while) a query could run."""
+
+
+def deadline_after(budget_s: Optional[float]) -> Optional[float]:
+    """Deadline ``budget_s`` seconds from now (None/0 = no deadline)."""
+    return time.monotonic() + budget_s if budget_s else None
+
+
+def earliest(*deadlines: Optional[float]) -> Optional[float]:
+    """The earliest of the given deadlines, ignoring None."""
+    known = [d for d in deadlines if d is not None]
+    return min(known) if known else None
+
+
+def is_timeout(exc: BaseException, deadline: Optional[float]) -> bool:
+    """
+    Whether ``exc`` is a cancelled-by-deadline error rather than a real
+    failure: a ProfileTimeout, or the dialect's own cancellation error.
+    Any other error is a failure, even one raised after the deadline.
+    """
+    if isinstance(exc, ProfileTimeout):
+        return True
+    if deadline is None:
+        return False
+    orig = getattr(exc, "orig", None)
+    # psycopg2 names the SQLSTATE pgcode, psycopg 3 sqlstate
+    if _PG_QUERY_CANCELED in (getattr(orig, "pgcode", None), getattr(orig, "sqlstate", None)):
+        return True
+    message = str(exc).lower()
+    return any(m in message for m in _TIMEOUT_MESSAGES)
+
+
+def rollback(conn, deadline: Optional[float]) -> None:
+    """
+    Roll back after a failed statement inside ``statement_timeout`` and
+    keep the connection bounded by ``deadline``: PostgreSQL's ``SET LOCAL``
+    ends with the transaction, so it is set again.  Session-level timeouts
+    and SQLite's watchdog outlive the rollback.
+    """
+    conn.rollback()
+    if deadline is None or conn.engine.dialect.name != "postgresql":
+        return
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise ProfileTimeout("time budget exhausted")
+    _set_local_timeout(conn, left)
+
+
+def _set_local_timeout(conn, left: float) -> None:
+    conn.execute(text(f"SET LOCAL statement_timeout = {max(int(left * 1000), 1)}"))
+
+
+@contextmanager
+def statement_timeout(conn, deadline: Optional[float]):
+    """Bound statements run on ``conn`` inside this block by ``deadline``."""
+    if deadline is None:
+        yield conn
+        return
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise ProfileTimeout("time budget exhausted")
+
+    dialect = conn.engine.dialect.name
+    ms = max(int(left * 1000), 1)
+    reset = None
+    timer = None
+    if dialect == "postgresql":
+        _set_local_timeout(conn, left)
+    elif dialect == "mysql":
+        conn.execute(text(f"SET SESSION max_execution_time = {ms}"))
+        reset = "SET SESSION max_execution_time = 0"
+    elif dialect == "snowflake":
+        conn.execute(text(f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {math.ceil(left)}"))
+        reset = "ALTER SESSION UNSET STATEMENT_TIMEOUT_IN_SECONDS"
+    elif dialect == "sqlite":
+        # aiosqlite's adapted connection has no interrupt(): deadline checks only
+        interrupt = getattr(conn.connection.dbapi_connection, "interrupt", None)
+        if interrupt is not None:
+            timer = threading.Timer(left, interrupt)
+            timer.daemon = True
+            timer.start()
+
+    try:
+        yield conn
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if reset is not None:
+            try:
+                conn.execute(text(reset))
+            except SQLAlchemyError as e:
+                logger.warning(f"Could not reset statement timeout: {e}")
@@ -0,0 +1,317 @@
+"""
+Vectorized client-side profiler — the alternative to SQL aggregates.
+
+Instead of asking the database for ``SUM(CASE ...)`` / ``COUNT(DISTINCT)``
+per column, the table is read once through a server-side cursor in
+fixed-size batches; each batch becomes a pandas DataFrame and every column
+is folded into a ``ColumnAccumulator`` with vectorized operations.  Memory
+stays bounded by the batch size plus the sketches, whatever the table size.
+
+It is opt-in (``profile_engine="vectorized"``): ``"auto"`` picks it only
+for dialects listed in ``SQLConnector._VECTORIZED_DIALECTS``, and
+``data/scripts/bench_profilers.py`` has not shown a win for any dialect yet.
+
+Accumulators are mergeable and serializable, so slices of one table
+(partitions, key ranges, later appends) can be profiled independently and
+combined.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend.connectors.sketches import HyperLogLog, ColumnDistribution, hash_values, render_sample
+
+# Distinct values are counted exactly (as a set of 64-bit hashes) up to
+# this many; beyond it the accumulator switches to its HyperLogLog
+EXACT_DISTINCT_LIMIT = 200_000
+
+
+class ColumnAccumulator:
+    """Mergeable running profile of one column."""
+
+    def __init__(
+        self,
+        numeric: bool,
+        distributions: bool = False,
+        exact_distinct: bool = True,
+        sample_size: int = 3,
+        sample_max_bytes: int = 256,
+    ):
+        self.numeric = numeric
+        self.rows = 0
+        self.nulls = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sum = 0.0
+        self.numeric_count = 0
+        self.hll = HyperLogLog()
+        # Exact distinct hashes until EXACT_DISTINCT_LIMIT, then None, with
+        # how often each was seen (sampled distinct counts are extrapolated
+        # from them).  New batches queue in _pending and are folded in once
+        # they outgrow the set, so the sort cost stays amortized O(n log n).
+        self._distinct: Optional[np.ndarray] = (
+            np.empty(0, dtype=np.uint64) if exact_distinct else None
+        )
+        self._counts = np.empty(0, dtype=np.int64)
+        self._pending: List[Tuple[np.ndarray, Optional[np.ndarray]]] = []
+        self._pending_size = 0
+        # Reservoir (algorithm R) of rendered non-null values.  A fixed seed
+        # keeps samples stable across runs over unchanged data.
+        self.sample_size = sample_size
+        self.sample_max_bytes = sample_max_bytes
+        self.samples: List[str] = []
+        self.non_null_seen = 0
+        self._rng = np.random.default_rng(0)
+        self.distribution = ColumnDistribution(numeric) if distributions else None
+
+    def add(
+        self,
+        series: pd.Series,
+        lengths: Optional[pd.Series] = None,
+        sample_source: Optional[pd.Series] = None,
+    ) -> None:
+        """
+        Fold one batch of values (and optional server-side lengths).  When
+        ``series`` holds digests, ``sample_source`` holds the (truncated)
+        values that example values are drawn from.
+        """
+        self.rows += len(series)
+        mask = series.isna().to_numpy()
+        self.nulls += int(mask.sum())
+        values = series[~mask]
+        if values.empty:
+            return
+
+        hashes = hash_values(values.tolist())
+        self.hll.add_hashes(hashes)
+        self._add_distinct(hashes)
+
+        if self.numeric:
+            nums = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            nums = nums[~np.isnan(nums)]
+            if nums.size:
+                lo, hi = float(nums.min()), float(nums.max())
+                self.min = lo if self.min is None else min(self.min, lo)
+                self.max = hi if self.max is None else max(self.max, hi)
+                self.sum += float(nums.sum())
+                self.numeric_count += int(nums.size)
+
+        self._sample(values if sample_source is None else sample_source[~mask])
+
+        if self.distribution is not None:
+            if lengths is not None:
+                self.distribution.add_lengths(lengths[~mask].tolist())
+            else:
+                self.distribution.add_values(values.tolist())
+
+    def _sample(self, values: pd.Series) -> None:
+        k, seen, m = self.sample_size, self.non_null_seen, len(values)
+        self.non_null_seen += m
+        fill = max(min(k - len(self.samples), m), 0)
+        for v in values.iloc[:fill]:
+            self.samples.append(render_sample(v, self.sample_max_bytes))
+        if fill == m:
+            return
+        # Item i (0-based overall) replaces a random slot with probability k / (i + 1)
+        positions = np.arange(seen + fill, seen + m) + 1
+        slots = self._rng.integers(0, positions)
+        for offset in np.flatnonzero(slots < k):
+            self.samples[slots[offset]] = render_sample(values.iloc[fill + offset], self.sample_max_bytes)
+
+    def _add_distinct(self, hashes: np.ndarray, counts: Optional[np.ndarray] = None) -> None:
+        """Queue hashes, each seen once or ``counts`` times."""
+        if self._distinct is None:
+            return
+        self._pending.append((hashes, counts))
+        self._pending_size += hashes.size
+        if self._pending_size > max(self._distinct.size, EXACT_DISTINCT_LIMIT // 4):
+            self._fold_pending()
+
+    def _fold_pending(self) -> None:
+        if self._distinct is None or not self._pending:
+            return
+        hashes = np.concatenate([self._distinct, *(h for h, _ in self._pending)])
+        counts = np.concatenate([
+            self._counts,
+            *(np.ones(h.size, dtype=np.int64) if c is None else c for h, c in self._pending),
+        ])
+        self._pending, self._pending_size = [], 0
+        merged, inverse = np.unique(hashes, return_inverse=True)
+        if merged.size > EXACT_DISTINCT_LIMIT:
+            self._distinct, self._counts = None, np.empty(0, dtype=np.int64)
+            return
+        self._distinct = merged
+        self._counts = np.bincount(inverse, weights=counts, minlength=merged.size).astype(np.int64)
+
+    @property
+    def distinct_hashes(self) -> Optional[np.ndarray]:
+        """Sorted distinct value hashes, or None once past the exact limit."""
+        self._fold_pending()
+        return self._distinct
+
+    @property
+    def frequency_counts(self) -> Optional[Tuple[int, int]]:
+        """
+        ``(f1, f2)``: how many values were seen exactly once and exactly
+        twice, or None once past the exact limit.
+        """
+        if self.distinct_hashes is None:
+            return None
+        return int((self._counts == 1).sum()), int((self._counts == 2).sum())
+
+    @property
+    def distinct_method(self) -> str:
+        return "exact" if self.distinct_hashes is not None else "hll"
+
+    def distinct(self) -> int:
+        hashes = self.distinct_hashes
+        if hashes is not None:
+            return int(hashes.size)
+        return self.hll.count()
+
+    def mean(self) -> Optional[float]:
+        return self.sum / self.numeric_count if self.numeric_count else None
+
+    def merge(self, other: "ColumnAccumulator") -> "ColumnAccumulator":
+        self.rows += other.rows
+        self.nulls += other.nulls
+        for attr, pick in (("min", min), ("max", max)):
+            ours, theirs = getattr(self, attr), getattr(other, attr)
+            setattr(self, attr, theirs if ours is None else ours if theirs is None else pick(ours, theirs))
+        self.sum += other.sum
+        self.numeric_count += other.numeric_count
+        self.hll.merge(other.hll)
+        theirs = other.distinct_hashes
+        if theirs is None:
+            self._distinct, self._pending, self._pending_size = None, [], 0
+            self._counts = np.empty(0, dtype=np.int64)
+        else:
+            self._add_distinct(theirs, other._counts)
+        self._merge_samples(other)
+        if self.distribution is not None and other.distribution is not None:
+            self.distribution.merge(other.distribution)
+        return self
+
+    def _merge_samples(self, other: "ColumnAccumulator") -> None:
+        """Combine reservoirs, drawing from each in proportion to the rows it saw."""
+        total = self.non_null_seen + other.non_null_seen
+        if total and len(self.samples) + len(other.samples) > self.sample_size:
+            pools = [list(self.samples), list(other.samples)]
+            weights = [self.non_null_seen, other.non_null_seen]
+            merged: List[str] = []
+            while len(merged) < self.sample_size and any(pools):
+                side = 0 if pools[0] and (not pools[1] or self._rng.random() * total < weights[0]) else 1
+                merged.append(pools[side].pop())
+            self.samples = merged
+        else:
+            self.samples = self.samples + other.samples
+        self.non_null_seen = total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": "column_accumulator",
+            "numeric": self.numeric,
+            "rows": self.rows,
+            "nulls": self.nulls,
+            "min": self.min,
+            "max": self.max,
+            "sum": self.sum,
+            "numeric_count": self.numeric_count,
+            # Exact hash sets can be large; persisted state keeps the sketch only
+            "hll": self.hll.to_dict(),
+            "samples": self.samples,
+            "non_null_seen": self.non_null_seen,
+            "distribution": self.distribution.to_dict() if self.distribution is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnAccumulator":
+        acc = cls(data["numeric"])
+        acc.rows, acc.nulls = data["rows"], data["nulls"]
+        acc.min, acc.max = data["min"], data["max"]
+        acc.sum, acc.numeric_count = data["sum"], data["numeric_count"]
+        acc.hll = HyperLogLog.from_dict(data["hll"])
+        acc._distinct = None
+        acc.samples = list(data["samples"])
+        acc.non_null_seen = data.get("non_null_seen", len(acc.samples))
+        if data.get("distribution"):
+            acc.distribution = ColumnDistribution.from_dict(data["distribution"])
+        return acc
+
+
+def profile_batches(
+    batches: Iterable[Sequence[Sequence[Any]]],
+    columns: List[str],
+    numeric: Set[str],
+    length_columns: Optional[Dict[str, int]] = None,
+    distributions: bool = False,
+    exact_distinct: bool = True,
+    sample_size: int = 3,
+    sample_max_bytes: int = 256,
+    sample_columns: Optional[Dict[str, int]] = None,
+    run: Optional[Callable[..., Any]] = None,
+) -> Dict[str, ColumnAccumulator]:
+    """
+    Fold row batches into one accumulator per column.
+
+    ``batches`` yields sequences of rows whose first ``len(columns)`` fields
+    are the column values; ``length_columns`` maps a column to the row index
+    of its server-side LENGTH() (large objects shipped as digests), and
+    ``sample_columns`` to the row index of its truncated value, which example
+    values come from instead of the digest.  Length fields follow the
+    columns, then sample fields.
+    Without ``exact_distinct`` cardinality comes from HyperLogLog only.
+    ``run(fold, batch)``, when given, folds each batch in place of a plain
+    call, e.g. on a worker thread while the next batch is fetched elsewhere.
+    """
+    length_columns = length_columns or {}
+    sample_columns = sample_columns or {}
+    width = len(columns) + len(length_columns) + len(sample_columns)
+    field_names = (
+        columns
+        + [f"{c}__len" for c in length_columns]
+        + [f"{c}__sample" for c in sample_columns]
+    )
+    accs = {
+        c: ColumnAccumulator(c in numeric, distributions, exact_distinct, sample_size, sample_max_bytes)
+        for c in columns
+    }
+
+    def fold(batch: Sequence[Sequence[Any]]) -> None:
+        # object dtype keeps driver values as-is (no int -> float upcast when
+        # a batch has NULLs), so hashes match the SQL streaming path
+        frame = pd.DataFrame(
+            [tuple(row)[:width] for row in batch], columns=field_names, dtype=object
+        )
+        for c in columns:
+            lengths = frame[f"{c}__len"] if c in length_columns else None
+            samples = frame[f"{c}__sample"] if c in sample_columns else None
+            accs[c].add(frame[c], lengths, samples)
+
+    for batch in batches:
+        if not batch:
+            continue
+        if run is None:
+            fold(batch)
+        else:
+            run(fold, batch)
+    return accs
+
+
+def aggregate_mapping(accs: Dict[str, ColumnAccumulator]) -> Dict[str, Any]:
+    """
+    The accumulators as the label mapping SQLConnector's aggregate query
+    returns (``__rows``, ``<col>__nulls``, ``__uniq``, ``__min``, ``__max``,
+    ``__avg``), so both profiling engines share one unpacking step.
+    """
+    rows = next(iter(accs.values())).rows if accs else 0
+    out: Dict[str, Any] = {"__rows": rows}
+    for c, acc in accs.items():
+        out[f"{c}__nulls"] = acc.nulls
+        out[f"{c}__uniq"] = acc.distinct()
+        if acc.numeric:
+            out[f"{c}__min"] = acc.min
+            out[f"{c}__max"] = acc.max
+            out[f"{c}__avg"] = acc.mean()
+    return out
@@ -0,0 +1,88 @@
+"""
+Append-only incremental profiling — per-table high-watermark state.
+
+For tables that only ever grow (event logs keyed by a serial PK or a
+``created_at`` column), a run stores the largest watermark value it
+profiled plus every column's mergeable ColumnAccumulator.  The next run
+profiles only rows past the stored value and merges them in, so refresh
+cost follows the appended rows rather than the table size.
+
+Updates or deletes of rows below the watermark are not seen; the state
+is rebuilt when the table's columns change or its watermark goes
+backwards (truncated / reloaded).  Rows whose watermark is NULL are never
+profiled, so the column must be NOT NULL.
+
+Stored in the profile store's "watermarks" section:
+``{table: {"column", "value", "signature", "accumulators"}}``.
+"""
+import datetime
+import decimal
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from backend.connectors.vectorized_profiler import ColumnAccumulator
+
+
+def encode_value(value: Any) -> Dict[str, Any]:
+    """A watermark value as JSON, tagged so it binds with its original type."""
+    if isinstance(value, datetime.datetime):
+        return {"kind": "datetime", "value": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"kind": "date", "value": value.isoformat()}
+    if isinstance(value, decimal.Decimal):
+        return {"kind": "decimal", "value": str(value)}
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return {"kind": "str", "value": str(value)}
+    return {"kind": "number", "value": value}
+
+
+def decode_value(data: Dict[str, Any]) -> Any:
+    kind, value = data["kind"], data["value"]
+    if kind == "datetime":
+        return datetime.datetime.fromisoformat(value)
+    if kind == "date":
+        return datetime.date.fromisoformat(value)
+    if kind == "decimal":
+        return decimal.Decimal(value)
+    return value
+
+
+def signature(columns: List[dict], distributions: bool) -> str:
+    """Changes whenever stored accumulators no longer fit the table's columns."""
+    raw = json.dumps(
+        [[c["name"], str(c["type"])] for c in columns] + [distributions], sort_keys=True
+    )
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def dump_state(
+    column: str, value: Any, sig: str, accs: Dict[str, ColumnAccumulator]
+) -> Dict[str, Any]:
+    return {
+        "column": column,
+        "value": encode_value(value),
+        "signature": sig,
+        "accumulators": {c: acc.to_dict() for c, acc in accs.items()},
+    }
+
+
+def load_state(
+    state: Optional[Dict[str, Any]],
+    column: str,
+    sig: str,
+    sample_size: int,
+    sample_max_bytes: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    ``{"low", "accumulators"}`` to resume from, or None when there is no
+    usable state (never profiled, other watermark column, changed columns).
+    """
+    if not state or state.get("column") != column or state.get("signature") != sig:
+        return None
+    accs: Dict[str, ColumnAccumulator] = {}
+    for c, data in state["accumulators"].items():
+        acc = ColumnAccumulator.from_dict(data)
+        acc.sample_size, acc.sample_max_bytes = sample_size, sample_max_bytes
+        accs[c] = acc
+    return {"low": decode_value(state["value"]), "accumulators": accs}
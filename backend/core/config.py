@@ -21,6 +21,41 @@ class Settings(BaseSettings):
 
     # ── Pipeline ──
     MAX_RETRIES: int = 3
+    ENRICH_GROUP_SIZE: int = 4                 # tables per enrichment LLM call
+    ENRICH_CONCURRENCY: int = 4                # enrichment LLM calls in flight
+    ENRICH_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # per-table enrichment cache size (LRU)
+    ENRICH_CONTEXT_TOKENS: int = 3_000         # schema context budget per enrichment call
+    CHAT_CONTEXT_TOKENS: int = 12_000          # schema context budget for chat and report overview
+    INCREMENTAL_EXTRACTION: bool = True  # reuse profiles of unchanged tables
+    PROFILE_SAMPLE_THRESHOLD: int = 5_000_000  # rows; larger tables are sampled
+    PROFILE_SAMPLE_ROWS: int = 100_000         # target sample size
+    PROFILE_DISTINCT_MODE: str = "exact"       # "exact" | "approx" (HyperLogLog)
+    PROFILE_MODE: str = "scan"                 # "scan" | "metadata" (catalog stats first)
+    PROFILE_STATS_STALE_FRACTION: float = 0.2  # rows changed since ANALYZE => stale
+    PROFILE_COLUMN_GROUP_SIZE: int = 50        # columns per aggregate query
+    PROFILE_COLUMN_GROUP_WORKERS: int = 4      # concurrent groups per table
+    PROFILE_DISTRIBUTIONS: bool = False        # quantiles, histograms, top-k, lengths
+    PROFILE_ENGINE: str = "auto"               # "auto" | "sql" | "vectorized"
+    PROFILE_TABLE_TIMEOUT_S: float = 300.0     # per-table budget (0 = unlimited)
+    PROFILE_RUN_BUDGET_S: float = 0.0          # whole-extraction budget (0 = unlimited)
+    PROFILE_SAMPLE_VALUES: int = 3             # non-null example values per column
+    PROFILE_SAMPLE_MAX_BYTES: int = 256        # longer sample text is truncated
+    PROFILE_PARTITION_THRESHOLD: int = 1_000_000  # rows; larger full scans run in slices (0 = off)
+    PROFILE_PARTITIONS: int = 4                # slices (and threads) per partitioned table
+    PROFILE_ROW_BUDGET: int = 0                # rows scanned per run (0 = unlimited)
+    PROFILE_WATERMARK: bool = False            # append-only tables profile new rows only
+    PROFILE_WATERMARK_COLUMNS: str = ""        # "table:column,..."; default = integer PK
+    PROFILE_MAX_CONCURRENT_QUERIES: int = 8    # per source, lowered as latency rises
+    PROFILE_MAX_QPS: float = 0.0               # statements/s per source (0 = unlimited)
+    PROFILE_MAX_ROWS_PER_S: float = 0.0        # rows scanned/s per source (0 = unlimited)
+    PROFILE_ADAPTIVE_BACKOFF: bool = False     # halve concurrency when repeated queries slow down
+    PROFILE_READ_ONLY: bool = True             # read-only, low-priority source sessions
+    SQLITE_FAST_PATH: bool = True              # read-only URI, mmap, bulk catalog reads
+    SQLITE_IMMUTABLE: bool = False             # file never changes during a run: skip locking
+    SQLITE_PROCESSES: int = 0                  # profiling processes (0 = auto, 1 = threads only)
+    EXTRACTION_ASYNC: bool = False             # asyncio engine when the driver is installed
+    EXTRACTION_MAX_CONCURRENCY: int = 8        # tables profiled at once by the async connector
+    FILE_CHUNK_ROWS: int = 100_000             # rows per Parquet batch / CSV chunk (file:// sources)
 
     # ── Paths (computed from project root) ──
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
@@ -37,6 +72,8 @@ class Settings(BaseSettings):
     # ── Database ──
     DATABASE_URL: Optional[str] = None
     NEON_DATABASE_URL: str = ""
+    ENGINE_CACHE_SIZE: int = 8        # max cached engines (one per source)
+    ENGINE_IDLE_TTL_S: float = 900.0  # dispose engines idle this long
 
     model_config = {
         "env_file": ".env",
@@ -67,6 +104,11 @@ class Settings(BaseSettings):
     def cors_origin_list(self) -> list[str]:
         return [o.strip() for o in self.CORS_ORIGINS.split(",")]
 
+    @property
+    def watermark_column_map(self) -> dict[str, str]:
+        pairs = [p.split(":", 1) for p in self.PROFILE_WATERMARK_COLUMNS.split(",") if ":" in p]
+        return {t.strip(): c.strip() for t, c in pairs}
+
     def validate_keys(self):
         """Validate that required API keys are present."""
         if not self.GOOGLE_API_KEY:
@@ -97,6 +139,40 @@ class AppConfig:
     GEMINI_API_KEY = settings.GOOGLE_API_KEY
     GEMINI_MODEL = settings.GEMINI_MODEL
     MAX_RETRIES = settings.MAX_RETRIES
+    ENRICH_GROUP_SIZE = settings.ENRICH_GROUP_SIZE
+    ENRICH_CONCURRENCY = settings.ENRICH_CONCURRENCY
+    ENRICH_CACHE_MAX_BYTES = settings.ENRICH_CACHE_MAX_BYTES
+    ENRICH_CONTEXT_TOKENS = settings.ENRICH_CONTEXT_TOKENS
+    INCREMENTAL_EXTRACTION = settings.INCREMENTAL_EXTRACTION
+    PROFILE_SAMPLE_THRESHOLD = settings.PROFILE_SAMPLE_THRESHOLD
+    PROFILE_SAMPLE_ROWS = settings.PROFILE_SAMPLE_ROWS
+    PROFILE_DISTINCT_MODE = settings.PROFILE_DISTINCT_MODE
+    PROFILE_MODE = settings.PROFILE_MODE
+    PROFILE_STATS_STALE_FRACTION = settings.PROFILE_STATS_STALE_FRACTION
+    PROFILE_COLUMN_GROUP_SIZE = settings.PROFILE_COLUMN_GROUP_SIZE
+    PROFILE_COLUMN_GROUP_WORKERS = settings.PROFILE_COLUMN_GROUP_WORKERS
+    PROFILE_DISTRIBUTIONS = settings.PROFILE_DISTRIBUTIONS
+    PROFILE_ENGINE = settings.PROFILE_ENGINE
+    PROFILE_TABLE_TIMEOUT_S = settings.PROFILE_TABLE_TIMEOUT_S
+    PROFILE_RUN_BUDGET_S = settings.PROFILE_RUN_BUDGET_S
+    PROFILE_SAMPLE_VALUES = settings.PROFILE_SAMPLE_VALUES
+    PROFILE_SAMPLE_MAX_BYTES = settings.PROFILE_SAMPLE_MAX_BYTES
+    PROFILE_PARTITION_THRESHOLD = settings.PROFILE_PARTITION_THRESHOLD
+    PROFILE_PARTITIONS = settings.PROFILE_PARTITIONS
+    PROFILE_ROW_BUDGET = settings.PROFILE_ROW_BUDGET
+    PROFILE_WATERMARK = settings.PROFILE_WATERMARK
+    PROFILE_WATERMARK_COLUMNS = settings.watermark_column_map
+    PROFILE_MAX_CONCURRENT_QUERIES = settings.PROFILE_MAX_CONCURRENT_QUERIES
+    PROFILE_MAX_QPS = settings.PROFILE_MAX_QPS
+    PROFILE_MAX_ROWS_PER_S = settings.PROFILE_MAX_ROWS_PER_S
+    PROFILE_ADAPTIVE_BACKOFF = settings.PROFILE_ADAPTIVE_BACKOFF
+    PROFILE_READ_ONLY = settings.PROFILE_READ_ONLY
+    SQLITE_FAST_PATH = settings.SQLITE_FAST_PATH
+    SQLITE_IMMUTABLE = settings.SQLITE_IMMUTABLE
+    SQLITE_PROCESSES = settings.SQLITE_PROCESSES
+    EXTRACTION_ASYNC = settings.EXTRACTION_ASYNC
+    EXTRACTION_MAX_CONCURRENCY = settings.EXTRACTION_MAX_CONCURRENCY
+    FILE_CHUNK_ROWS = settings.FILE_CHUNK_ROWS
 
     @classmethod
     def validate(cls):
@@ -0,0 +1,118 @@
+"""
+Incremental JSON parsing of streamed LLM output.
+
+The model answers with one JSON object mapping table names to their
+enrichment (or, occasionally, a list of single-table objects).
+``TableStreamParser`` is fed the answer chunk by chunk and hands back each
+top-level ``(table, value)`` pair as soon as its closing brace arrives,
+so a caller can merge it while the rest is still streaming.
+
+Only string/escape state and bracket depth are tracked, so markdown
+fences and prose around the JSON are skipped, braces inside strings are
+ignored, and each table is decoded on its own: a malformed table is
+reported in ``errors`` and the well-formed ones around it are kept.
+"""
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class TableStreamParser:
+    """Emits the members of a streamed top-level JSON object as they complete."""
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0              # next character to scan
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._container: Optional[str] = None  # "{" or "[" once the top level opens
+        self._expect_key = False   # object mode: next depth-1 string is a key
+        self._key: Optional[str] = None
+        self._token_start = 0      # start of the depth-1 string or value being read
+        self.done = False          # top-level value closed
+        self.tables_emitted = 0
+        self.errors: List[str] = []
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume more output; returns the tables completed by it."""
+        if self.done or not chunk:
+            return []
+        self._text += chunk
+        emitted: List[Tuple[str, Any]] = []
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect_key:
+                        self._read_key(text[self._token_start:i + 1])
+                continue
+
+            if self._container is None:
+                # Prose or a markdown fence before the JSON
+                if ch in "{[":
+                    self._container = ch
+                    self._depth = 1
+                    self._expect_key = ch == "{"
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._token_start = i
+            elif ch in "{[":
+                if self._depth == 1:
+                    self._token_start = i
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    emitted.extend(self._decode(text[self._token_start:i + 1]))
+                elif self._depth == 0:
+                    self.done = True
+                    self._pos = i + 1
+                    return emitted
+            elif ch == "," and self._depth == 1:
+                self._expect_key = self._container == "{"
+
+        self._pos = len(text)
+        return emitted
+
+    def close(self) -> None:
+        """Mark the end of the stream; notes output that was cut off."""
+        if self._container is None:
+            self.errors.append("No JSON object found in the model output.")
+        elif not self.done:
+            self.errors.append("Model output ended before the JSON object was closed.")
+
+    def _read_key(self, token: str) -> None:
+        try:
+            self._key = json.loads(token)
+        except ValueError:
+            self._key = None
+        self._expect_key = False
+
+    def _decode(self, token: str) -> List[Tuple[str, Any]]:
+        """One complete depth-1 value as ``(table, value)`` pairs."""
+        try:
+            value = json.loads(token)
+        except ValueError as e:
+            label = f"'{self._key}'" if self._container == "{" else "list item"
+            self.errors.append(f"Malformed JSON for {label}: {e}")
+            return []
+
+        if self._container == "{":
+            if self._key is None:
+                return []
+            pairs = [(self._key, value)]
+        else:
+            # A list of {table: {...}} objects
+            pairs = list(value.items()) if isinstance(value, dict) else []
+        self.tables_emitted += len(pairs)
+        return pairs
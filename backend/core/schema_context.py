@@ -0,0 +1,221 @@
+"""
+Schema context builder — one compact, token-budgeted encoding of a schema
+for every LLM prompt (enrichment, chat, report overview).
+
+The encoding:
+  - tables get short codes (``T1 orders``) used by foreign-key references;
+  - column types are abbreviated (``VARCHAR(255)`` -> ``str(255)``);
+  - a run of identical columns shared by several tables (audit columns,
+    tenant keys, ...) is written once as ``@P1`` and referenced;
+  - descriptions, then stats, then sample values are added per table
+    until the estimated token count would exceed the budget.
+
+Names and types are always included in full, even over budget: callers
+need every column in the prompt.
+"""
+import re
+import math
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Gemini and most BPE tokenizers average ~4 characters per token on
+# identifier-heavy English text; close enough for budgeting.
+CHARS_PER_TOKEN = 4
+
+LEGEND = (
+    "Format: 'T<n> table' starts a table; columns are name:type "
+    "(PK primary key, PII personal data, ->T<n>.col foreign key); "
+    "@P<n> stands for the shared columns it defines; '.col:' lines add hints."
+)
+
+# Detail added in order while the budget allows
+TIERS = ("descriptions", "stats", "samples")
+
+_TYPE_PATTERNS: List[Tuple[str, str]] = [
+    (r"BIGSERIAL|SERIAL8|BIGINT|INT8|INT64", "bigint"),
+    (r"SERIAL|SERIAL4", "int"),
+    (r"SMALLINT|INT2|TINYINT|INT16|INT32|MEDIUMINT|INTEGER|INT4|INT", "int"),
+    (r"(?:N?VARCHAR|CHARACTER VARYING|VARCHAR2)\((\d+)\)", r"str(\1)"),
+    (r"N?CHAR(?:ACTER)?\((\d+)\)", r"char(\1)"),
+    (r"N?VARCHAR|TEXT|CLOB|STRING|OBJECT|CHARACTER VARYING", "str"),
+    (r"(?:NUMERIC|DECIMAL|NUMBER)\((\d+),\s*(\d+)\)", r"dec(\1,\2)"),
+    (r"NUMERIC|DECIMAL|NUMBER", "dec"),
+    (r"DOUBLE(?: PRECISION)?|FLOAT\d*|REAL", "float"),
+    (r"BOOL(?:EAN)?", "bool"),
+    (r"TIMESTAMP(?:\(\d+\))? WITH TIME ZONE|TIMESTAMPTZ|DATETIME64\[NS, .*\]", "tstz"),
+    (r"TIMESTAMP(?:\(\d+\))?(?: WITHOUT TIME ZONE)?|DATETIME(?:64\[NS\])?", "ts"),
+    (r"DATE", "date"),
+    (r"TIME(?:\(\d+\))?(?: WITHOUT TIME ZONE)?", "time"),
+    (r"JSONB?", "json"),
+    (r"UUID", "uuid"),
+    (r"BLOB|BYTEA|BINARY|VARBINARY", "bytes"),
+]
+_TYPE_RULES = [(re.compile(rf"^{p}$", re.IGNORECASE), r) for p, r in _TYPE_PATTERNS]
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate prompt tokens for ``text``."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def abbreviate_type(sql_type: Any) -> str:
+    """Short, dialect-neutral spelling of a column type."""
+    text = str(sql_type or "").strip()
+    for pattern, short in _TYPE_RULES:
+        if pattern.match(text):
+            return pattern.sub(short, text)
+    return text.lower()
+
+
+def _clip(value: Any, limit: int) -> str:
+    text = " ".join(str(value).split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def _column_item(name: str, meta: Dict[str, Any], fk: Optional[str]) -> str:
+    item = f"{name}:{abbreviate_type(meta.get('original_type'))}"
+    if "PK" in (meta.get("tags") or []):
+        item += " PK"
+    if meta.get("potential_pii"):
+        item += " PII"
+    if fk:
+        item += f"->{fk}"
+    return item
+
+
+def _hint(tier: str, meta: Dict[str, Any]) -> Optional[str]:
+    """One column's hint for a detail tier, or None if it has nothing to say."""
+    if tier == "descriptions":
+        parts = []
+        if meta.get("description"):
+            parts.append(_clip(meta["description"], 100))
+        if meta.get("business_logic"):
+            parts.append(f"logic: {_clip(meta['business_logic'], 80)}")
+        return "; ".join(parts) or None
+
+    stats = meta.get("stats") or {}
+    if tier == "stats":
+        parts = []
+        if stats.get("null_percentage") is not None:
+            parts.append(f"nulls {stats['null_percentage']:g}%")
+        if stats.get("unique_count") is not None:
+            parts.append(f"{stats['unique_count']} distinct")
+        if stats.get("min_value") is not None and stats.get("max_value") is not None:
+            parts.append(f"range {_clip(stats['min_value'], 24)}..{_clip(stats['max_value'], 24)}")
+        return ", ".join(parts) or None
+
+    samples = [v for v in (stats.get("sample_values") or []) if v is not None][:3]
+    return "e.g. " + ", ".join(_clip(v, 24) for v in samples) if samples else None
+
+
+def _shared_patterns(items: Dict[str, List[str]], fixed: Dict[str, set]) -> Dict[Tuple[str, ...], str]:
+    """
+    Runs of column items that appear, identically, in the same two or more
+    tables; each becomes one ``@P<n>``.  Key/FK columns stay inline.
+    """
+    tables_by_item: Dict[str, List[str]] = defaultdict(list)
+    for table, table_items in items.items():
+        for item in table_items:
+            if item not in fixed[table]:
+                tables_by_item[item].append(table)
+
+    groups: Dict[Tuple[str, ...], List[str]] = defaultdict(list)
+    for item, tables in tables_by_item.items():
+        if len(tables) > 1:
+            groups[tuple(tables)].append(item)
+
+    patterns = {}
+    for group_items in groups.values():
+        if len(group_items) > 1:
+            patterns[tuple(group_items)] = f"@P{len(patterns) + 1}"
+    return patterns
+
+
+def build_schema_context(
+    schema: Dict[str, Any],
+    budget_tokens: int,
+    columns: Optional[Dict[str, List[str]]] = None,
+    table_stats: bool = False,
+    tiers: Tuple[str, ...] = TIERS,
+) -> str:
+    """
+    Encode ``schema`` (``{table: TableSchema}``) for a prompt.
+
+    ``columns`` limits given tables to the listed columns; ``table_stats``
+    adds row counts and health scores to each table line.  Detail from
+    ``tiers`` is added table by table, in tier order, until the next
+    addition would exceed ``budget_tokens``.
+    """
+    columns = columns or {}
+    codes = {table: f"T{i}" for i, table in enumerate(schema, 1)}
+
+    items: Dict[str, List[str]] = {}
+    fixed: Dict[str, set] = {}
+    kept: Dict[str, List[str]] = {}
+    for table, data in schema.items():
+        fks = {
+            fk["column"]: f"{codes.get(fk['referred_table'], fk['referred_table'])}.{fk['referred_column']}"
+            for fk in data.get("foreign_keys") or []
+        }
+        kept[table] = [
+            c for c in data["columns"] if table not in columns or c in columns[table]
+        ]
+        items[table] = [_column_item(c, data["columns"][c], fks.get(c)) for c in kept[table]]
+        fixed[table] = {
+            item for c, item in zip(kept[table], items[table])
+            if c in fks or "PK" in (data["columns"][c].get("tags") or [])
+        }
+
+    patterns = _shared_patterns(items, fixed)
+    pattern_of = {item: (p, group) for group, p in patterns.items() for item in group}
+
+    lines = [LEGEND]
+    for group, p in patterns.items():
+        lines.append(f"{p} = {', '.join(group)}")
+
+    table_lines: Dict[str, List[str]] = {}
+    for table, data in schema.items():
+        header = f"{codes[table]} {table}"
+        if table_stats:
+            approx = "~" if data.get("row_count_estimated") else ""
+            header += f" rows={approx}{data.get('row_count') or 0:,} health={data.get('health_score', 100):.0f}"
+        rendered, used = [], set()
+        for item in items[table]:
+            if item in pattern_of and item not in fixed[table]:
+                p, _ = pattern_of[item]
+                if p not in used:
+                    used.add(p)
+                    rendered.append(p)
+            else:
+                rendered.append(item)
+        table_lines[table] = [header, "  " + ", ".join(rendered)]
+
+    total = estimate_tokens("\n".join(lines)) + sum(
+        estimate_tokens("\n".join(tl)) + 1 for tl in table_lines.values()
+    )
+
+    # Detail tiers, table by table, until one does not fit: lower tiers
+    # never displace higher ones
+    hints: Dict[str, Dict[str, List[str]]] = {t: defaultdict(list) for t in schema}
+    for tier, table in ((tier, table) for tier in tiers for table in schema):
+        additions = []
+        cost = 0
+        for c in kept[table]:
+            hint = _hint(tier, schema[table]["columns"][c])
+            if hint is None:
+                continue
+            new_line = not hints[table].get(c)
+            cost += estimate_tokens(hint) + (estimate_tokens(f"  .{c}: \n") if new_line else 1)
+            additions.append((c, hint))
+        if total + cost > budget_tokens:
+            break
+        total += cost
+        for c, hint in additions:
+            hints[table][c].append(hint)
+
+    for table in schema:
+        lines.extend(table_lines[table])
+        lines.extend(
+            f"  .{c}: {'; '.join(hints[table][c])}" for c in kept[table] if hints[table].get(c)
+        )
+    return "\n".join(lines)
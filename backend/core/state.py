@@ -15,6 +15,17 @@ class ColumnStats(TypedDict):
     min_value: Optional[Union[int, float]]
     max_value: Optional[Union[int, float]]
     mean_value: Optional[float]
+    # Sampling metadata: exact profiles have is_estimate=False, fraction 1.0
+    is_estimate: bool
+    sample_fraction: float
+    null_percentage_margin: float  # 95% half-width, percentage points
+    unique_count_bounds: Optional[List[int]]  # [low, high] when sampled, else None
+    distinct_method: str  # "exact" | "native" | "hll" | "catalog"
+    # Distribution profile (PROFILE_DISTRIBUTIONS); None when not computed
+    quantiles: Optional[Dict[str, float]]            # p05 / p25 / p50 / p75 / p95
+    histogram: Optional[List[Dict[str, Any]]]        # [{lower, upper, count}], equi-width
+    top_values: Optional[List[Dict[str, Any]]]       # [{value, count}], most frequent first
+    length_stats: Optional[Dict[str, float]]         # {min, max, mean} string length
 
 
 class ColumnMetadata(TypedDict):
@@ -38,6 +49,21 @@ class ForeignKey(TypedDict):
     referred_column: str
 
 
+class IndexInfo(TypedDict):
+    name: Optional[str]
+    columns: List[str]  # expression members appear as their SQL text
+    unique: bool
+
+
+class ProfilePlan(TypedDict):
+    """Why a table was profiled the way it was (see connectors.planner)."""
+    strategy: str  # "catalog" | "sample" | "full" | "partitioned" | "watermark" | "none" | "reuse"
+    reason: str
+    estimated_rows: Optional[int]
+    estimate_source: Optional[str]  # "catalog" | "explain" | "footer" (Parquet) | None
+    budgeted_rows: int  # rows charged against the run's row budget
+
+
 class TableSchema(TypedDict):
     """Represents a single table's state."""
     table_name: str
@@ -46,6 +72,18 @@ class TableSchema(TypedDict):
     health_score: float  # 0.0 to 100.0
     foreign_keys: List[ForeignKey]
     description: Optional[str]
+    profile_strategy: str  # "full" | "sample" | "partitioned" | "watermark" | "catalog" | "none"
+    row_count_estimated: bool
+    profile_incomplete: bool  # time budget ran out or profiling failed; stats are partial or missing
+    profile_plan: Optional[ProfilePlan]
+    indexes: List[IndexInfo]
+
+
+class ValidationDefect(TypedDict):
+    """One integrity violation found by the validation gate."""
+    table: str
+    kind: str  # "missing_table" | "missing_columns" | "extra_columns" | "undescribed_columns"
+    columns: List[str]  # affected columns; empty for table-level defects
 
 
 class AgentState(TypedDict):
@@ -56,12 +94,14 @@ class AgentState(TypedDict):
 
     # 2. Deterministic Layer (The Source of Truth)
     schema_raw: Dict[str, TableSchema]
+    extraction_stats: Dict[str, Any]  # e.g. tables reused vs re-scanned
 
     # 3. Probabilistic Layer (The AI Enrichment)
     schema_enriched: Dict[str, TableSchema]
 
     # 4. Orchestration Control
     errors: List[str]
+    defects: List[ValidationDefect]  # structured errors plus undescribed columns; drives targeted retries
     retry_count: int
     validation_status: str  # "PENDING", "PASSED", "FAILED"
 
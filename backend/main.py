@@ -15,6 +15,10 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from backend.core.config import settings
 from backend.core.exceptions import register_exception_handlers
 from backend.core.rate_limiter import setup_rate_limiting
+from backend.connectors.engine_registry import engine_registry
+from backend.connectors.async_connector import dispose_async_engines
+from backend.connectors.governor import governor_registry
+from backend.services.enrichment_cache import enrichment_cache
 from backend.api.routes import pipeline, chat, export, schema
 
 # ── Logging ──
@@ -35,6 +39,8 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Config warning: {e}")
     yield
+    engine_registry.dispose_all()
+    await dispose_async_engines()
     logger.info("SchemaDoc AI API shutting down.")
 
 
@@ -80,10 +86,7 @@ async def reset_session(request: Request):
     sid = request.headers.get("x-session-id", "")
     clear_all_runs(session_id=sid)
     clear_session_reports(session_id=sid)
-
-    cache_file = settings.DATA_DIR / "schema_cache.json"
-    if cache_file.exists():
-        cache_file.unlink()
+    # The enrichment cache is shared and content-addressed: nothing to clear
 
     logger.info(f"Session reset — session '{sid or 'global'}' cleared.")
     return {"status": "ok", "message": "Session reset successfully"}
@@ -96,6 +99,9 @@ async def health_check():
         "status": "healthy",
         "service": "SchemaDoc AI API",
         "version": "2.0.0",
+        "engine_registry": engine_registry.stats(),
+        "governors": governor_registry.stats(),
+        "enrichment_cache": enrichment_cache.stats(),
     }
 
 
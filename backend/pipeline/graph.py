@@ -2,20 +2,90 @@
 LangGraph pipeline builder.
 Ported from src/pipeline/graph.py with updated imports.
 """
+import asyncio
 from langgraph.graph import StateGraph, END
+from langchain_core.runnables import RunnableLambda
 from backend.core.state import AgentState
 from backend.core.config import AppConfig
 from backend.pipeline.nodes.validation_node import validate_schema_node
 from backend.pipeline.nodes.enrichment_node import enrich_metadata_node
 from backend.connectors.sql_connector import SQLConnector
+from backend.connectors.async_connector import AsyncSQLConnector, supports_async
+from backend.connectors.file_connector import FileConnector, is_file_source
+
+
+def _connector_options() -> dict:
+    """SQLConnector settings shared by the sync and async extraction nodes."""
+    return dict(
+        incremental=AppConfig.INCREMENTAL_EXTRACTION,
+        sample_threshold=AppConfig.PROFILE_SAMPLE_THRESHOLD,
+        sample_rows=AppConfig.PROFILE_SAMPLE_ROWS,
+        distinct_mode=AppConfig.PROFILE_DISTINCT_MODE,
+        profile_mode=AppConfig.PROFILE_MODE,
+        stats_stale_fraction=AppConfig.PROFILE_STATS_STALE_FRACTION,
+        column_group_size=AppConfig.PROFILE_COLUMN_GROUP_SIZE,
+        column_group_workers=AppConfig.PROFILE_COLUMN_GROUP_WORKERS,
+        distributions=AppConfig.PROFILE_DISTRIBUTIONS,
+        profile_engine=AppConfig.PROFILE_ENGINE,
+        table_timeout_s=AppConfig.PROFILE_TABLE_TIMEOUT_S,
+        run_budget_s=AppConfig.PROFILE_RUN_BUDGET_S,
+        sample_values=AppConfig.PROFILE_SAMPLE_VALUES,
+        sample_max_bytes=AppConfig.PROFILE_SAMPLE_MAX_BYTES,
+        partition_threshold=AppConfig.PROFILE_PARTITION_THRESHOLD,
+        partitions=AppConfig.PROFILE_PARTITIONS,
+        row_budget=AppConfig.PROFILE_ROW_BUDGET,
+        watermark=AppConfig.PROFILE_WATERMARK,
+        watermark_columns=AppConfig.PROFILE_WATERMARK_COLUMNS,
+        max_concurrent_queries=AppConfig.PROFILE_MAX_CONCURRENT_QUERIES,
+        max_qps=AppConfig.PROFILE_MAX_QPS,
+        max_rows_per_s=AppConfig.PROFILE_MAX_ROWS_PER_S,
+        adaptive_backoff=AppConfig.PROFILE_ADAPTIVE_BACKOFF,
+        read_only=AppConfig.PROFILE_READ_ONLY,
+        sqlite_fast_path=AppConfig.SQLITE_FAST_PATH,
+        sqlite_immutable=AppConfig.SQLITE_IMMUTABLE,
+        sqlite_processes=AppConfig.SQLITE_PROCESSES,
+    )
+
+
+def _file_connector(conn_str: str) -> FileConnector:
+    """Parquet / CSV files under a file:// source, profiled like a database."""
+    return FileConnector(
+        conn_str,
+        incremental=AppConfig.INCREMENTAL_EXTRACTION,
+        sample_threshold=AppConfig.PROFILE_SAMPLE_THRESHOLD,
+        sample_rows=AppConfig.PROFILE_SAMPLE_ROWS,
+        distinct_mode=AppConfig.PROFILE_DISTINCT_MODE,
+        distributions=AppConfig.PROFILE_DISTRIBUTIONS,
+        sample_values=AppConfig.PROFILE_SAMPLE_VALUES,
+        sample_max_bytes=AppConfig.PROFILE_SAMPLE_MAX_BYTES,
+        chunk_rows=AppConfig.FILE_CHUNK_ROWS,
+    )
 
 
 def extraction_node(state: AgentState):
     """Entry point: Connects to DB and gets raw schema."""
     conn_str = state["connection_string"]
-    connector = SQLConnector(conn_str)
+    if is_file_source(conn_str):
+        connector = _file_connector(conn_str)
+    else:
+        connector = SQLConnector(conn_str, **_connector_options())
     raw_schema = connector.get_live_schema()
-    return {"schema_raw": raw_schema}
+    return {"schema_raw": raw_schema, "extraction_stats": connector.last_run_stats}
+
+
+async def aextraction_node(state: AgentState):
+    """
+    Async entry point: on the event loop through AsyncSQLConnector when
+    enabled and the source has an asyncio driver, else the sync node on a thread.
+    """
+    conn_str = state["connection_string"]
+    if not (AppConfig.EXTRACTION_ASYNC and supports_async(conn_str)):
+        return await asyncio.to_thread(extraction_node, state)
+    connector = AsyncSQLConnector(
+        conn_str, max_concurrency=AppConfig.EXTRACTION_MAX_CONCURRENCY, **_connector_options()
+    )
+    raw_schema = await connector.get_live_schema_async()
+    return {"schema_raw": raw_schema, "extraction_stats": connector.last_run_stats}
 
 
 def should_continue(state: AgentState):
@@ -33,7 +103,7 @@ def should_continue(state: AgentState):
 def build_pipeline():
     workflow = StateGraph(AgentState)
 
-    workflow.add_node("extract", extraction_node)
+    workflow.add_node("extract", RunnableLambda(extraction_node, afunc=aextraction_node))
     workflow.add_node("enrich", enrich_metadata_node)
     workflow.add_node("validate", validate_schema_node)
 
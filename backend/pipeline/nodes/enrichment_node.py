@@ -1,24 +1,29 @@
 """
 AI Enrichment Node — Gemini-powered semantic analysis with ReAct tool-calling.
+Tables are enriched in small groups, each its own concurrent LLM call.
 Ported from src/pipeline/nodes/enrichment_node.py with updated imports.
 """
 import json
-import re
 import copy
 import logging
-import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal
-from typing import Dict, Any, List, Union
+from typing import Callable, Dict, Any, List, Optional, Union
 from datetime import datetime
 
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, AIMessage
+from langchain_core.messages import (
+    SystemMessage, HumanMessage, ToolMessage, AIMessage, message_chunk_to_message,
+)
 from langchain_core.tools import tool
 
-from backend.core.state import AgentState
+from backend.core.state import AgentState, ValidationDefect
 from backend.core.config import AppConfig
+from backend.core.json_stream import TableStreamParser
+from backend.core.schema_context import build_schema_context
 from backend.services.usage_search import usage_search
-from backend.core.utils import DecimalEncoder
+from backend.services.enrichment_cache import enrichment_cache, table_key
 
 logger = logging.getLogger(__name__)
 
@@ -52,60 +57,33 @@ def _extract_text_from_payload(content: Union[str, List, Dict]) -> str:
     return str(content)
 
 
-def _clean_json_string(s: str) -> str:
-    """Regex-based JSON extractor. Finds the outermost valid JSON object."""
-    if not s:
-        return ""
-    json_block = re.search(r"```json\s*(\{.*?\})\s*```", s, re.DOTALL)
-    if json_block:
-        return json_block.group(1)
-    code_block = re.search(r"```\s*(\{.*?\})\s*```", s, re.DOTALL)
-    if code_block:
-        return code_block.group(1)
-    match = re.search(r"(\{.*\})", s, re.DOTALL)
-    if match:
-        return match.group(1)
-    return s.strip()
+def _table_groups(schema_raw: Dict[str, Any], group_size: int) -> List[List[str]]:
+    """Split the tables into groups of ``group_size`` for separate LLM calls."""
+    tables = list(schema_raw.keys())
+    size = max(1, group_size)
+    return [tables[i:i + size] for i in range(0, len(tables), size)]
 
 
-def enrich_metadata_node(state: AgentState) -> Dict[str, Any]:
-    schema_raw = state.get("schema_raw", {})
-    previous_errors = state.get("errors", [])
-
-    # --- 1. Caching Logic ---
-    # Hash includes table names AND column names for deeper invalidation
-    schema_fingerprint = {
-        t: sorted(d["columns"].keys()) for t, d in schema_raw.items()
-    }
-    schema_str = json.dumps(schema_fingerprint, sort_keys=True)
-    current_hash = hashlib.md5(schema_str.encode()).hexdigest()
-    cache_file = AppConfig.DATA_DIR / "schema_cache.json"
-
-    if not previous_errors and cache_file.exists():
-        try:
-            with open(cache_file, "r") as f:
-                cache = json.load(f)
-            if cache.get("hash") == current_hash:
-                logger.info("Schema unchanged. Using cached enrichment.")
-                return {"schema_enriched": cache["data"], "schema_hash": current_hash}
-        except Exception:
-            pass
-
-    # --- 2. Prompt Setup ---
-    simplified_schema = {
-        table: {col: meta["original_type"] for col, meta in data["columns"].items()}
-        for table, data in schema_raw.items()
-    }
-    table_list = list(simplified_schema.keys())
+def _group_prompt(
+    schema_raw: Dict[str, Any], tables: List[str], columns: Optional[Dict[str, List[str]]] = None
+) -> str:
+    """System prompt covering only ``tables`` (and, per table, only ``columns``)."""
+    context = build_schema_context(
+        {table: schema_raw[table] for table in tables},
+        AppConfig.ENRICH_CONTEXT_TOKENS,
+        columns=columns,
+    )
 
-    system_prompt = f"""You are a Data Architect. Generate a JSON Data Dictionary.
+    return f"""You are a Data Architect. Generate a JSON Data Dictionary.
 
-INPUT SCHEMA ({len(table_list)} tables): {json.dumps(simplified_schema, separators=(',', ':'))}
+INPUT SCHEMA ({len(tables)} tables):
+{context}
 
 RULES:
 1. Output ONLY valid JSON — no markdown fences, no explanation text.
-2. You MUST include ALL {len(table_list)} tables: {json.dumps(table_list)}
+2. You MUST include ALL {len(tables)} tables: {json.dumps(tables)}
 3. You MUST include EVERY column listed for each table — do not skip any.
+   A table's @P<n> entry means each column it defines, under its own name.
 4. If a column is ambiguous (e.g. 'val_x', 'status'), call 'lookup_column_usage' first.
 5. Keep descriptions concise (1 sentence).
 
@@ -118,110 +96,284 @@ OUTPUT FORMAT:
   }}
 }}"""
 
-    messages = [
-        SystemMessage(content=system_prompt),
-        HumanMessage(content="Begin enrichment."),
-    ]
-
-    if previous_errors:
-        messages.append(
-            HumanMessage(content=f"Previous errors to fix: {json.dumps(previous_errors)}")
-        )
 
-    # --- 3. The Execution Loop ---
+def _build_llm():
+    """Gemini chat model with the usage-lookup tool bound."""
     llm = ChatGoogleGenerativeAI(
         model=AppConfig.GEMINI_MODEL,
         google_api_key=AppConfig.GEMINI_API_KEY,
         temperature=0,
     )
-    llm_with_tools = llm.bind_tools([lookup_column_usage])
+    return llm.bind_tools([lookup_column_usage])
 
+
+def _run_react_loop(
+    llm_with_tools, messages: list, label: str, on_table: Callable[[str, Any], None]
+) -> TableStreamParser:
+    """
+    Drive the tool-calling loop until the model answers.  The answer is
+    streamed through a ``TableStreamParser`` and ``on_table`` is called
+    with each table as soon as its JSON closes; returns the parser.
+    """
     max_turns = 6
     turn = 0
-    final_content = ""
+    parser = TableStreamParser()
 
     while turn < max_turns:
         turn += 1
-        try:
-            response = llm_with_tools.invoke(messages)
-            messages.append(response)
+        parser = TableStreamParser()
+        response = None
+        for chunk in llm_with_tools.stream(messages):
+            response = chunk if response is None else response + chunk
+            for table_name, enriched_data in parser.feed(_extract_text_from_payload(chunk.content)):
+                on_table(table_name, enriched_data)
+        if response is None:
+            break
+        response = message_chunk_to_message(response)
+        messages.append(response)
 
-            if response.tool_calls:
-                for tool_call in response.tool_calls:
-                    logger.info(
-                        f"Turn {turn}: Calling tool '{tool_call['name']}' for {tool_call['args']}"
+        if response.tool_calls:
+            for tool_call in response.tool_calls:
+                logger.info(
+                    f"{label} turn {turn}: Calling tool '{tool_call['name']}' for {tool_call['args']}"
+                )
+                tool_result = usage_search.search_column_usage(**tool_call["args"])
+                messages.append(
+                    ToolMessage(
+                        content=str(tool_result), tool_call_id=tool_call["id"]
                     )
-                    tool_result = usage_search.search_column_usage(**tool_call["args"])
-                    messages.append(
-                        ToolMessage(
-                            content=str(tool_result), tool_call_id=tool_call["id"]
+                )
+            continue
+
+        logger.info(f"{label} turn {turn}: Received {parser.tables_emitted} tables from AI.")
+        break
+
+    parser.close()
+    return parser
+
+
+def _apply_enrichment(table_state: Dict[str, Any], enriched_data: Any) -> None:
+    """Copy the AI's column fields onto ``table_state`` in place."""
+    if isinstance(enriched_data, dict) and "columns" in enriched_data:
+        for col_name, enriched_meta in enriched_data["columns"].items():
+            if col_name in table_state["columns"]:
+                for field in (
+                    "description",
+                    "tags",
+                    "business_logic",
+                    "potential_pii",
+                ):
+                    if field in enriched_meta:
+                        table_state["columns"][col_name][field] = (
+                            enriched_meta[field]
                         )
-                    )
-                continue
 
-            raw_content = _extract_text_from_payload(response.content)
-            if raw_content.strip():
-                logger.info(f"Turn {turn}: Received content from AI.")
-                final_content = raw_content
-                break
-            break
 
+def _enrich_group(
+    llm_with_tools,
+    schema_raw: Dict[str, Any],
+    tables: List[str],
+    previous_errors: List[str],
+    on_table: Callable[[str, Any], None],
+    columns: Optional[Dict[str, List[str]]] = None,
+) -> None:
+    """
+    One LLM conversation enriching ``tables``.  Each table the AI returns
+    is passed to ``on_table`` under its raw name as soon as it is parsed.
+    """
+    messages = [
+        SystemMessage(content=_group_prompt(schema_raw, tables, columns)),
+        HumanMessage(content="Begin enrichment."),
+    ]
+
+    # Only the errors about this group's tables are useful to it
+    group_errors = [e for e in previous_errors if any(f"'{t}'" in e for t in tables)]
+    if group_errors:
+        messages.append(
+            HumanMessage(content=f"Previous errors to fix: {json.dumps(group_errors)}")
+        )
+
+    def _on_parsed(table_name: str, enriched_data: Any) -> None:
+        raw_key = next((t for t in tables if t.lower() == table_name.lower()), None)
+        if raw_key is None:
+            logger.warning(
+                f"SKIPPING AI Table '{table_name}' - No match in raw schema."
+            )
+            return
+        on_table(raw_key, enriched_data)
+
+    label = f"Group {tables[0]}..{tables[-1]}" if len(tables) > 1 else f"Table {tables[0]}"
+    parser = _run_react_loop(llm_with_tools, messages, label, _on_parsed)
+    if parser.errors:
+        if not parser.tables_emitted:
+            raise ValueError("; ".join(parser.errors))
+        logger.warning(f"{label}: kept {parser.tables_emitted} tables; {'; '.join(parser.errors)}")
+
+
+def _run_groups(
+    llm_with_tools,
+    schema_raw: Dict[str, Any],
+    groups: List[List[str]],
+    previous_errors: List[str],
+    on_table: Callable[[str, Any], None],
+    columns: Optional[Dict[str, List[str]]] = None,
+) -> List[str]:
+    """
+    Enrich every group, ``ENRICH_CONCURRENCY`` at a time.  ``on_table`` is
+    called from the worker threads; returns one error per failed group.
+    """
+    group_errors: List[str] = []
+    workers = max(1, min(AppConfig.ENRICH_CONCURRENCY, len(groups)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                _enrich_group, llm_with_tools, schema_raw, tables, previous_errors, on_table, columns
+            ): tables
+            for tables in groups
+        }
+        for future in as_completed(futures):
+            tables = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Enrichment failed for {tables}: {e}")
+                group_errors.append(f"Enrichment Error for {tables}: {e}")
+    return group_errors
+
+
+def _cache_if_complete(table: str, table_state: Dict[str, Any]) -> None:
+    """Store a table's enrichment once every column has a description."""
+    columns = table_state["columns"]
+    if columns and all(meta.get("description") for meta in columns.values()):
+        key = table_key(table, table_state, AppConfig.GEMINI_MODEL)
+        try:
+            enrichment_cache.put(key, table, columns)
         except Exception as e:
-            return {"errors": [str(e)]}
+            logger.warning(f"Could not cache enrichment for '{table}': {e}")
 
-    # --- 4. Parsing & Merge Logic ---
-    try:
-        logger.info(f"EXTRACTING JSON FROM: {final_content[:200]}...")
-        cleaned = _clean_json_string(final_content)
-        parsed_enrichment = json.loads(cleaned)
-
-        if isinstance(parsed_enrichment, list):
-            logger.warning("AI returned a LIST of tables. Converting to Dict...")
-            new_dict = {}
-            for item in parsed_enrichment:
-                if isinstance(item, dict):
-                    new_dict.update(item)
-            parsed_enrichment = new_dict
-
-        final_enriched_state = {}
-        logger.info(f"MERGE: AI returned keys: {list(parsed_enrichment.keys())}")
-        logger.info(f"MERGE: Expected keys: {list(schema_raw.keys())}")
-
-        for table_name, enriched_data in parsed_enrichment.items():
-            match_found = False
-            for raw_key in schema_raw.keys():
-                if raw_key.lower() == table_name.lower():
-                    table_state = copy.deepcopy(schema_raw[raw_key])
-                    if "columns" in enriched_data:
-                        for col_name, enriched_meta in enriched_data["columns"].items():
-                            if col_name in table_state["columns"]:
-                                for field in (
-                                    "description",
-                                    "tags",
-                                    "business_logic",
-                                    "potential_pii",
-                                ):
-                                    if field in enriched_meta:
-                                        table_state["columns"][col_name][field] = (
-                                            enriched_meta[field]
-                                        )
-                    final_enriched_state[raw_key] = table_state
-                    match_found = True
-                    break
-            if not match_found:
-                logger.warning(
-                    f"SKIPPING AI Table '{table_name}' - No match in raw schema."
-                )
 
-        with open(cache_file, "w") as f:
-            json.dump(
-                {"hash": current_hash, "data": final_enriched_state},
-                f,
-                cls=DecimalEncoder,
+def _repair_defects(
+    schema_raw: Dict[str, Any],
+    schema_enriched: Dict[str, Any],
+    defects: List[ValidationDefect],
+    previous_errors: List[str],
+) -> Dict[str, Any]:
+    """
+    Retry pass: re-enrich only the tables and columns named by the
+    validation defects and patch them into the previous ``schema_enriched``.
+    Hallucinated columns are dropped without an LLM call.
+    """
+    patched = {t: copy.deepcopy(schema_enriched[t]) for t in schema_raw if t in schema_enriched}
+    targets: Dict[str, Optional[set]] = {}  # table -> columns to redo (None = whole table)
+
+    for defect in defects:
+        table = defect["table"]
+        if table not in schema_raw:
+            continue
+        if defect["kind"] == "missing_table":
+            targets[table] = None
+        elif defect["kind"] == "extra_columns":
+            for col in defect["columns"]:
+                patched[table]["columns"].pop(col, None)
+        elif table not in targets or targets[table] is not None:
+            # missing / undescribed columns
+            targets.setdefault(table, set()).update(
+                c for c in defect["columns"] if c in schema_raw[table]["columns"]
             )
 
-        return {"schema_enriched": final_enriched_state, "schema_hash": current_hash}
+    for table, cols in targets.items():
+        if cols is None:
+            patched[table] = copy.deepcopy(schema_raw[table])
+        else:
+            for col in cols:
+                patched[table]["columns"].setdefault(col, copy.deepcopy(schema_raw[table]["columns"][col]))
+
+    if targets:
+        columns = {t: sorted(cols) for t, cols in targets.items() if cols is not None}
+        groups = _table_groups({t: None for t in targets}, AppConfig.ENRICH_GROUP_SIZE)
+        logger.info(
+            f"Targeted retry: re-enriching {len(targets)} tables "
+            f"({sum(len(c) for c in columns.values())} columns in partial tables) "
+            f"in {len(groups)} groups."
+        )
+        try:
+            llm_with_tools = _build_llm()
+        except Exception as e:
+            return {"errors": [str(e)]}
+        lock = threading.Lock()
+
+        def _patch(table: str, enriched_data: Any) -> None:
+            if table not in targets:
+                return
+            with lock:
+                _apply_enrichment(patched[table], enriched_data)
+                _cache_if_complete(table, patched[table])
+
+        _run_groups(llm_with_tools, schema_raw, groups, previous_errors, _patch, columns)
+
+    final_enriched_state = {t: patched[t] for t in schema_raw if t in patched}
+    return {"schema_enriched": final_enriched_state}
+
+
+def enrich_metadata_node(state: AgentState) -> Dict[str, Any]:
+    """
+    Enrich the schema with one LLM call per group of ``ENRICH_GROUP_SIZE``
+    tables, ``ENRICH_CONCURRENCY`` calls at a time.  Small prompts keep
+    outputs short and wall time roughly flat as tables are added, and a
+    malformed answer costs only its own group: those tables are left out
+    and the validation gate sends the pass back for a retry.  Retries with
+    validation ``defects`` redo only the defective tables and columns.
+    Tables whose name, columns and types are unchanged since a previous
+    run (against any database) come from the per-table enrichment cache.
+    """
+    schema_raw = state.get("schema_raw", {})
+    previous_errors = state.get("errors", [])
+    defects = state.get("defects") or []
+
+    # --- 1. Targeted retry: patch only what validation flagged ---
+    if defects and state.get("schema_enriched"):
+        return _repair_defects(schema_raw, state["schema_enriched"], defects, previous_errors)
+
+    # --- 2. Per-table cache: unchanged tables keep their enrichment ---
+    enriched: Dict[str, Any] = {}
+    for table, data in schema_raw.items():
+        cached = enrichment_cache.get(table_key(table, data, AppConfig.GEMINI_MODEL))
+        if cached is not None:
+            table_state = copy.deepcopy(data)
+            _apply_enrichment(table_state, {"columns": cached})
+            enriched[table] = table_state
+    if enriched:
+        logger.info(f"Enrichment cache: {len(enriched)}/{len(schema_raw)} tables reused.")
+
+    # --- 3. Concurrent per-group enrichment of the rest ---
+    to_enrich = {t: d for t, d in schema_raw.items() if t not in enriched}
+    groups = _table_groups(to_enrich, AppConfig.ENRICH_GROUP_SIZE)
+    group_errors: List[str] = []
+    if groups:
+        try:
+            llm_with_tools = _build_llm()
+        except Exception as e:
+            return {"errors": [str(e)]}
+
+        logger.info(
+            f"Enriching {len(to_enrich)} tables in {len(groups)} groups "
+            f"({AppConfig.ENRICH_CONCURRENCY} concurrent)."
+        )
+        lock = threading.Lock()
+
+        # Merged (and cached, when complete) as each table streams in
+        def _merge(table: str, enriched_data: Any) -> None:
+            table_state = copy.deepcopy(schema_raw[table])
+            _apply_enrichment(table_state, enriched_data)
+            with lock:
+                enriched[table] = table_state
+                _cache_if_complete(table, table_state)
+
+        group_errors = _run_groups(llm_with_tools, schema_raw, groups, previous_errors, _merge)
+
+    if schema_raw and not enriched:
+        return {"errors": group_errors or ["Enrichment Error: AI returned no tables."]}
 
-    except Exception as e:
-        logger.error(f"Parsing/Merge Error: {e}")
-        return {"errors": [f"Enrichment Error: {str(e)}"]}
+    # --- 4. Merge in schema order ---
+    final_enriched_state = {t: enriched[t] for t in schema_raw if t in enriched}
+    return {"schema_enriched": final_enriched_state}
@@ -4,7 +4,7 @@ Ported from src/pipeline/nodes/validation_node.py with updated imports.
 """
 import logging
 from typing import Dict, Any, List, Set
-from backend.core.state import AgentState
+from backend.core.state import AgentState, ValidationDefect
 from backend.core.config import AppConfig
 
 logger = logging.getLogger(__name__)
@@ -16,12 +16,19 @@ def validate_schema_node(state: AgentState) -> Dict[str, Any]:
     Compares the AI-enriched schema against the rigid 'schema_raw' source of truth.
     If the AI hallucinates or misses columns, this node fails the state, 
     triggering a retry or a fallback.
+
+    Besides the human-readable ``errors``, every violation is recorded as a
+    structured ``defects`` entry naming its table and columns, so the retry
+    pass re-enriches only what failed.  Columns the AI left undescribed are
+    recorded as defects too, so a retry redescribes them, but they are not
+    errors: on their own they never fail the gate.
     """
     raw = state.get("schema_raw", {})
     enriched = state.get("schema_enriched", {})
     current_retries = state.get("retry_count", 0)
 
     errors: List[str] = []
+    defects: List[ValidationDefect] = []
 
     logger.info(
         f"Validating schema integrity (Attempt {current_retries + 1}/{AppConfig.MAX_RETRIES})..."
@@ -37,29 +44,42 @@ def validate_schema_node(state: AgentState) -> Dict[str, Any]:
     for table_name, raw_table_data in raw.items():
         if table_name not in enriched:
             errors.append(f"Missing Table: '{table_name}' was dropped by AI.")
+            defects.append({"table": table_name, "kind": "missing_table", "columns": []})
             continue
 
         raw_cols: Set[str] = set(raw_table_data["columns"].keys())
-        enriched_cols: Set[str] = set(enriched[table_name]["columns"].keys())
+        enriched_columns = enriched[table_name]["columns"]
+        enriched_cols: Set[str] = set(enriched_columns.keys())
 
         missing = raw_cols - enriched_cols
         if missing:
             errors.append(f"Table '{table_name}' is missing columns: {list(missing)}")
+            defects.append({"table": table_name, "kind": "missing_columns", "columns": sorted(missing)})
 
         extra = enriched_cols - raw_cols
         if extra:
             errors.append(
                 f"Table '{table_name}' has hallucinated columns: {list(extra)}"
             )
+            defects.append({"table": table_name, "kind": "extra_columns", "columns": sorted(extra)})
+
+        # Present but skipped by the AI: the merge keeps the raw column as-is
+        undescribed = sorted(
+            c for c in raw_cols & enriched_cols if not enriched_columns[c].get("description")
+        )
+        if undescribed:
+            logger.info(f"Table '{table_name}' has columns without descriptions: {undescribed}")
+            defects.append({"table": table_name, "kind": "undescribed_columns", "columns": undescribed})
 
     # 3. Decision Logic
     if errors:
         logger.warning(f"Validation Failed with {len(errors)} errors.")
         return {
             "errors": errors,
+            "defects": defects,
             "validation_status": "FAILED",
             "retry_count": current_retries + 1,
         }
     else:
         logger.info("Validation Passed. Schema integrity verified.")
-        return {"errors": [], "validation_status": "PASSED"}
+        return {"errors": [], "defects": defects, "validation_status": "PASSED"}
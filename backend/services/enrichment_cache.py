@@ -0,0 +1,151 @@
+"""
+Enrichment Cache — per-table, content-addressed store of AI enrichment.
+
+An entry holds the AI's column fields (description, business_logic,
+tags, potential_pii) for one table and is keyed by a hash of the table
+name, its column names and types, and the model that wrote it.  Nothing
+source-specific goes into the key, so:
+  - a schema with a few changed tables reuses the rest;
+  - the same table in two databases (or sessions) shares one entry;
+  - profiling stats are never cached here — they always come from the
+    current extraction.
+
+Entries are one JSON file each, written to a temp file and renamed into
+place, so concurrent writers (threads or worker processes) never leave
+a torn entry and readers need no lock.  A hit refreshes the file's mtime;
+when the directory grows past ``max_bytes`` the least recently used
+entries are deleted.
+"""
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from backend.core.config import settings
+from backend.core.utils import DecimalEncoder
+
+logger = logging.getLogger(__name__)
+
+# Column fields written by enrichment; everything else comes from the profiler
+ENRICHED_FIELDS = ("description", "business_logic", "tags", "potential_pii")
+
+
+def table_key(table_name: str, table: Dict[str, Any], model: str) -> str:
+    """Content address of one table's enrichment: name, columns and types, model."""
+    columns = sorted(
+        (name, str(meta.get("original_type", ""))) for name, meta in table["columns"].items()
+    )
+    raw = json.dumps({"table": table_name, "columns": columns, "model": model}, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+class EnrichmentCache:
+    """Directory of ``<key>.json`` entries with LRU size eviction."""
+
+    def __init__(self, directory: Path, max_bytes: int = 64 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """The cached ``{column: {field: value}}`` for a key, or None."""
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                columns = json.load(f)["columns"]
+            os.utime(path)  # recency for LRU eviction
+        except FileNotFoundError:
+            columns = None
+        except Exception as e:
+            logger.warning(f"Enrichment cache entry {key} unreadable ({e}); ignoring it.")
+            columns = None
+        with self._lock:
+            if columns is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return columns
+
+    def put(self, key: str, table_name: str, columns: Dict[str, Dict[str, Any]]) -> None:
+        """Store one table's enriched column fields.  Writes are atomic."""
+        entry = {
+            "table": table_name,
+            "columns": {
+                col: {f: meta[f] for f in ENRICHED_FIELDS if f in meta}
+                for col, meta in columns.items()
+            },
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f, cls=DecimalEncoder)
+            os.replace(tmp, self._path(key))
+        except Exception:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        with self._lock:
+            self.writes += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries over ``max_bytes``.  Caller holds the lock."""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Delete every entry (tests and manual maintenance; not session reset)."""
+        with self._lock:
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            entries = list(self.directory.glob("*.json")) if self.directory.exists() else []
+            return {
+                "entries": len(entries),
+                "bytes": sum(p.stat().st_size for p in entries if p.exists()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# ── Singleton ──
+enrichment_cache = EnrichmentCache(
+    settings.DATA_DIR / "enrichment_cache",
+    max_bytes=settings.ENRICH_CACHE_MAX_BYTES,
+)
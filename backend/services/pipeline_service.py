@@ -62,14 +62,9 @@ def list_runs(session_id: str = "") -> list:
     ]
 
 
-def execute_pipeline(connection_string: str, session_id: str = "") -> Dict[str, Any]:
-    """
-    Execute the LangGraph pipeline synchronously and return results.
-    Tracks execution steps for the pipeline integrity log.
-    """
+def _start_run(connection_string: str, session_id: str) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """Register a new run; returns ``(run_record, initial_state)``."""
     run_id = str(uuid.uuid4())[:8]
-    store = _session_store(session_id)
-
     run_record = {
         "run_id": run_id,
         "status": "running",
@@ -79,88 +74,143 @@ def execute_pipeline(connection_string: str, session_id: str = "") -> Dict[str,
         "pipeline_log": [],
         "errors": [],
     }
-    store[run_id] = run_record
-
-    try:
-        initial_state = {
-            "connection_string": connection_string,
-            "retry_count": 0,
+    _session_store(session_id)[run_id] = run_record
+    initial_state = {
+        "connection_string": connection_string,
+        "retry_count": 0,
+        "errors": [],
+        "schema_raw": {},
+        "schema_enriched": {},
+    }
+    return run_record, initial_state
+
+
+def _log_step(pipeline_log: list, node_name: str, node_output: Dict[str, Any]) -> None:
+    """Append the pipeline integrity log entry for one finished node."""
+    if node_name == "extract":
+        table_count = len(node_output.get("schema_raw", {}))
+        total_cols = sum(
+            len(t.get("columns", {}))
+            for t in node_output.get("schema_raw", {}).values()
+        )
+        x_stats = node_output.get("extraction_stats") or {}
+        reuse_note = ""
+        if x_stats.get("tables_reused") or x_stats.get("tables_from_catalog"):
+            reuse_note = (
+                f" ({x_stats.get('tables_reused', 0)} reused, "
+                f"{x_stats.get('tables_from_catalog', 0)} from catalog stats, "
+                f"{x_stats.get('tables_rescanned', 0)} re-scanned)"
+            )
+        if x_stats.get("tables_incomplete"):
+            reuse_note += (
+                f"; {x_stats['tables_incomplete']} tables have partial stats "
+                f"(time budget or profiling error)"
+            )
+        if x_stats.get("tables_over_budget"):
+            reuse_note += (
+                f"; {x_stats['tables_over_budget']} tables left unprofiled "
+                f"by the row budget"
+            )
+        pipeline_log.append({
+            "step": "extract",
+            "status": "success",
+            "message": f"Extracted {table_count} tables, {total_cols} columns with statistical profiling{reuse_note}",
+            "icon": "🔬",
             "errors": [],
-            "schema_raw": {},
-            "schema_enriched": {},
-        }
+        })
+
+    elif node_name == "enrich":
+        enrich_count = sum(1 for entry in pipeline_log if entry["step"] == "enrich") + 1
+        pipeline_log.append({
+            "step": "enrich",
+            "status": "success",
+            "message": f"AI enrichment pass {enrich_count} — Gemini analysis with ReAct tool-calling",
+            "icon": "🧠",
+            "errors": [],
+        })
+
+    elif node_name == "validate":
+        v_status = node_output.get("validation_status", "PENDING")
+        v_errors = node_output.get("errors", [])
+        if v_status == "PASSED":
+            pipeline_log.append({
+                "step": "validate",
+                "status": "passed",
+                "message": "Validation PASSED — zero hallucinations, zero data loss",
+                "icon": "✅",
+                "errors": [],
+            })
+        else:
+            pipeline_log.append({
+                "step": "validate",
+                "status": "failed",
+                "message": f"Validation FAILED — {len(v_errors)} integrity violation(s) caught",
+                "icon": "🔄",
+                "errors": v_errors,
+            })
+
+
+def _finish_run(run_record: Dict[str, Any], final_state: Dict[str, Any], pipeline_log: list) -> None:
+    """Record the pipeline's outcome on its run."""
+    if final_state.get("validation_status") == "PASSED":
+        # JSON-serialize to clean Decimal types
+        clean_enriched = json.loads(
+            json.dumps(final_state["schema_enriched"], cls=DecimalEncoder)
+        )
+        run_record["status"] = "completed"
+        run_record["schema_enriched"] = clean_enriched
+        run_record["pipeline_log"] = pipeline_log
+        run_record["extraction_stats"] = final_state.get("extraction_stats")
+    else:
+        run_record["status"] = "failed"
+        run_record["errors"] = final_state.get("errors", [])
+        run_record["pipeline_log"] = pipeline_log
+
 
+def execute_pipeline(connection_string: str, session_id: str = "") -> Dict[str, Any]:
+    """
+    Execute the LangGraph pipeline synchronously and return results.
+    Tracks execution steps for the pipeline integrity log.
+    """
+    run_record, initial_state = _start_run(connection_string, session_id)
+    try:
         app = build_pipeline()
         pipeline_log = []
-        enrich_count = 0
         final_state = dict(initial_state)
-
         for event in app.stream(initial_state):
             for node_name, node_output in event.items():
                 final_state.update(node_output)
+                _log_step(pipeline_log, node_name, node_output)
+        _finish_run(run_record, final_state, pipeline_log)
 
-                if node_name == "extract":
-                    table_count = len(node_output.get("schema_raw", {}))
-                    total_cols = sum(
-                        len(t.get("columns", {}))
-                        for t in node_output.get("schema_raw", {}).values()
-                    )
-                    pipeline_log.append({
-                        "step": "extract",
-                        "status": "success",
-                        "message": f"Extracted {table_count} tables, {total_cols} columns with statistical profiling",
-                        "icon": "🔬",
-                        "errors": [],
-                    })
-
-                elif node_name == "enrich":
-                    enrich_count += 1
-                    pipeline_log.append({
-                        "step": "enrich",
-                        "status": "success",
-                        "message": f"AI enrichment pass {enrich_count} — Gemini analysis with ReAct tool-calling",
-                        "icon": "🧠",
-                        "errors": [],
-                    })
-
-                elif node_name == "validate":
-                    v_status = node_output.get("validation_status", "PENDING")
-                    v_errors = node_output.get("errors", [])
-                    if v_status == "PASSED":
-                        pipeline_log.append({
-                            "step": "validate",
-                            "status": "passed",
-                            "message": "Validation PASSED — zero hallucinations, zero data loss",
-                            "icon": "✅",
-                            "errors": [],
-                        })
-                    else:
-                        pipeline_log.append({
-                            "step": "validate",
-                            "status": "failed",
-                            "message": f"Validation FAILED — {len(v_errors)} integrity violation(s) caught",
-                            "icon": "🔄",
-                            "errors": v_errors,
-                        })
-
-        # Finalize
-        if final_state.get("validation_status") == "PASSED":
-            # JSON-serialize to clean Decimal types
-            clean_enriched = json.loads(
-                json.dumps(final_state["schema_enriched"], cls=DecimalEncoder)
-            )
-            run_record["status"] = "completed"
-            run_record["schema_enriched"] = clean_enriched
-            run_record["pipeline_log"] = pipeline_log
-        else:
-            run_record["status"] = "failed"
-            run_record["errors"] = final_state.get("errors", [])
-            run_record["pipeline_log"] = pipeline_log
+    except Exception as e:
+        logger.error(f"Pipeline execution error: {e}")
+        run_record["status"] = "failed"
+        run_record["errors"] = [str(e)]
+
+    return run_record
+
+
+async def execute_pipeline_async(connection_string: str, session_id: str = "") -> Dict[str, Any]:
+    """
+    ``execute_pipeline`` without blocking the event loop: extraction runs
+    on it (async connector) or on a thread, and LangGraph runs the
+    synchronous enrich / validate nodes on threads.
+    """
+    run_record, initial_state = _start_run(connection_string, session_id)
+    try:
+        app = build_pipeline()
+        pipeline_log = []
+        final_state = dict(initial_state)
+        async for event in app.astream(initial_state):
+            for node_name, node_output in event.items():
+                final_state.update(node_output)
+                _log_step(pipeline_log, node_name, node_output)
+        _finish_run(run_record, final_state, pipeline_log)
 
     except Exception as e:
         logger.error(f"Pipeline execution error: {e}")
         run_record["status"] = "failed"
         run_record["errors"] = [str(e)]
 
-    store[run_id] = run_record
     return run_record
@@ -0,0 +1,145 @@
+"""
+Unit tests for the asyncio SQL connector.
+
+JUSTIFICATION:
+- URL mapping is pure and always tested.
+- The connector itself runs against a throwaway SQLite database through
+  aiosqlite; those tests are skipped where greenlet or aiosqlite is not
+  installed, since the asyncio engine cannot be built without them.
+
+Run with:
+    pytest backend/tests/test_async_connector.py -v
+"""
+import sqlite3
+import threading
+import pytest
+
+from backend.connectors.async_connector import AsyncSQLConnector, async_url, supports_async
+from backend.connectors.sql_connector import SQLConnector
+from backend.connectors.profile_store import ProfileStore
+from backend.connectors.engine_registry import EngineRegistry
+from backend.connectors.governor import GovernorRegistry
+from backend.connectors.vectorized_profiler import ColumnAccumulator
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """Six small tables, so several are profiled concurrently."""
+    path = tmp_path / "many.db"
+    con = sqlite3.connect(path)
+    for t in range(6):
+        con.execute(f"CREATE TABLE t{t} (id INTEGER PRIMARY KEY, v TEXT, n REAL)")
+        con.executemany(
+            f"INSERT INTO t{t} VALUES (?, ?, ?)",
+            [(i, None if i % 5 == 0 else f"v{i % 7}", i * 1.5) for i in range(200)],
+        )
+    con.commit()
+    con.close()
+    return f"sqlite:///{path}"
+
+
+@pytest.fixture
+def store(tmp_path):
+    """An isolated profile store so tests never touch data/."""
+    return ProfileStore(tmp_path / "profile_store")
+
+
+def _without_samples(schema):
+    for table in schema.values():
+        for col in table["columns"].values():
+            col["stats"]["sample_values"] = None
+    return schema
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  URLS
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestAsyncUrl:
+    """Connection strings map onto each dialect's asyncio driver."""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("sqlite:///data/demo.db", "sqlite+aiosqlite:///data/demo.db"),
+        ("postgresql://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("postgresql+psycopg2://u:p@host/db?sslmode=require", "postgresql+asyncpg://u:p@host/db?sslmode=require"),
+        ("mysql+pymysql://u:p@host/db", "mysql+aiomysql://u:p@host/db"),
+    ])
+    def test_driver_swapped(self, url, expected):
+        assert async_url(url) == expected
+
+    def test_dialect_without_driver(self):
+        with pytest.raises(ValueError):
+            async_url("mssql+pyodbc://u:p@dsn")
+        assert not supports_async("mssql+pyodbc://u:p@dsn")
+        assert not supports_async("not a url")
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  CONNECTOR
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestAsyncConnector:
+    """Extraction as coroutines gives the same schema as the threaded connector."""
+
+    @pytest.fixture(autouse=True)
+    def _drivers(self):
+        pytest.importorskip("greenlet")
+        pytest.importorskip("aiosqlite")
+
+    def _connector(self, url, store, **options):
+        return AsyncSQLConnector(
+            url, store=store, registry=EngineRegistry(), governors=GovernorRegistry(), **options
+        )
+
+    async def test_matches_sync_connector(self, sqlite_db, store):
+        expected = SQLConnector(sqlite_db, store=store, registry=EngineRegistry()).get_live_schema()
+        schema = await self._connector(sqlite_db, store).get_live_schema_async()
+        assert _without_samples(schema) == _without_samples(expected)
+
+    async def test_tables_run_as_tasks(self, sqlite_db, store):
+        connector = self._connector(sqlite_db, store, max_concurrency=2)
+        await connector.get_live_schema_async()
+        workers = {s["worker"] for s in connector.last_schedule}
+        assert len(connector.last_schedule) == 6
+        assert all(w.startswith("profile:") for w in workers)
+        assert connector.governor.stats()["active"] == 0
+
+    @pytest.mark.parametrize("engine", ["sql", "auto"])
+    async def test_table_wider_than_a_column_group(self, tmp_path, store, engine):
+        path = tmp_path / "wide.db"
+        con = sqlite3.connect(path)
+        cols = [f"c{i}" for i in range(61)]
+        con.execute(f"CREATE TABLE wide (id INTEGER PRIMARY KEY, {', '.join(c + ' INTEGER' for c in cols)})")
+        con.executemany(
+            f"INSERT INTO wide VALUES ({', '.join('?' * 62)})",
+            [(r, *[None if r % 4 == 0 else r * i for i in range(61)]) for r in range(40)],
+        )
+        con.commit()
+        con.close()
+        connector = self._connector(f"sqlite:///{path}", store, profile_engine=engine)
+        assert len(cols) + 1 > connector._column_group_size()
+        table = (await connector.get_live_schema_async())["wide"]
+        assert not table["profile_incomplete"]
+        for col in cols:
+            assert table["columns"][col]["stats"]["null_count"] == 10
+        assert table["columns"]["c60"]["stats"]["max_value"] == 39 * 60
+
+    async def test_cpu_work_runs_off_the_event_loop(self, sqlite_db, store, monkeypatch):
+        loop_thread = threading.get_ident()
+        fold_threads = set()
+        add = ColumnAccumulator.add
+
+        def tracking_add(self, *args, **kwargs):
+            fold_threads.add(threading.get_ident())
+            return add(self, *args, **kwargs)
+
+        monkeypatch.setattr(ColumnAccumulator, "add", tracking_add)
+        connector = self._connector(sqlite_db, store, profile_engine="vectorized")
+        schema = await connector.get_live_schema_async()
+        assert schema["t0"]["columns"]["v"]["stats"]["null_count"] == 40
+        assert fold_threads and loop_thread not in fold_threads
+
+    def test_blocking_entry_point(self, sqlite_db, store):
+        schema = self._connector(sqlite_db, store).get_live_schema()
+        assert schema["t0"]["row_count"] == 200
+        assert schema["t0"]["columns"]["v"]["stats"]["null_count"] == 40
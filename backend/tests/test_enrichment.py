@@ -0,0 +1,276 @@
+"""
+Unit tests for the grouped, concurrent enrichment node.
+
+JUSTIFICATION:
+- The Gemini model is replaced by a scripted chat model that answers from
+  the schema in its own prompt, so grouping, merging and failure isolation
+  are tested without an API key or network.
+- The cache file is redirected to tmp_path so data/ is never touched.
+
+Run with:
+    pytest backend/tests/test_enrichment.py -v
+"""
+import json
+import re
+import time
+import threading
+import pytest
+from langchain_core.messages import AIMessageChunk
+
+from backend.core.config import AppConfig
+from backend.pipeline.nodes import enrichment_node
+from backend.pipeline.nodes.enrichment_node import _table_groups, enrich_metadata_node
+from backend.pipeline.graph import should_continue
+from backend.services.enrichment_cache import EnrichmentCache
+from backend.pipeline.nodes.validation_node import validate_schema_node
+
+
+class ScriptedLLM:
+    """Streams a description for each column it was given, per prompt."""
+
+    def __init__(self, delay_s: float = 0.0, broken: tuple = ()):
+        self.delay_s = delay_s
+        self.broken = set(broken)      # tables whose group gets malformed JSON
+        self.skip = set()              # (table, column) left out of the next answer
+        self.calls = []
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def stream(self, messages):
+        """The answer in small chunks, as a streaming chat model yields it."""
+        content = self._answer(messages)
+        for i in range(0, len(content), 16):
+            yield AIMessageChunk(content=content[i:i + 16])
+
+    def _answer(self, messages) -> str:
+        schema = _read_context(messages[0].content)
+        with self._lock:
+            self.calls.append(list(schema))
+            self.prompts.append(schema)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay_s)
+        with self._lock:
+            self.in_flight -= 1
+        if self.broken & set(schema):
+            return '{"oops": '
+        answer = {
+            table: {"columns": {col: {"description": f"{table}.{col}", "tags": [], "potential_pii": False}
+                                for col in cols if (table, col) not in self.skip}}
+            for table, cols in schema.items()
+        }
+        self.skip -= {(t, c) for t, cols in schema.items() for c in cols}
+        return json.dumps(answer)
+
+
+def _read_context(prompt: str) -> dict:
+    """``{table: {column: type}}`` back out of a prompt's schema context."""
+    patterns = dict(re.findall(r"^(@P\d+) = (.*)$", prompt, re.MULTILINE))
+    schema = {}
+    for table, cols in re.findall(r"^T\d+ (\S+).*\n  (.*)$", prompt, re.MULTILINE):
+        items = []
+        for item in cols.split(", "):
+            items.extend(patterns[item].split(", ") if item in patterns else [item])
+        schema[table] = dict(re.match(r"([^:]+):(\S+)", item).groups() for item in items)
+    return schema
+
+
+def _schema(n_tables: int) -> dict:
+    return {
+        f"t{i}": {"columns": {
+            "id": {"original_type": "INTEGER", "stats": {}},
+            "name": {"original_type": "TEXT", "stats": {}},
+        }}
+        for i in range(n_tables)
+    }
+
+
+@pytest.fixture
+def llm(monkeypatch, tmp_path):
+    """A scripted model behind the node, with groups of 2 and 4 calls at once."""
+    fake = ScriptedLLM(delay_s=0.05)
+    monkeypatch.setattr(enrichment_node, "_build_llm", lambda: fake)
+    monkeypatch.setattr(enrichment_node, "enrichment_cache", EnrichmentCache(tmp_path / "enrichment_cache"))
+    monkeypatch.setattr(AppConfig, "ENRICH_GROUP_SIZE", 2)
+    monkeypatch.setattr(AppConfig, "ENRICH_CONCURRENCY", 4)
+    return fake
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  GROUPING
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestGrouping:
+    """Tables are split into fixed-size groups in schema order."""
+
+    def test_groups(self):
+        assert _table_groups(_schema(5), 2) == [["t0", "t1"], ["t2", "t3"], ["t4"]]
+
+    def test_group_size_floor(self):
+        assert _table_groups(_schema(2), 0) == [["t0"], ["t1"]]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  CONCURRENT ENRICHMENT
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestEnrichment:
+    """Groups run concurrently and merge into one schema_enriched."""
+
+    def test_groups_merge_and_pass_validation(self, llm):
+        raw = _schema(7)
+        out = enrich_metadata_node({"schema_raw": raw, "errors": []})
+        enriched = out["schema_enriched"]
+        assert list(enriched) == list(raw)
+        assert enriched["t5"]["columns"]["name"]["description"] == "t5.name"
+        assert enriched["t5"]["columns"]["name"]["original_type"] == "TEXT"
+        assert sorted(len(c) for c in llm.calls) == [1, 2, 2, 2]
+        assert validate_schema_node({"schema_raw": raw, "schema_enriched": enriched})["validation_status"] == "PASSED"
+
+    def test_calls_overlap_up_to_the_limit(self, llm, monkeypatch):
+        monkeypatch.setattr(AppConfig, "ENRICH_CONCURRENCY", 2)
+        enrich_metadata_node({"schema_raw": _schema(8), "errors": []})
+        assert llm.max_in_flight == 2
+
+    def test_malformed_table_only_loses_itself(self, llm, monkeypatch):
+        answer = (
+            '{"t0": {"columns": {"id": {"description": "a"}, "name": {"description": "b"}}},'
+            ' "t1": {"columns": {"id": {"description": "a" "name"}}}}'
+        )
+        monkeypatch.setattr(llm, "_answer", lambda messages: answer)
+        monkeypatch.setattr(AppConfig, "ENRICH_GROUP_SIZE", 4)
+        enriched = enrich_metadata_node({"schema_raw": _schema(2), "errors": []})["schema_enriched"]
+        assert list(enriched) == ["t0"]
+
+    def test_malformed_group_only_loses_its_tables(self, llm):
+        llm.broken = {"t2"}
+        raw = _schema(6)
+        enriched = enrich_metadata_node({"schema_raw": raw, "errors": []})["schema_enriched"]
+        assert set(enriched) == {"t0", "t1", "t4", "t5"}
+        result = validate_schema_node({"schema_raw": raw, "schema_enriched": enriched})
+        assert result["validation_status"] == "FAILED"
+
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  TARGETED RETRIES
+# ══════════════════════════════════════════════════════════════════════════
+
+def _enrich_until_passed(raw: dict) -> tuple:
+    """Run enrich -> validate until the gate passes, as the graph would."""
+    state = {"schema_raw": raw, "errors": [], "retry_count": 0}
+    while True:
+        state.update(enrich_metadata_node(state))
+        state.update(validate_schema_node(state))
+        if should_continue(state) != "retry":
+            return state
+
+
+class TestTargetedRetry:
+    """Validation defects drive retries that redo only what failed."""
+
+    def test_defects_name_tables_and_columns(self):
+        raw = _schema(3)
+        enriched = {
+            "t0": {"columns": {"id": {"description": "x"}, "name": {"description": "y"}, "ghost": {"description": "z"}}},
+            "t1": {"columns": {"id": {"description": "x"}, "name": {"description": None}}},
+        }
+        result = validate_schema_node({"schema_raw": raw, "schema_enriched": enriched})
+        assert result["validation_status"] == "FAILED"
+        assert result["defects"] == [
+            {"table": "t0", "kind": "extra_columns", "columns": ["ghost"]},
+            {"table": "t1", "kind": "undescribed_columns", "columns": ["name"]},
+            {"table": "t2", "kind": "missing_table", "columns": []},
+        ]
+        assert len(result["errors"]) == 3  # plus the table-count mismatch
+
+    def test_undescribed_columns_alone_pass(self, llm):
+        llm.skip = {("t3", "name")}
+        state = _enrich_until_passed(_schema(6))
+        assert state["validation_status"] == "PASSED"
+        assert state["retry_count"] == 0
+        assert state["errors"] == []
+        assert state["defects"] == [{"table": "t3", "kind": "undescribed_columns", "columns": ["name"]}]
+        assert len(llm.calls) == 3
+
+    def test_retry_also_redescribes_skipped_column(self, llm):
+        llm.skip = {("t3", "name")}
+        state = {"schema_raw": _schema(6), "errors": [], "retry_count": 0}
+        state.update(enrich_metadata_node(state))
+        state["schema_enriched"]["t1"]["columns"]["ghost"] = {"description": "made up"}
+        state.update(validate_schema_node(state))
+        assert state["validation_status"] == "FAILED"
+        assert len(state["errors"]) == 1
+        llm.calls.clear()
+        state.update(enrich_metadata_node(state))
+        # One call for the one column; the ghost is dropped without one
+        assert llm.calls == [["t3"]]
+        assert llm.prompts[-1] == {"t3": {"name": "str"}}
+        assert state["schema_enriched"]["t3"]["columns"]["name"]["description"] == "t3.name"
+        assert validate_schema_node(state)["defects"] == []
+
+    def test_retry_redoes_only_dropped_tables(self, llm):
+        llm.broken = {"t2"}
+        state = {"schema_raw": _schema(6), "errors": [], "retry_count": 0}
+        state.update(enrich_metadata_node(state))
+        state.update(validate_schema_node(state))
+        before = {t: state["schema_enriched"][t] for t in ("t0", "t4")}
+        llm.broken = set()
+        llm.calls.clear()
+        state.update(enrich_metadata_node(state))
+        assert llm.calls == [["t2", "t3"]]
+        assert validate_schema_node(state)["validation_status"] == "PASSED"
+        assert all(state["schema_enriched"][t] == before[t] for t in before)
+
+    def test_hallucinated_columns_dropped_without_llm(self, llm):
+        raw = _schema(2)
+        state = {"schema_raw": raw, "errors": [], "retry_count": 0}
+        state.update(enrich_metadata_node(state))
+        state["schema_enriched"]["t1"]["columns"]["ghost"] = {"description": "made up"}
+        state.update(validate_schema_node(state))
+        llm.calls.clear()
+        state.update(enrich_metadata_node(state))
+        assert llm.calls == []
+        assert validate_schema_node(state)["validation_status"] == "PASSED"
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  PER-TABLE CACHE
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestEnrichmentReuse:
+    """Unchanged tables come from the per-table cache on later runs."""
+
+    def test_unchanged_schema_makes_no_calls(self, llm):
+        raw = _schema(3)
+        first = enrich_metadata_node({"schema_raw": raw, "errors": []})
+        llm.calls.clear()
+        second = enrich_metadata_node({"schema_raw": raw, "errors": []})
+        assert llm.calls == []
+        assert second["schema_enriched"] == first["schema_enriched"]
+
+    def test_only_changed_tables_are_enriched(self, llm):
+        raw = _schema(5)
+        enrich_metadata_node({"schema_raw": raw, "errors": []})
+        llm.calls.clear()
+        raw["t3"]["columns"]["name"]["original_type"] = "VARCHAR(40)"
+        raw["t4"]["columns"]["email"] = {"original_type": "TEXT", "stats": {}}
+        out = enrich_metadata_node({"schema_raw": raw, "errors": []})
+        assert llm.calls == [["t3", "t4"]]
+        assert list(out["schema_enriched"]) == list(raw)
+
+    def test_stats_come_from_the_current_run(self, llm):
+        raw = _schema(1)
+        enrich_metadata_node({"schema_raw": raw, "errors": []})
+        raw["t0"]["columns"]["id"]["stats"] = {"null_count": 7}
+        out = enrich_metadata_node({"schema_raw": raw, "errors": []})
+        assert out["schema_enriched"]["t0"]["columns"]["id"]["stats"] == {"null_count": 7}
+        assert out["schema_enriched"]["t0"]["columns"]["id"]["description"] == "t0.id"
+
+    def test_incomplete_tables_are_not_cached(self, llm):
+        llm.broken = {"t2"}
+        llm.skip = {("t0", "name")}
+        enrich_metadata_node({"schema_raw": _schema(4), "errors": []})
+        assert enrichment_node.enrichment_cache.stats()["entries"] == 1  # t1 only
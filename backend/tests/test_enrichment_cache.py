@@ -0,0 +1,110 @@
+"""
+Unit tests for the per-table enrichment cache.
+
+JUSTIFICATION:
+- Real files under tmp_path: atomic writes, LRU eviction by mtime and
+  corrupt-entry handling are filesystem behaviour worth testing directly.
+
+Run with:
+    pytest backend/tests/test_enrichment_cache.py -v
+"""
+import os
+import threading
+import pytest
+
+from backend.services.enrichment_cache import EnrichmentCache, table_key
+
+
+def _table(**types) -> dict:
+    return {"columns": {c: {"original_type": t, "stats": {"null_count": 1}} for c, t in types.items()}}
+
+
+def _described(table: dict) -> dict:
+    return {c: {"description": f"about {c}", "tags": [], "stats": {"null_count": 1}} for c in table["columns"]}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EnrichmentCache(tmp_path / "enrichment_cache")
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  KEYS
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestTableKey:
+    """The key covers table name, column names and types, and the model."""
+
+    def test_column_order_does_not_matter(self):
+        assert table_key("t", _table(a="INT", b="TEXT"), "m") == table_key("t", _table(b="TEXT", a="INT"), "m")
+
+    def test_stats_do_not_matter(self):
+        changed = _table(a="INT")
+        changed["columns"]["a"]["stats"] = {"null_count": 99}
+        assert table_key("t", changed, "m") == table_key("t", _table(a="INT"), "m")
+
+    @pytest.mark.parametrize("name, table, model", [
+        ("u", _table(a="INT"), "m"),
+        ("t", _table(a="BIGINT"), "m"),
+        ("t", _table(a="INT", b="TEXT"), "m"),
+        ("t", _table(a="INT"), "m2"),
+    ])
+    def test_content_changes_the_key(self, name, table, model):
+        assert table_key(name, table, model) != table_key("t", _table(a="INT"), "m")
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  STORE
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestEnrichmentCache:
+    """Round trips, counters, eviction and concurrent writers."""
+
+    def test_round_trip_keeps_only_enriched_fields(self, cache):
+        table = _table(a="INT")
+        cache.put("k1", "t", _described(table))
+        assert cache.get("k1") == {"a": {"description": "about a", "tags": []}}
+
+    def test_hit_and_miss_counters(self, cache):
+        cache.put("k1", "t", _described(_table(a="INT")))
+        cache.get("k1")
+        cache.get("k2")
+        cache.get("k1")
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (2, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        cache.put("k1", "t", _described(_table(a="INT")))
+        (cache.directory / "k1.json").write_text("{not json")
+        assert cache.get("k1") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = EnrichmentCache(tmp_path / "c", max_bytes=10_000)
+        columns = _described(_table(**{f"col_{i}": "TEXT" for i in range(40)}))
+        for i in range(3):
+            cache.put(f"k{i}", "t", columns)
+            os.utime(cache.directory / f"k{i}.json", (1000 + i, 1000 + i))
+        cache.get("k0")  # k0 is now the most recent
+        size = (cache.directory / "k0.json").stat().st_size
+        cache.max_bytes = 3 * size
+        cache.put("k3", "t", columns)
+        assert cache.get("k1") is None
+        assert cache.get("k0") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+    def test_concurrent_writers_leave_whole_entries(self, cache):
+        payloads = [_described(_table(**{f"c{i}_{j}": "INT" for j in range(20)})) for i in range(8)]
+
+        def write(i):
+            for _ in range(10):
+                cache.put("shared", "t", payloads[i])
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert cache.get("shared") in [{c: {"description": m["description"], "tags": []} for c, m in p.items()} for p in payloads]
+        assert list(cache.directory.glob("*.tmp")) == []
@@ -0,0 +1,158 @@
+"""
+Unit tests for the Parquet / CSV file connector.
+
+JUSTIFICATION:
+- Files are written under tmp_path and profiled for real; the same rows
+  loaded into SQLite give the reference stats, so both connectors must agree.
+- Parquet tests need pyarrow and are skipped where it is not installed.
+
+Run with:
+    pytest backend/tests/test_file_connector.py -v
+"""
+import sqlite3
+import pytest
+import pandas as pd
+
+from backend.connectors.file_connector import FileConnector, file_path, is_file_source
+from backend.connectors.sql_connector import SQLConnector
+from backend.connectors.profile_store import ProfileStore
+from backend.connectors.engine_registry import EngineRegistry
+
+
+def _orders() -> pd.DataFrame:
+    """500 rows: a key, a nullable amount, a low-cardinality status with NULLs."""
+    return pd.DataFrame({
+        "order_id": range(1, 501),
+        "amount": [None if i % 10 == 0 else round(i * 1.25, 2) for i in range(500)],
+        "status": [None if i % 7 == 0 else ["new", "paid", "shipped"][i % 3] for i in range(500)],
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    """An isolated profile store so tests never touch data/."""
+    return ProfileStore(tmp_path / "profile_store")
+
+
+@pytest.fixture
+def lake(tmp_path):
+    """A directory holding orders.csv, plus the same rows in SQLite for reference."""
+    lake_dir = tmp_path / "lake"
+    lake_dir.mkdir()
+    frame = _orders()
+    frame.to_csv(lake_dir / "orders.csv", index=False)
+    (lake_dir / "notes.txt").write_text("not a table")
+    con = sqlite3.connect(tmp_path / "ref.db")
+    frame.to_sql("orders", con, index=False)
+    con.close()
+    return lake_dir, f"sqlite:///{tmp_path / 'ref.db'}"
+
+
+def _core(stats):
+    return {k: stats[k] for k in ("null_count", "unique_count", "min_value", "max_value", "mean_value")}
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  SOURCES
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestSources:
+    """file:// connection strings and table discovery."""
+
+    def test_file_urls(self):
+        assert is_file_source("file:///data/lake")
+        assert not is_file_source("sqlite:///data/demo.db")
+        assert str(file_path("file:///data/lake")) == "/data/lake"
+
+    def test_only_table_files_are_tables(self, lake, store):
+        lake_dir, _ = lake
+        schema = FileConnector(f"file://{lake_dir}", store=store).get_live_schema()
+        assert list(schema) == ["orders"]
+
+    def test_missing_source(self, tmp_path, store):
+        with pytest.raises(FileNotFoundError):
+            FileConnector(f"file://{tmp_path / 'nope'}", store=store).get_live_schema()
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  CSV
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestCSV:
+    """Chunked CSV profiles match the SQL connector's over the same rows."""
+
+    def test_matches_sql_connector(self, lake, store):
+        lake_dir, ref_url = lake
+        table = FileConnector(f"file://{lake_dir}", store=store, chunk_rows=64).get_live_schema()["orders"]
+        ref = SQLConnector(ref_url, store=store, registry=EngineRegistry()).get_live_schema()["orders"]
+        assert table["row_count"] == ref["row_count"] == 500
+        for col in ("order_id", "amount", "status"):
+            assert _core(table["columns"][col]["stats"]) == _core(ref["columns"][col]["stats"])
+        assert table["columns"]["order_id"]["original_type"] == "int64"
+        assert table["columns"]["status"]["original_type"] == "string"
+        assert table["profile_plan"]["strategy"] == "full"
+
+    def test_chunk_size_does_not_change_stats(self, lake, store):
+        lake_dir, _ = lake
+        small = FileConnector(f"file://{lake_dir}", store=store, chunk_rows=7).get_live_schema()
+        whole = FileConnector(f"file://{lake_dir}", store=store, chunk_rows=10_000).get_live_schema()
+        for col in ("order_id", "amount", "status"):
+            assert _core(small["orders"]["columns"][col]["stats"]) == _core(whole["orders"]["columns"][col]["stats"])
+
+    def test_unchanged_files_are_reused(self, lake, store):
+        lake_dir, _ = lake
+        first = FileConnector(f"file://{lake_dir}", store=store, incremental=True)
+        first.get_live_schema()
+        second = FileConnector(f"file://{lake_dir}", store=store, incremental=True)
+        schema = second.get_live_schema()
+        assert second.last_run_stats["tables_reused"] == 1
+        assert schema["orders"]["profile_plan"]["strategy"] == "reuse"
+
+    def test_changed_options_rescan(self, lake, store):
+        lake_dir, _ = lake
+        FileConnector(f"file://{lake_dir}", store=store, incremental=True).get_live_schema()
+        second = FileConnector(f"file://{lake_dir}", store=store, incremental=True, distributions=True)
+        schema = second.get_live_schema()
+        assert second.last_run_stats["tables_reused"] == 0
+        assert schema["orders"]["profile_plan"]["strategy"] != "reuse"
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  PARQUET
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestParquet:
+    """Memory-mapped Parquet reads, footer statistics and row-group sampling."""
+
+    @pytest.fixture(autouse=True)
+    def _pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def _write(self, path, row_group_size):
+        _orders().to_parquet(path, index=False, row_group_size=row_group_size)
+
+    def test_matches_sql_connector(self, lake, store):
+        lake_dir, ref_url = lake
+        (lake_dir / "orders.csv").unlink()
+        self._write(lake_dir / "orders.parquet", 100)
+        table = FileConnector(f"file://{lake_dir}", store=store).get_live_schema()["orders"]
+        ref = SQLConnector(ref_url, store=store, registry=EngineRegistry()).get_live_schema()["orders"]
+        for col in ("order_id", "amount", "status"):
+            assert _core(table["columns"][col]["stats"]) == _core(ref["columns"][col]["stats"])
+        assert table["profile_plan"]["estimate_source"] == "footer"
+
+    def test_sampled_row_groups_keep_footer_stats_exact(self, tmp_path, store):
+        self._write(tmp_path / "orders.parquet", 50)
+        connector = FileConnector(
+            f"file://{tmp_path / 'orders.parquet'}", store=store, sample_threshold=100, sample_rows=100
+        )
+        table = connector.get_live_schema()["orders"]
+        amount = table["columns"]["amount"]["stats"]
+        assert table["profile_strategy"] == "sample"
+        assert table["row_count"] == 500
+        assert amount["is_estimate"]
+        assert amount["sample_fraction"] == pytest.approx(0.2)
+        # From the footer: exact for the whole file, not just the sample
+        assert amount["null_count"] == 50
+        assert amount["min_value"] == 1.25
+        assert amount["max_value"] == 623.75
@@ -0,0 +1,181 @@
+"""
+Unit tests for the query governor.
+
+JUSTIFICATION:
+- Concurrency caps, token buckets and AIMD backoff are pure in-process
+  logic, so they are tested directly with threads and synthetic latencies.
+- The engine hooks and read-only sessions run against a throwaway SQLite
+  database under tmp_path.
+
+Run with:
+    pytest backend/tests/test_governor.py -v
+"""
+import time
+import sqlite3
+import importlib.util
+import threading
+import pytest
+import sqlalchemy.util
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from backend.connectors.governor import QueryGovernor, GovernorRegistry, TokenBucket
+from backend.connectors.sql_connector import SQLConnector
+from backend.connectors.profile_store import ProfileStore
+from backend.connectors.engine_registry import EngineRegistry
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    path = tmp_path / "gov.db"
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    con.executemany("INSERT INTO t VALUES (?, ?)", [(i, f"v{i}") for i in range(100)])
+    con.commit()
+    con.close()
+    return f"sqlite:///{path}"
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  LIMITS
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestLimits:
+    """Concurrency caps and rate budgets."""
+
+    def test_slot_caps_concurrency(self):
+        governor = QueryGovernor(max_concurrent=2, adaptive=False)
+        peak, active, lock = [0], [0], threading.Lock()
+
+        def work():
+            with governor.slot():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak[0] == 2
+
+    def test_try_acquire_never_blocks(self):
+        governor = QueryGovernor(max_concurrent=1, adaptive=False)
+        assert governor.try_acquire()
+        assert not governor.try_acquire()
+        governor.release()
+        assert governor.try_acquire()
+        assert governor.stats()["active"] == 1
+
+    def test_token_bucket_goes_into_debt(self):
+        bucket = TokenBucket(rate=100)
+        assert bucket.take(100) == 0.0
+        assert bucket.take(50) == pytest.approx(0.5, abs=0.05)
+
+    def test_rows_budget_throttles(self):
+        governor = QueryGovernor(max_rows_per_s=1000, adaptive=False)
+        started = time.monotonic()
+        governor.charge_rows(1000)
+        governor.charge_rows(200)
+        assert time.monotonic() - started >= 0.15
+        assert governor.stats()["throttled_s"] > 0
+
+    def test_registry_keeps_learned_limit_until_limits_change(self):
+        registry = GovernorRegistry()
+        governor = registry.get("src", max_concurrent=8)
+        governor.limit = 2
+        assert registry.get("src", max_concurrent=8) is governor
+        assert governor.limit == 2
+        registry.get("src", max_concurrent=4)
+        assert governor.limit == 4
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  ADAPTIVE BACKOFF
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestBackoff:
+    """Concurrency halves on latency spikes and recovers one step at a time."""
+
+    def test_latency_spike_halves_then_recovers(self):
+        governor = QueryGovernor(max_concurrent=8, recover_after=5, cooldown_s=0)
+        for _ in range(20):
+            governor.observe(0.1)
+        for _ in range(3):
+            governor.observe(2.0)
+        assert governor.limit < 8
+        assert governor.backoffs >= 1
+
+        lowered = governor.limit
+        for _ in range(200):
+            governor.observe(0.1)
+        assert governor.limit > lowered
+
+    def test_heavier_queries_are_not_contention(self):
+        governor = QueryGovernor(max_concurrent=16, cooldown_s=0)
+        # One run's statements: cheap lookups, then ever larger table scans
+        for i in range(30):
+            governor.observe(0.01, f"lookup {i}")
+        for i, latency in enumerate([0.5, 1.0, 2.0, 4.0, 8.0]):
+            governor.observe(latency, f"scan t{i}")
+        assert governor.limit == 16
+        # The same scan taking far longer than before is a slowdown
+        for _ in range(3):
+            governor.observe(40.0, "scan t4")
+        assert governor.limit < 16
+
+    def test_fast_queries_never_back_off(self):
+        governor = QueryGovernor(max_concurrent=4, cooldown_s=0)
+        for latency in [0.001, 0.02, 0.001, 0.03] * 10:
+            governor.observe(latency)
+        assert governor.limit == 4
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  CONNECTOR INTEGRATION
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestConnector:
+    """Every statement passes the governor; sessions are read-only."""
+
+    def test_statements_are_counted(self, sqlite_db, tmp_path):
+        connector = SQLConnector(
+            sqlite_db, store=ProfileStore(tmp_path / "profile_store"),
+            registry=EngineRegistry(), governors=GovernorRegistry(),
+        )
+        connector.get_live_schema()
+        stats = connector.last_run_stats["governor"]
+        assert stats["queries"] > 0
+        assert stats["active"] == 0
+
+    def test_sessions_are_read_only(self, sqlite_db, tmp_path):
+        connector = SQLConnector(
+            sqlite_db, store=ProfileStore(tmp_path / "profile_store"),
+            registry=EngineRegistry(), governors=GovernorRegistry(),
+        )
+        with pytest.raises(OperationalError):
+            with connector.engine.connect() as conn:
+                conn.execute(text("DELETE FROM t"))
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  COMPATIBILITY
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestCompatibility:
+    """The governor imports on every SQLAlchemy the requirements allow."""
+
+    def test_imports_on_sqlalchemy_2_0(self, monkeypatch):
+        # 2.0 has await_only but not its 2.1 name, await_
+        monkeypatch.setattr(sqlalchemy.util, "await_only", lambda awaitable: None, raising=False)
+        monkeypatch.delattr(sqlalchemy.util, "await_", raising=False)
+        path = importlib.util.find_spec("backend.connectors.governor").origin
+        spec = importlib.util.spec_from_file_location("governor_sa20", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        assert module.await_ is sqlalchemy.util.await_only
+        module._sleep(0)  # outside a greenlet: plain time.sleep
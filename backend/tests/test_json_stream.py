@@ -0,0 +1,103 @@
+"""
+Unit tests for the incremental JSON parser used on streamed enrichment output.
+
+JUSTIFICATION:
+- Output is fed in small and single-character chunks to prove tables are
+  emitted as soon as they close, whatever the chunk boundaries.
+- Malformed, fenced and truncated answers cover what models actually send.
+
+Run with:
+    pytest backend/tests/test_json_stream.py -v
+"""
+import json
+import pytest
+
+from backend.core.json_stream import TableStreamParser
+
+
+ANSWER = {
+    "orders": {"columns": {"id": {"description": "Order key {primary}"}}},
+    "users": {"columns": {"email": {"description": "Quoted \"}\" text", "tags": ["PII"]}}},
+}
+
+
+def _feed_all(text: str, size: int) -> tuple:
+    parser = TableStreamParser()
+    tables = []
+    for i in range(0, len(text), size):
+        tables.extend(parser.feed(text[i:i + size]))
+    parser.close()
+    return parser, tables
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  WELL-FORMED OUTPUT
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestStreaming:
+    """Tables come out whole, in order, at any chunk size."""
+
+    @pytest.mark.parametrize("size", [1, 7, 10_000])
+    def test_any_chunking(self, size):
+        parser, tables = _feed_all(json.dumps(ANSWER, indent=2), size)
+        assert dict(tables) == ANSWER
+        assert parser.errors == []
+        assert parser.done
+
+    def test_table_emitted_before_answer_ends(self):
+        text = json.dumps(ANSWER)
+        cut = text.index('"users"')
+        parser = TableStreamParser()
+        assert parser.feed(text[:cut]) == [("orders", ANSWER["orders"])]
+        assert parser.feed(text[cut:]) == [("users", ANSWER["users"])]
+
+    def test_markdown_fence_and_prose(self):
+        text = "Here you go:\n```json\n" + json.dumps(ANSWER) + "\n```\nDone."
+        parser, tables = _feed_all(text, 5)
+        assert dict(tables) == ANSWER
+        assert parser.errors == []
+
+    def test_list_of_tables(self):
+        text = json.dumps([{"orders": ANSWER["orders"]}, {"users": ANSWER["users"]}])
+        _, tables = _feed_all(text, 9)
+        assert dict(tables) == ANSWER
+
+    def test_non_object_members_are_skipped(self):
+        text = '{"note": "ignore {me}", "count": 2, "orders": {"columns": {}}}'
+        _, tables = _feed_all(text, 3)
+        assert tables == [("orders", {"columns": {}})]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  DAMAGED OUTPUT
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestDamagedOutput:
+    """Damage costs only the tables it touches."""
+
+    def test_malformed_table_keeps_neighbours(self):
+        text = (
+            '{"orders": {"columns": {"id": {"description": "ok"}}},'
+            ' "broken": {"columns": {"x": {"description": "missing comma" "tags": []}}},'
+            ' "users": {"columns": {}}}'
+        )
+        parser, tables = _feed_all(text, 4)
+        assert [t for t, _ in tables] == ["orders", "users"]
+        assert len(parser.errors) == 1 and "'broken'" in parser.errors[0]
+
+    def test_truncated_output_keeps_finished_tables(self):
+        text = json.dumps(ANSWER)
+        parser, tables = _feed_all(text[: text.index('"users"') + 20], 6)
+        assert tables == [("orders", ANSWER["orders"])]
+        assert not parser.done
+        assert parser.errors == ["Model output ended before the JSON object was closed."]
+
+    def test_no_json(self):
+        parser, tables = _feed_all("I cannot help with that.", 4)
+        assert tables == []
+        assert parser.errors == ["No JSON object found in the model output."]
+
+    def test_trailing_text_after_close_is_ignored(self):
+        parser, tables = _feed_all(json.dumps(ANSWER) + ' {"extra": {}}', 8)
+        assert dict(tables) == ANSWER
+        assert parser.feed('{"more": {}}') == []
@@ -0,0 +1,76 @@
+"""
+Unit tests for the profiling planner.
+
+JUSTIFICATION:
+- The planner is pure: row estimates in, a strategy per table out, so the
+  budget rules are tested directly without a database.
+
+Run with:
+    pytest backend/tests/test_planner.py -v
+"""
+from backend.connectors.planner import plan_profiles
+
+
+def _plan(estimates, budget=None, catalog_ready=(), prefer_catalog=False, names=None):
+    return plan_profiles(
+        names or list(estimates),
+        {t: n for t, n in estimates.items() if n is not None},
+        {t: "catalog" for t in estimates},
+        set(catalog_ready),
+        prefer_catalog=prefer_catalog,
+        sample_threshold=1_000_000,
+        sample_rows=1_000,
+        partition_threshold=100_000,
+        row_budget=budget,
+    )
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  STRATEGIES
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestStrategies:
+    """Without a budget the thresholds alone decide."""
+
+    def test_size_thresholds(self):
+        plans = _plan({"small": 10, "big": 500_000, "huge": 5_000_000})
+        assert plans["small"]["strategy"] == "full"
+        assert plans["big"]["strategy"] == "partitioned"
+        assert plans["huge"]["strategy"] == "sample"
+        assert plans["huge"]["budgeted_rows"] == 1_000
+
+    def test_unknown_size_is_full_and_uncharged(self):
+        plans = _plan({"mystery": None})
+        assert plans["mystery"]["strategy"] == "full"
+        assert plans["mystery"]["estimated_rows"] is None
+        assert plans["mystery"]["budgeted_rows"] == 0
+
+    def test_metadata_mode_prefers_fresh_catalog_stats(self):
+        plans = _plan({"a": 10, "b": 10}, catalog_ready={"a"}, prefer_catalog=True)
+        assert plans["a"]["strategy"] == "catalog"
+        assert plans["b"]["strategy"] == "full"
+
+    def test_output_keeps_input_order(self):
+        assert list(_plan({"z": 50, "a": 5, "m": 20})) == ["z", "a", "m"]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  ROW BUDGET
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestRowBudget:
+    """Smallest tables are scanned first; the rest degrade step by step."""
+
+    def test_small_tables_get_full_scans_first(self):
+        plans = _plan({"big": 50_000, "a": 100, "b": 200}, budget=10_000)
+        assert plans["a"]["strategy"] == "full"
+        assert plans["b"]["strategy"] == "full"
+        assert plans["big"]["strategy"] == "sample"
+        assert sum(p["budgeted_rows"] for p in plans.values()) <= 10_000
+
+    def test_catalog_then_structure_when_exhausted(self):
+        plans = _plan({"a": 900, "b": 5_000, "c": 6_000}, budget=1_500, catalog_ready={"c"})
+        assert plans["a"]["strategy"] == "full"
+        assert plans["b"]["strategy"] == "none"
+        assert plans["c"]["strategy"] == "catalog"
+        assert "exhausted" in plans["b"]["reason"]
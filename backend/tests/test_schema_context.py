@@ -0,0 +1,124 @@
+"""
+Unit tests for the shared, token-budgeted schema context builder.
+
+JUSTIFICATION:
+- The encoding is what every Gemini prompt sees, so its guarantees are
+  pinned here: every column present, keys and relationships kept, detail
+  added strictly within the budget, and a real saving over raw JSON.
+
+Run with:
+    pytest backend/tests/test_schema_context.py -v
+"""
+import json
+import pytest
+
+from backend.core.schema_context import abbreviate_type, build_schema_context, estimate_tokens
+
+
+def _col(type_, tags=(), description=None, stats=None, pii=False):
+    return {
+        "original_type": type_, "tags": list(tags), "description": description,
+        "business_logic": None, "potential_pii": pii, "stats": stats,
+    }
+
+
+def _stats(nulls, distinct, lo=None, hi=None, samples=()):
+    return {"null_percentage": nulls, "unique_count": distinct, "min_value": lo,
+            "max_value": hi, "sample_values": list(samples)}
+
+
+@pytest.fixture
+def schema():
+    audit = {
+        "created_at": _col("TIMESTAMP", stats=_stats(0, 900)),
+        "updated_at": _col("TIMESTAMP", stats=_stats(12.5, 880)),
+    }
+    return {
+        "customers": {
+            "row_count": 1000, "health_score": 97.0, "foreign_keys": [],
+            "columns": {
+                "customer_id": _col("INTEGER", tags=["PK"], stats=_stats(0, 1000, 1, 1000)),
+                "email": _col("VARCHAR(255)", description="Login email", pii=True,
+                              stats=_stats(0, 1000, samples=["a@x.io", "b@y.io"])),
+                **audit,
+            },
+        },
+        "orders": {
+            "row_count": 5000, "health_score": 88.4, "row_count_estimated": True,
+            "foreign_keys": [{"column": "customer_id", "referred_table": "customers",
+                              "referred_column": "customer_id"}],
+            "columns": {
+                "order_id": _col("BIGINT", tags=["PK"]),
+                "customer_id": _col("INTEGER", tags=["FK"]),
+                "total": _col("NUMERIC(10, 2)", stats=_stats(0.2, 4100, 1.5, 999.99)),
+                **audit,
+            },
+        },
+    }
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  ENCODING
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestEncoding:
+    """Abbreviated types, table codes and shared column patterns."""
+
+    @pytest.mark.parametrize("raw, short", [
+        ("INTEGER", "int"), ("BIGINT", "bigint"), ("VARCHAR(255)", "str(255)"), ("TEXT", "str"),
+        ("NUMERIC(10, 2)", "dec(10,2)"), ("TIMESTAMP WITHOUT TIME ZONE", "ts"),
+        ("TIMESTAMP WITH TIME ZONE", "tstz"), ("BOOLEAN", "bool"), ("float64", "float"),
+        ("int64", "bigint"), ("string", "str"), ("INTERVAL", "interval"),
+    ])
+    def test_abbreviate_type(self, raw, short):
+        assert abbreviate_type(raw) == short
+
+    def test_structure(self, schema):
+        text = build_schema_context(schema, 10_000, tiers=())
+        assert "@P1 = created_at:ts, updated_at:ts" in text
+        assert "T1 customers\n  customer_id:int PK, email:str(255) PII, @P1" in text
+        assert "T2 orders\n  order_id:bigint PK, customer_id:int->T1.customer_id, total:dec(10,2), @P1" in text
+
+    def test_table_stats(self, schema):
+        text = build_schema_context(schema, 10_000, table_stats=True, tiers=())
+        assert "T1 customers rows=1,000 health=97" in text
+        assert "T2 orders rows=~5,000 health=88" in text
+
+    def test_column_subset(self, schema):
+        text = build_schema_context(schema, 10_000, columns={"orders": ["total"]}, tiers=())
+        assert "T2 orders\n  total:dec(10,2)\n" in text + "\n"
+        assert "order_id" not in text
+
+    def test_smaller_than_json(self, schema):
+        text = build_schema_context(schema, 10_000)
+        assert estimate_tokens(text) < estimate_tokens(json.dumps(schema)) / 2
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  BUDGET
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestBudget:
+    """Hints are added tier by tier, only while they fit."""
+
+    def test_tight_budget_keeps_every_column(self, schema):
+        text = build_schema_context(schema, 1)
+        for table in schema.values():
+            for col in table["columns"]:
+                assert col in text
+        assert "\n  ." not in text  # no hint lines
+
+    def test_roomy_budget_has_all_tiers(self, schema):
+        text = build_schema_context(schema, 10_000)
+        assert "  .email: Login email; nulls 0%, 1000 distinct; e.g. a@x.io, b@y.io" in text
+        assert "  .total: nulls 0.2%, 4100 distinct, range 1.5..999.99" in text
+
+    def test_detail_stays_within_budget(self, schema):
+        base = estimate_tokens(build_schema_context(schema, 1))
+        full = estimate_tokens(build_schema_context(schema, 10_000))
+        for budget in range(base, full + 1, 5):
+            text = build_schema_context(schema, budget)
+            # The builder's running estimate is per line; allow line-join rounding
+            assert estimate_tokens(text) <= budget + len(text.splitlines())
+        middle = build_schema_context(schema, (base + full) // 2)
+        assert "Login email" in middle and "e.g." not in middle
@@ -0,0 +1,93 @@
+"""
+Unit tests for the mergeable profiling sketches.
+
+Run with:
+    pytest backend/tests/test_sketches.py -v
+"""
+import numpy as np
+
+from backend.connectors.sketches import HyperLogLog, KLLSketch, MisraGries, ColumnDistribution, render_sample
+
+
+class TestHyperLogLog:
+    """Cardinality estimates stay within a few standard errors and merge."""
+
+    def test_estimate_within_error(self):
+        sketch = HyperLogLog(p=12)
+        sketch.add_values(range(100_000))
+        assert abs(sketch.count() - 100_000) / 100_000 < 0.05
+
+    def test_small_cardinalities_are_exact_enough(self):
+        sketch = HyperLogLog()
+        sketch.add_values(["a", "b", "c", None, "a"])
+        assert sketch.count() == 3
+
+    def test_merge_equals_union(self):
+        left, right = HyperLogLog(), HyperLogLog()
+        left.add_values(range(0, 30_000))
+        right.add_values(range(20_000, 50_000))
+        merged = left.merge(right).count()
+        assert abs(merged - 50_000) / 50_000 < 0.05
+
+    def test_round_trip_serialization(self):
+        sketch = HyperLogLog()
+        sketch.add_values([b"\x00\x01", "x", 3.5])
+        restored = HyperLogLog.from_dict(sketch.to_dict())
+        assert restored.count() == sketch.count()
+        assert (restored.registers == sketch.registers).all()
+
+
+class TestKLLSketch:
+    """Quantiles stay within the rank error bound and survive merges."""
+
+    def test_quantiles_within_rank_error(self):
+        sketch = KLLSketch(k=200)
+        for start in range(0, 100_000, 10_000):
+            sketch.add_array(np.arange(start, start + 10_000, dtype=float))
+        assert sketch.n == 100_000
+        for q in (0.05, 0.5, 0.95):
+            assert abs(sketch.quantile(q) - q * 100_000) < 0.02 * 100_000
+        assert sketch.min == 0 and sketch.max == 99_999
+
+    def test_merge_and_round_trip(self):
+        left, right = KLLSketch(), KLLSketch()
+        left.add_array(np.arange(0, 50_000, dtype=float))
+        right.add_array(np.arange(50_000, 100_000, dtype=float))
+        merged = KLLSketch.from_dict(left.merge(right).to_dict())
+        assert merged.n == 100_000
+        assert abs(merged.quantile(0.5) - 50_000) < 2_000
+
+
+class TestMisraGries:
+    """Heavy hitters are always tracked; counts undercount by <= n / (k + 1)."""
+
+    def test_heavy_hitters_survive(self):
+        sketch = MisraGries(k=10)
+        values = ["hot"] * 3000 + ["warm"] * 1000 + [f"v{i}" for i in range(6000)]
+        for i in range(0, len(values), 1000):
+            sketch.add_values(values[i:i + 1000])
+        top = dict(sketch.top(2))
+        assert set(top) == {"hot", "warm"}
+        assert 3000 - 10_000 / 11 <= top["hot"] <= 3000
+
+    def test_column_distribution_summary(self):
+        dist = ColumnDistribution(numeric=False)
+        dist.add_values(["ab", "abcd", None, "ab"])
+        other = ColumnDistribution(numeric=False)
+        other.add_values(["x"])
+        summary = ColumnDistribution.from_dict(dist.merge(other).to_dict()).summary()
+        assert summary["top_values"][0] == {"value": "ab", "count": 2}
+        assert summary["length_stats"] == {"min": 1, "max": 4, "mean": 2.25}
+        assert summary["quantiles"] is None
+
+
+class TestRenderSample:
+    """Sample values display as the SQL engine's server-side text cast does."""
+
+    def test_nested_values_as_compact_json(self):
+        assert render_sample({"a": 47}, 256) == '{"a":47}'
+        assert render_sample([1, "x"], 256) == '[1,"x"]'
+
+    def test_binary_and_truncation(self):
+        assert render_sample(b"\x00\x01", 256) == "<binary, 2 bytes>"
+        assert render_sample("é" * 10, 5) == "éé…"
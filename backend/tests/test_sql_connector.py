@@ -0,0 +1,926 @@
+"""
+Integration tests for SQLConnector against a throwaway SQLite database.
+
+JUSTIFICATION:
+- SQLite ships with Python, so the connector's real SQL paths (reflection,
+  batched aggregates, sampling) run end-to-end without any external service.
+- Each test builds its own database under tmp_path, so tests stay isolated.
+- The PostgreSQL session test needs a server: it runs only when
+  TEST_POSTGRES_URL points at one.
+
+Run with:
+    pytest backend/tests/test_sql_connector.py -v
+"""
+import os
+import time
+import hashlib
+import random
+import sqlite3
+import threading
+import pytest
+from sqlalchemy import text, event
+from sqlalchemy.exc import OperationalError
+
+from backend.connectors.sql_connector import SQLConnector
+from backend.connectors.profile_store import ProfileStore
+from backend.connectors.engine_registry import EngineRegistry, normalize_url
+from backend.connectors.catalog_stats import catalog_profile, parse_pg_array
+from backend.connectors.timeouts import ProfileTimeout, is_timeout, rollback
+from backend.connectors.scheduler import pool_capacity
+
+
+# ─────────────────────────────── Fixtures ───────────────────────────────
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """A small two-table SQLite database with a PK, FK, UNIQUE and NULLs."""
+    path = tmp_path / "shop.db"
+    con = sqlite3.connect(path)
+    con.executescript(
+        """
+        CREATE TABLE customers (
+            id INTEGER PRIMARY KEY,
+            email TEXT UNIQUE,
+            city TEXT
+        );
+        CREATE TABLE orders (
+            id INTEGER PRIMARY KEY,
+            customer_id INTEGER REFERENCES customers(id),
+            amount REAL
+        );
+        """
+    )
+    con.executemany(
+        "INSERT INTO customers VALUES (?, ?, ?)",
+        [(i, f"user{i}@example.com", None if i % 4 == 0 else f"city{i % 3}") for i in range(1, 21)],
+    )
+    con.executemany(
+        "INSERT INTO orders VALUES (?, ?, ?)",
+        [(i, (i % 20) + 1, float(i) * 1.5) for i in range(1, 101)],
+    )
+    con.commit()
+    con.close()
+    return f"sqlite:///{path}"
+
+
+@pytest.fixture
+def large_db(tmp_path):
+    """One 5,000-row table: every 10th `note` is NULL, `grp` has 7 values."""
+    path = tmp_path / "events.db"
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, grp INTEGER, note TEXT)")
+    con.executemany(
+        "INSERT INTO events VALUES (?, ?, ?)",
+        [(i, i % 7, None if i % 10 == 0 else f"n{i}") for i in range(1, 5001)],
+    )
+    con.commit()
+    con.close()
+    return f"sqlite:///{path}"
+
+
+@pytest.fixture
+def store(tmp_path):
+    """An isolated profile store so tests never touch data/."""
+    return ProfileStore(tmp_path / "profile_store")
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  STRUCTURE
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestStructure:
+    """Catalog reflection produces the same structure in bulk and per table."""
+
+    def test_bulk_and_per_table_reflection_match(self, sqlite_db, store):
+        bulk = SQLConnector(sqlite_db, store=store).get_live_schema()
+        per_table = SQLConnector(sqlite_db, store=store, bulk_reflection=False).get_live_schema()
+        assert bulk == per_table
+
+    def test_constraints_are_tagged(self, sqlite_db, store):
+        schema = SQLConnector(sqlite_db, store=store).get_live_schema()
+        assert set(schema) == {"customers", "orders"}
+        assert schema["customers"]["columns"]["id"]["tags"] == ["PK"]
+        assert "UNIQUE" in schema["customers"]["columns"]["email"]["tags"]
+        assert schema["orders"]["foreign_keys"] == [
+            {"column": "customer_id", "referred_table": "customers", "referred_column": "id"}
+        ]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  PROFILING
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestProfiling:
+    """Statistics are computed from the bulk-reflected catalog."""
+
+    def test_full_profile_stats(self, sqlite_db, store):
+        schema = SQLConnector(sqlite_db, store=store).get_live_schema()
+        customers = schema["customers"]
+        assert customers["row_count"] == 20
+        city = customers["columns"]["city"]["stats"]
+        assert city["null_count"] == 5
+        assert city["null_percentage"] == 25.0
+        amount = schema["orders"]["columns"]["amount"]["stats"]
+        assert amount["min_value"] == 1.5
+        assert amount["max_value"] == 150.0
+        assert amount["is_estimate"] is False
+        assert customers["profile_strategy"] == "full"
+
+    def test_column_groups_match_single_query(self, sqlite_db, store):
+        single = SQLConnector(sqlite_db, store=store).get_live_schema()
+        grouped = SQLConnector(
+            sqlite_db, store=store, column_group_size=1, column_group_workers=3
+        ).get_live_schema()
+        assert grouped == single
+
+    def test_group_size_respects_dialect_limit(self, sqlite_db, store):
+        connector = SQLConnector(sqlite_db, store=store, column_group_size=10_000)
+        assert connector._column_group_size() == (2000 - 1) // 5
+
+    def test_large_table_is_sampled_with_bounds(self, large_db, store):
+        connector = SQLConnector(large_db, store=store, sample_threshold=1000, sample_rows=800)
+        events = connector.get_live_schema()["events"]
+        assert events["profile_strategy"] == "sample"
+        assert events["sample_method"] == "random_key_ranges"
+        assert events["row_count"] == 5000
+
+        note = events["columns"]["note"]["stats"]
+        assert note["is_estimate"] is True
+        assert 0 < note["sample_fraction"] < 1
+        assert note["null_percentage_margin"] > 0
+        assert abs(note["null_percentage"] - 10.0) <= note["null_percentage_margin"]
+        # Key-like columns scale up; low-cardinality ones do not
+        assert events["columns"]["id"]["stats"]["unique_count"] == 5000
+        assert events["columns"]["grp"]["stats"]["unique_count"] == 7
+        assert events["columns"]["grp"]["stats"]["unique_count_bounds"] == [7, 7]
+
+    @pytest.mark.parametrize("engine", ["sql", "vectorized"])
+    def test_sampled_distinct_is_extrapolated_within_bounds(self, tmp_path, store, engine):
+        path = tmp_path / "repeats.db"
+        con = sqlite3.connect(path)
+        con.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, code TEXT)")
+        # 2,000 codes, 10 rows each, in no key order: a sample sees only part of them
+        codes = [f"c{i % 2000}" for i in range(20000)]
+        random.Random(0).shuffle(codes)
+        con.executemany("INSERT INTO t VALUES (?, ?)", list(enumerate(codes)))
+        con.commit()
+        con.close()
+        connector = SQLConnector(
+            f"sqlite:///{path}", store=store, sample_threshold=1000, sample_rows=2000,
+            profile_engine=engine,
+        )
+        code = connector.get_live_schema()["t"]["columns"]["code"]["stats"]
+        low, high = code["unique_count_bounds"]
+        assert low < 2000 <= high
+        assert low <= code["unique_count"] <= high
+        assert abs(code["unique_count"] - 2000) / 2000 < 0.1
+
+    @pytest.mark.parametrize("engine", ["sql", "vectorized"])
+    def test_approx_distinct_uses_hyperloglog(self, large_db, store, engine):
+        connector = SQLConnector(large_db, store=store, distinct_mode="approx", profile_engine=engine)
+        events = connector.get_live_schema()["events"]
+        note = events["columns"]["note"]["stats"]
+        assert note["distinct_method"] == "hll"
+        assert note["is_estimate"] is True
+        assert abs(note["unique_count"] - 4500) / 4500 < 0.05
+        assert events["columns"]["grp"]["stats"]["unique_count"] == 7
+        assert set(connector.column_sketches["events"]) == {"id", "grp", "note"}
+
+    @pytest.mark.parametrize("engine", ["sql", "vectorized"])
+    def test_distributions_in_one_streamed_pass(self, large_db, store, engine):
+        connector = SQLConnector(large_db, store=store, distributions=True, profile_engine=engine)
+        cols = connector.get_live_schema()["events"]["columns"]
+        id_stats = cols["id"]["stats"]
+        assert abs(id_stats["quantiles"]["p50"] - 2500) < 100
+        assert sum(b["count"] for b in id_stats["histogram"]) == 5000
+        grp_top = cols["grp"]["stats"]["top_values"]
+        assert {t["value"] for t in grp_top} <= {str(g) for g in range(7)}
+        assert grp_top[0]["count"] in (714, 715)
+        # "note" is TEXT, a large-object type: lengths come from LENGTH()
+        note = cols["note"]["stats"]
+        assert (note["length_stats"]["min"], note["length_stats"]["max"]) == (2, 5)
+        assert note["quantiles"] is None
+
+    @pytest.mark.parametrize("options", [{"distributions": True}, {"distinct_mode": "approx"}])
+    def test_sketches_come_from_the_only_scan(self, large_db, store, monkeypatch, options):
+        connector = SQLConnector(large_db, store=store, profile_engine="sql", **options)
+        scans = []
+        run_vectorized = connector._run_vectorized
+
+        def counted(*args, **kwargs):
+            scans.append(args[0])
+            return run_vectorized(*args, **kwargs)
+
+        def no_second_pass(*args, **kwargs):
+            raise AssertionError("table scanned twice")
+
+        monkeypatch.setattr(connector, "_run_vectorized", counted)
+        monkeypatch.setattr(connector, "_run_aggregates", no_second_pass)
+        note = connector.get_live_schema()["events"]["columns"]["note"]["stats"]
+        assert len(scans) == 1
+        assert note["null_count"] == 500
+
+    def test_vectorized_engine_matches_sql_aggregates(self, sqlite_db, store):
+        def without_samples(schema):
+            for table in schema.values():
+                for col in table["columns"].values():
+                    col["stats"].pop("sample_values")
+            return schema
+
+        sql = SQLConnector(sqlite_db, store=store, profile_engine="sql").get_live_schema()
+        vectorized = SQLConnector(sqlite_db, store=store, profile_engine="vectorized")
+        assert vectorized._profile_engine() == "vectorized"
+        assert without_samples(vectorized.get_live_schema()) == without_samples(sql)
+        assert set(vectorized.column_accumulators) == {"customers", "orders"}
+
+    def test_auto_engine_is_sql_aggregates(self, sqlite_db, store):
+        assert SQLConnector(sqlite_db, store=store)._profile_engine() == "sql"
+
+    def test_json_samples_match_across_engines(self, tmp_path, store):
+        path = tmp_path / "docs.db"
+        con = sqlite3.connect(path)
+        con.execute("CREATE TABLE docs (id INTEGER PRIMARY KEY, doc JSON, tags JSON)")
+        con.executemany("INSERT INTO docs VALUES (?, ?, ?)", [(i, f'{{"a":{i}}}', "[1,2]") for i in range(5)])
+        con.commit()
+        con.close()
+        schemas = {
+            engine: SQLConnector(f"sqlite:///{path}", store=store, profile_engine=engine).get_live_schema()
+            for engine in ("sql", "vectorized")
+        }
+        for engine, schema in schemas.items():
+            doc = schema["docs"]["columns"]["doc"]["stats"]
+            assert set(doc["sample_values"]) <= {f'{{"a":{i}}}' for i in range(5)}, engine
+            assert doc["unique_count"] == 5
+            assert schema["docs"]["columns"]["tags"]["stats"]["sample_values"][0] == "[1,2]"
+
+    @pytest.mark.parametrize("engine", ["sql", "vectorized"])
+    def test_digested_large_objects_keep_real_samples(self, large_db, store, monkeypatch, engine):
+        # Stand in for a server with MD5(): SQLite plus an md5 UDF
+        monkeypatch.setattr(SQLConnector, "_SERVER_MD5", {"sqlite"})
+        connector = SQLConnector(
+            large_db, store=store, registry=EngineRegistry(), profile_engine=engine,
+            sqlite_fast_path=False, sqlite_processes=1, distributions=True,
+        )
+        event.listen(
+            connector.engine, "connect",
+            lambda dbapi_conn, _: dbapi_conn.create_function(
+                "md5", 1, lambda v: None if v is None else hashlib.md5(str(v).encode()).hexdigest()
+            ),
+        )
+        connector.engine.dispose()
+        note = connector.get_live_schema()["events"]["columns"]["note"]["stats"]
+        assert note["sample_values"]
+        assert all(v.startswith("n") for v in note["sample_values"])
+        assert note["unique_count"] == 4500
+        assert (note["length_stats"]["min"], note["length_stats"]["max"]) == (2, 5)
+
+    @pytest.mark.parametrize("engine", ["sql", "vectorized"])
+    def test_partitioned_profile_matches_single_scan(self, large_db, store, engine):
+        whole = SQLConnector(large_db, store=store, profile_engine=engine).get_live_schema()["events"]
+        connector = SQLConnector(
+            large_db, store=store, profile_engine=engine, partition_threshold=1000, partitions=3
+        )
+        sliced = connector.get_live_schema()["events"]
+        assert sliced["profile_strategy"] == "partitioned"
+        assert sliced["partition_method"] == "key_ranges"
+        assert sliced["row_count"] == 5000
+        for name, col in sliced["columns"].items():
+            stats, expected = col["stats"], whole["columns"][name]["stats"]
+            for key in ("null_count", "unique_count", "min_value", "max_value", "mean_value"):
+                assert stats[key] == expected[key], (name, key)
+        if engine == "vectorized":
+            assert sum(a.rows for a in connector.column_accumulators["events"].values()) == 5000 * 3
+
+    def test_partitioned_sql_engine_aggregates_server_side(self, large_db, store, monkeypatch):
+        connector = SQLConnector(
+            large_db, store=store, profile_engine="sql", partition_threshold=1000, partitions=3
+        )
+
+        def no_streaming(*args, **kwargs):
+            raise AssertionError("rows were streamed to the client")
+
+        monkeypatch.setattr(connector, "_run_vectorized", no_streaming)
+        events = connector.get_live_schema()["events"]
+        assert events["profile_strategy"] == "partitioned"
+        assert not events["profile_incomplete"]
+        assert events["columns"]["grp"]["stats"]["unique_count"] == 7
+        assert events["columns"]["id"]["stats"]["mean_value"] == 2500.5
+
+    def test_key_span_smaller_than_partitions_is_not_split(self, tmp_path, store):
+        path = tmp_path / "nokey.db"
+        con = sqlite3.connect(path)
+        con.execute("CREATE TABLE t (a TEXT)")
+        con.executemany("INSERT INTO t VALUES (?)", [(str(i),) for i in range(50)])
+        con.commit()
+        con.close()
+        # Split on rowid, but 50 keys cannot make 100 slices
+        connector = SQLConnector(f"sqlite:///{path}", store=store, partition_threshold=10, partitions=100)
+        assert connector.get_live_schema()["t"]["profile_strategy"] == "full"
+
+    @pytest.mark.parametrize("engine", ["sql", "vectorized"])
+    def test_samples_are_per_column_non_null_and_capped(self, tmp_path, store, engine):
+        path = tmp_path / "wide.db"
+        con = sqlite3.connect(path)
+        con.execute("CREATE TABLE docs (id INTEGER PRIMARY KEY, sparse TEXT, body TEXT, blob BLOB)")
+        con.executemany(
+            "INSERT INTO docs VALUES (?, ?, ?, ?)",
+            [(i, "rare" if i > 195 else None, "x" * 5000, b"\x00" * 64) for i in range(1, 201)],
+        )
+        con.commit()
+        con.close()
+
+        connector = SQLConnector(
+            f"sqlite:///{path}", store=store, profile_engine=engine, sample_values=2, sample_max_bytes=16
+        )
+        cols = connector.get_live_schema()["docs"]["columns"]
+        assert cols["sparse"]["stats"]["sample_values"] == ["rare", "rare"]
+        assert cols["body"]["stats"]["sample_values"][0] == "x" * 16 + "…"
+        assert cols["blob"]["stats"]["sample_values"][0] == "<binary, 64 bytes>"
+
+    def test_distributions_off_by_default(self, sqlite_db, store):
+        amount = SQLConnector(sqlite_db, store=store).get_live_schema()["orders"]["columns"]["amount"]
+        assert amount["stats"]["quantiles"] is None
+        assert amount["stats"]["top_values"] is None
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  INCREMENTAL EXTRACTION
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestIncremental:
+    """Unchanged tables reuse their stored profile; changed ones re-scan."""
+
+    def test_second_run_reuses_unchanged_tables(self, sqlite_db, store):
+        first = SQLConnector(sqlite_db, incremental=True, store=store)
+        schema_1 = first.get_live_schema()
+        assert first.last_run_stats["tables_reused"] == 0
+        assert first.last_run_stats["tables_rescanned"] == 2
+
+        second = SQLConnector(sqlite_db, incremental=True, store=store)
+        schema_2 = second.get_live_schema()
+        assert second.last_run_stats["tables_reused"] == 2
+        assert second.last_run_stats["tables_rescanned"] == 0
+        # Only the plan differs: the profile was reused, not re-planned
+        for schema in (schema_1, schema_2):
+            for table in schema.values():
+                table.pop("profile_plan")
+        assert schema_2 == schema_1
+
+    def test_write_invalidates_fingerprint(self, sqlite_db, store):
+        SQLConnector(sqlite_db, incremental=True, store=store).get_live_schema()
+
+        con = sqlite3.connect(sqlite_db.removeprefix("sqlite:///"))
+        con.execute("INSERT INTO orders VALUES (1000, 1, 9.0)")
+        con.commit()
+        con.close()
+
+        connector = SQLConnector(sqlite_db, incremental=True, store=store)
+        schema = connector.get_live_schema()
+        assert connector.last_run_stats["tables_rescanned"] == 2
+        assert schema["orders"]["row_count"] == 101
+
+    def test_only_rescanned_tables_are_written(self, sqlite_db, store):
+        db = sqlite_db.removeprefix("sqlite:///")
+        first = SQLConnector(sqlite_db, incremental=True, store=store)
+        first.get_live_schema()
+        entries = store.directory / first._source_key / "tables"
+        customers = entries / ProfileStore._entry_name("customers")
+        written = customers.stat().st_mtime_ns
+
+        SQLConnector(sqlite_db, incremental=True, store=store).get_live_schema()
+        # Reused tables' entries are left alone
+        assert customers.stat().st_mtime_ns == written
+
+        con = sqlite3.connect(db)
+        con.execute("DROP TABLE orders")
+        con.commit()
+        con.close()
+        SQLConnector(sqlite_db, incremental=True, store=store).get_live_schema()
+        assert set(store.load(first._source_key)) == {"customers"}
+
+    def test_concurrent_saves_keep_each_others_entries(self, tmp_path):
+        directory = tmp_path / "profile_store"
+
+        def run(i):
+            ProfileStore(directory).save("src", {f"t{i}": i * 1.5}, section="timings")
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert ProfileStore(directory).load("src", section="timings") == {f"t{i}": i * 1.5 for i in range(20)}
+
+    @pytest.mark.parametrize("option", [
+        {"distributions": True}, {"distinct_mode": "approx"}, {"profile_engine": "vectorized"},
+        {"sample_threshold": 10},
+    ])
+    def test_changed_options_invalidate_fingerprint(self, sqlite_db, store, option):
+        SQLConnector(sqlite_db, incremental=True, store=store).get_live_schema()
+
+        connector = SQLConnector(sqlite_db, incremental=True, store=store, **option)
+        schema = connector.get_live_schema()
+        assert connector.last_run_stats["tables_rescanned"] == 2
+        if "distributions" in option:
+            assert schema["orders"]["columns"]["amount"]["stats"]["quantiles"] is not None
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  SCHEDULING
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestScheduling:
+    """Tables are dispatched largest-first and their timings recorded."""
+
+    def test_lpt_order_uses_catalog_estimates(self, sqlite_db, store):
+        con = sqlite3.connect(sqlite_db.removeprefix("sqlite:///"))
+        con.execute("ANALYZE")
+        con.commit()
+        con.close()
+
+        connector = SQLConnector(sqlite_db, store=store)
+        connector.get_live_schema()
+        schedule = connector.last_schedule
+        assert [s["table"] for s in schedule] == ["orders", "customers"]
+        for entry in schedule:
+            assert entry["started_at"] <= entry["finished_at"]
+            assert entry["duration_s"] is not None
+
+    def test_previous_timings_drive_next_order(self, sqlite_db, store):
+        first = SQLConnector(sqlite_db, store=store)
+        first.get_live_schema()
+        key = first._source_key
+        store.save(key, {"customers": 10.0, "orders": 0.1}, section="timings")
+
+        second = SQLConnector(sqlite_db, store=store)
+        second.get_live_schema()
+        assert [s["table"] for s in second.last_schedule] == ["customers", "orders"]
+
+    def test_in_memory_sqlite_gets_one_slot(self, store):
+        # SingletonThreadPool's size is an int attribute, not a method
+        connector = SQLConnector("sqlite://", store=store, registry=EngineRegistry())
+        assert pool_capacity(connector.engine, 8) == 1
+        assert connector.get_live_schema() == {}
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  ENGINE REGISTRY
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestEngineRegistry:
+    """Repeated runs against one source reuse a single pooled engine."""
+
+    def test_repeated_connectors_share_engine(self, sqlite_db, store):
+        registry = EngineRegistry()
+        a = SQLConnector(sqlite_db, store=store, registry=registry)
+        b = SQLConnector(sqlite_db, store=store, registry=registry)
+        assert a.engine is b.engine
+        assert registry.stats()["hits"] == 1
+        assert registry.stats()["misses"] == 1
+
+    @pytest.mark.parametrize("option", [
+        {"read_only": False}, {"sqlite_fast_path": False}, {"sqlite_immutable": True},
+    ])
+    def test_engine_options_get_their_own_engine(self, sqlite_db, store, option):
+        registry = EngineRegistry()
+        default = SQLConnector(sqlite_db, store=store, registry=registry)
+        other = SQLConnector(sqlite_db, store=store, registry=registry, **option)
+        assert other.engine is not default.engine
+        assert registry.stats()["engines"] == 2
+        if "read_only" in option:
+            with other.engine.connect() as conn:
+                assert conn.execute(text("PRAGMA query_only")).scalar() == 0
+
+    def test_equivalent_urls_normalize_to_same_key(self):
+        assert normalize_url("postgresql://u:p@h/db?b=2&a=1") == normalize_url(
+            "POSTGRESQL://u:p@h/db?a=1&b=2"
+        )
+
+    def test_lru_and_idle_eviction_dispose(self, tmp_path, store):
+        registry = EngineRegistry(max_engines=1)
+        first = SQLConnector(f"sqlite:///{tmp_path}/a.db", store=store, registry=registry).engine
+        SQLConnector(f"sqlite:///{tmp_path}/b.db", store=store, registry=registry)
+        assert registry.stats()["engines"] == 1
+        assert registry.stats()["evictions"] == 1
+
+        registry.idle_ttl_s = 0
+        third = SQLConnector(f"sqlite:///{tmp_path}/a.db", store=store, registry=registry).engine
+        assert third is not first
+        assert registry.stats()["evictions"] == 2
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  CATALOG-STATISTICS TIER
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestCatalogStats:
+    """Planner statistics become ColumnStats without scanning the table."""
+
+    COLS = {
+        "id": {"original_type": "INTEGER", "tags": ["PK"]},
+        "city": {"original_type": "TEXT", "tags": []},
+    }
+
+    def _table_stats(self, stale=False):
+        return {
+            "row_count": 1_000_000,
+            "stale": stale,
+            "columns": {
+                "id": {"null_frac": 0.0, "n_distinct": -1.0, "most_common_vals": [],
+                       "most_common_freqs": [], "histogram_bounds": ["1", "500000", "1000000"]},
+                "city": {"null_frac": 0.25, "n_distinct": 42.0, "most_common_vals": ["Lisbon", "Porto"],
+                         "most_common_freqs": [0.4, 0.2], "histogram_bounds": []},
+            },
+        }
+
+    def test_parse_pg_array(self):
+        assert parse_pg_array('{a,"b c",3}') == ["a", "b c", "3"]
+        assert parse_pg_array(None) == []
+
+    def test_fresh_stats_build_profile(self):
+        stats = catalog_profile(
+            self._table_stats(), self.COLS, SQLConnector._is_numeric, lambda k, n, N: 0.1
+        )
+        assert stats["id"]["unique_count"] == 1_000_000
+        assert stats["id"]["min_value"] == 1.0 and stats["id"]["max_value"] == 1_000_000.0
+        assert stats["city"]["null_percentage"] == 25.0
+        assert stats["city"]["unique_count"] == 42
+        assert stats["city"]["sample_values"] == ["Lisbon", "Porto"]
+        assert stats["city"]["distinct_method"] == "catalog"
+
+    def test_stale_or_missing_stats_fall_back(self):
+        assert catalog_profile(self._table_stats(stale=True), self.COLS, SQLConnector._is_numeric, lambda *a: 0) is None
+        partial = self._table_stats()
+        del partial["columns"]["city"]
+        assert catalog_profile(partial, self.COLS, SQLConnector._is_numeric, lambda *a: 0) is None
+
+    def test_metadata_mode_scans_when_engine_has_no_stats(self, sqlite_db, store):
+        connector = SQLConnector(sqlite_db, store=store, profile_mode="metadata")
+        schema = connector.get_live_schema()
+        assert connector.last_run_stats["tables_from_catalog"] == 0
+        assert schema["customers"]["profile_strategy"] == "full"
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  TIME BUDGETS
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestTimeBudgets:
+    """Budgets cancel profiling but never drop a table from the output."""
+
+    def test_sqlite_statement_is_interrupted_at_deadline(self, sqlite_db, store):
+        connector = SQLConnector(sqlite_db, store=store)
+        slow = text(
+            "WITH RECURSIVE r(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM r) "
+            "SELECT count(*) FROM (SELECT x FROM r LIMIT 500000000)"
+        )
+        deadline = time.monotonic() + 0.2
+        started = time.monotonic()
+        with pytest.raises(OperationalError) as exc:
+            with connector._connect(deadline) as conn:
+                conn.execute(slow)
+        assert time.monotonic() - started < 5
+        assert is_timeout(exc.value, deadline)
+
+    def test_other_errors_past_deadline_are_failures(self, sqlite_db, store):
+        connector = SQLConnector(sqlite_db, store=store)
+        with pytest.raises(OperationalError) as exc:
+            with connector._connect() as conn:
+                conn.execute(text("SELECT * FROM missing"))
+        assert not is_timeout(exc.value, time.monotonic() - 1)
+
+        class Canceled(Exception):
+            pgcode = "57014"
+
+        # PostgreSQL's cancel is recognized by SQLSTATE, whatever the message language
+        cancel = OperationalError("SELECT 1", {}, Canceled("Abbruch der Anfrage"))
+        assert is_timeout(cancel, time.monotonic() - 1)
+
+    def test_rollback_sets_postgres_timeout_again(self):
+        class Conn:
+            engine = type("Engine", (), {"dialect": type("Dialect", (), {"name": "postgresql"})})
+            statements = []
+
+            def rollback(self):
+                self.statements.append("ROLLBACK")
+
+            def execute(self, statement):
+                self.statements.append(str(statement))
+
+        conn = Conn()
+        rollback(conn, time.monotonic() + 60)
+        assert conn.statements[0] == "ROLLBACK"
+        assert conn.statements[1].startswith("SET LOCAL statement_timeout = ")
+        with pytest.raises(ProfileTimeout):
+            rollback(conn, time.monotonic() - 1)
+
+    def test_exhausted_table_budget_keeps_partial_entry(self, large_db, store):
+        connector = SQLConnector(large_db, store=store, incremental=True, table_timeout_s=1e-6)
+        events = connector.get_live_schema()["events"]
+        assert events["profile_incomplete"] is True
+        assert set(events["columns"]) == {"id", "grp", "note"}
+        assert connector.last_run_stats["tables_incomplete"] == 1
+        # Partial profiles are not stored for reuse
+        assert store.load(connector._source_key) == {}
+
+    def test_exhausted_run_budget_returns_structure_only(self, sqlite_db, store):
+        connector = SQLConnector(sqlite_db, store=store, run_budget_s=1e-6)
+        schema = connector.get_live_schema()
+        assert set(schema) == {"customers", "orders"}
+        assert all(t["profile_incomplete"] for t in schema.values())
+        assert schema["orders"]["profile_strategy"] == "none"
+        assert schema["orders"]["foreign_keys"][0]["referred_table"] == "customers"
+
+    def test_failed_table_is_kept_not_dropped(self, sqlite_db, store, monkeypatch):
+        connector = SQLConnector(sqlite_db, store=store)
+
+        def boom(*args, **kwargs):
+            raise RuntimeError("driver exploded")
+
+        monkeypatch.setattr(connector, "_profile_data", boom)
+        schema = connector.get_live_schema()
+        assert set(schema) == {"customers", "orders"}
+        assert schema["customers"]["profile_incomplete"] is True
+
+    def test_unbudgeted_run_is_complete(self, sqlite_db, store):
+        schema = SQLConnector(sqlite_db, store=store).get_live_schema()
+        assert not any(t["profile_incomplete"] for t in schema.values())
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  PLANNER
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestPlanner:
+    """Each table's strategy is planned up front and recorded in the output."""
+
+    @staticmethod
+    def _analyze(url):
+        con = sqlite3.connect(url.removeprefix("sqlite:///"))
+        con.execute("ANALYZE")
+        con.commit()
+        con.close()
+
+    def test_plan_is_recorded_per_table(self, sqlite_db, store):
+        self._analyze(sqlite_db)
+        connector = SQLConnector(sqlite_db, store=store)
+        schema = connector.get_live_schema()
+        plan = schema["orders"]["profile_plan"]
+        assert plan["strategy"] == "full"
+        assert plan["estimated_rows"] == 100
+        assert plan["estimate_source"] == "catalog"
+        assert connector.last_run_stats["plan"]["orders"] == plan
+        assert connector.last_run_stats["rows_budgeted"] == 120
+
+    def test_row_budget_downgrades_large_table_to_sample(self, sqlite_db, store):
+        self._analyze(sqlite_db)
+        connector = SQLConnector(sqlite_db, store=store, row_budget=50, sample_rows=30)
+        schema = connector.get_live_schema()
+        assert schema["customers"]["profile_plan"]["strategy"] == "full"
+        assert schema["orders"]["profile_plan"]["strategy"] == "sample"
+        assert "row budget" in schema["orders"]["profile_plan"]["reason"]
+        assert schema["orders"]["profile_strategy"] == "sample"
+        assert schema["orders"]["columns"]["amount"]["stats"]["is_estimate"] is True
+
+    def test_exhausted_row_budget_keeps_structure(self, sqlite_db, store):
+        self._analyze(sqlite_db)
+        connector = SQLConnector(sqlite_db, store=store, row_budget=25, sample_rows=30)
+        schema = connector.get_live_schema()
+        assert schema["orders"]["profile_strategy"] == "none"
+        assert schema["orders"]["profile_plan"]["budgeted_rows"] == 0
+        assert connector.last_run_stats["tables_over_budget"] == 1
+        assert schema["customers"]["profile_incomplete"] is False
+
+    def test_reused_tables_are_planned_as_reuse(self, sqlite_db, store):
+        SQLConnector(sqlite_db, store=store, incremental=True).get_live_schema()
+        schema = SQLConnector(sqlite_db, store=store, incremental=True).get_live_schema()
+        assert schema["orders"]["profile_plan"]["strategy"] == "reuse"
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  INDEXES
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestIndexes:
+    """Indexed columns are answered from the index and surfaced in the output."""
+
+    @staticmethod
+    def _index(url, *ddl):
+        con = sqlite3.connect(url.removeprefix("sqlite:///"))
+        for stmt in ddl:
+            con.execute(stmt)
+        con.commit()
+        con.close()
+
+    def test_indexes_are_surfaced(self, large_db, store):
+        self._index(large_db, "CREATE INDEX ix_events_grp ON events (grp, note)")
+        events = SQLConnector(large_db, store=store).get_live_schema()["events"]
+        assert events["indexes"] == [
+            {"name": "ix_events_grp", "columns": ["grp", "note"], "unique": False}
+        ]
+
+    def test_indexed_columns_classified(self, sqlite_db, store):
+        self._index(sqlite_db, "CREATE INDEX ix_orders_customer ON orders (customer_id)")
+        connector = SQLConnector(sqlite_db, store=store)
+        catalog = connector._load_catalog(["customers", "orders"])
+        assert connector._indexed_columns(catalog["customers"]) == {"id": "unique", "email": "unique"}
+        assert connector._indexed_columns(catalog["orders"]) == {"id": "unique", "customer_id": "leading"}
+
+    def test_index_lookups_match_full_scan(self, large_db, store):
+        plain = SQLConnector(large_db, store=store, profile_engine="sql").get_live_schema()
+        self._index(large_db, "CREATE INDEX ix_events_grp ON events (grp)")
+        connector = SQLConnector(large_db, store=store, profile_engine="sql")
+        entry = connector._load_catalog(["events"])["events"]
+        table_obj = connector._build_table("events", entry, connector.metadata)
+        with connector._connect() as conn:
+            ranges, distinct = connector._index_lookups(
+                conn, table_obj, {"grp": {"original_type": "INTEGER"}}, {"grp": "leading"}, loose=True
+            )
+        assert ranges == {"grp": (0, 6)}
+        assert distinct == {"grp": 7}
+
+        indexed = connector.get_live_schema()
+        for col in ("id", "grp", "note"):
+            ours = dict(indexed["events"]["columns"][col]["stats"], sample_values=None)
+            theirs = dict(plain["events"]["columns"][col]["stats"], sample_values=None)
+            assert ours == theirs
+
+    def test_loose_scan_gives_up_on_high_cardinality(self, large_db, store, monkeypatch):
+        self._index(large_db, "CREATE INDEX ix_events_note ON events (note)")
+        connector = SQLConnector(large_db, store=store, profile_engine="sql")
+        monkeypatch.setattr(SQLConnector, "_LOOSE_SCAN_MAX_STEPS", 10)
+        entry = connector._load_catalog(["events"])["events"]
+        table_obj = connector._build_table("events", entry, connector.metadata)
+        with connector._connect() as conn:
+            assert connector._loose_distinct(conn, table_obj, "note") is None
+        note = connector.get_live_schema()["events"]["columns"]["note"]["stats"]
+        assert note["unique_count"] == 4500
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  WATERMARKS
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestWatermarks:
+    """Append-only tables profile only new rows and merge them in."""
+
+    @staticmethod
+    def _append(url, start, stop):
+        con = sqlite3.connect(url.removeprefix("sqlite:///"))
+        con.executemany(
+            "INSERT INTO events VALUES (?, ?, ?)",
+            [(i, i % 7, None if i % 10 == 0 else f"n{i}") for i in range(start, stop)],
+        )
+        con.commit()
+        con.close()
+
+    def test_second_run_scans_only_appended_rows(self, large_db, store):
+        first = SQLConnector(large_db, store=store, watermark=True)
+        events = first.get_live_schema()["events"]
+        assert events["profile_strategy"] == "watermark"
+        assert events["rows_appended"] == 5000
+        assert store.load(first._source_key, section="watermarks")["events"]["value"]["value"] == 5000
+
+        self._append(large_db, 5001, 5501)
+        second = SQLConnector(large_db, store=store, watermark=True)
+        events = second.get_live_schema()["events"]
+        assert events["rows_appended"] == 500
+        assert events["row_count"] == 5500
+        assert events["profile_plan"]["strategy"] == "watermark"
+
+        full = SQLConnector(large_db, store=store).get_live_schema()["events"]
+        for col in ("id", "grp", "note"):
+            ours, theirs = events["columns"][col]["stats"], full["columns"][col]["stats"]
+            assert ours["null_count"] == theirs["null_count"]
+            assert ours["min_value"] == theirs["min_value"]
+            assert ours["max_value"] == theirs["max_value"]
+            assert ours["mean_value"] == pytest.approx(theirs["mean_value"])
+            assert ours["unique_count"] == pytest.approx(theirs["unique_count"], rel=0.05)
+
+    def test_changed_columns_rebuild_state(self, large_db, store):
+        SQLConnector(large_db, store=store, watermark=True).get_live_schema()
+        con = sqlite3.connect(large_db.removeprefix("sqlite:///"))
+        con.execute("ALTER TABLE events ADD COLUMN extra INTEGER")
+        con.commit()
+        con.close()
+        events = SQLConnector(large_db, store=store, watermark=True).get_live_schema()["events"]
+        assert events["rows_appended"] == 5000
+        assert "first run" in events["profile_plan"]["reason"]
+
+    def test_nullable_configured_column_is_refused(self, large_db, store):
+        connector = SQLConnector(
+            large_db, store=store, watermark=True, watermark_columns={"events": "grp"}
+        )
+        events = connector.get_live_schema()["events"]
+        assert events["profile_strategy"] == "full"
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  SQLITE FAST PATH
+# ══════════════════════════════════════════════════════════════════════════
+
+class TestSQLiteFastPath:
+    """Read-only URIs, bulk catalog reads and process-parallel profiling."""
+
+    @staticmethod
+    def _shape(catalog):
+        """The catalog fields the connector reads, in comparable form."""
+        return {
+            t: {
+                "columns": [(c["name"], str(c["type"]), c["nullable"]) for c in e["columns"]],
+                "pk": e["pk"]["constrained_columns"],
+                "fks": [(f["constrained_columns"], f["referred_table"], f["referred_columns"])
+                        for f in e["foreign_keys"]],
+                "unique": sorted(u["column_names"] for u in e["unique"]),
+                "indexes": sorted(
+                    (i["name"], i["column_names"], bool(i["unique"]),
+                     str((i.get("dialect_options") or {}).get("sqlite_where")))
+                    for i in e["indexes"]
+                ),
+            }
+            for t, e in catalog.items()
+        }
+
+    def test_bulk_catalog_matches_inspector(self, sqlite_db, store):
+        con = sqlite3.connect(sqlite_db.removeprefix("sqlite:///"))
+        con.executescript(
+            """
+            CREATE TABLE lines (
+                order_id INTEGER REFERENCES orders,
+                line INTEGER,
+                sku TEXT NOT NULL,
+                PRIMARY KEY (order_id, line)
+            );
+            CREATE UNIQUE INDEX ux_lines_sku ON lines (sku, line);
+            CREATE INDEX ix_lines_partial ON lines (line) WHERE line > 1;
+            """
+        )
+        con.commit()
+        con.close()
+        names = ["customers", "orders", "lines"]
+        fast = SQLConnector(sqlite_db, store=store, registry=EngineRegistry())
+        slow = SQLConnector(sqlite_db, store=store, registry=EngineRegistry(), sqlite_fast_path=False)
+        assert self._shape(fast._load_catalog(names)) == self._shape(slow._load_catalog(names))
+
+    def test_file_opens_read_only_with_pragmas(self, sqlite_db, store):
+        connector = SQLConnector(sqlite_db, store=store, registry=EngineRegistry())
+        assert connector.engine.url.query["mode"] == "ro"
+        with connector.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA mmap_size")).scalar() > 0
+            with pytest.raises(OperationalError):
+                conn.execute(text("CREATE TABLE nope (x INTEGER)"))
+
+    def test_process_pool_matches_threads(self, sqlite_db, store):
+        threads = SQLConnector(sqlite_db, store=store, sqlite_processes=1).get_live_schema()
+        processes = SQLConnector(sqlite_db, store=store, sqlite_processes=2).get_live_schema()
+        for schema in (threads, processes):
+            for table in schema.values():
+                for col in table["columns"].values():
+                    col["stats"]["sample_values"] = None
+        assert processes == threads
+
+
+# ══════════════════════════════════════════════════════════════════════════
+#  SESSION SETTINGS
+# ══════════════════════════════════════════════════════════════════════════
+
+class _RecordingConnection:
+    """A DBAPI connection that notes whether each statement ran in autocommit."""
+
+    def __init__(self):
+        self.autocommit = False
+        self.executed = []
+
+    def cursor(self):
+        return self
+
+    def execute(self, stmt):
+        self.executed.append((stmt, self.autocommit))
+
+    def close(self):
+        pass
+
+
+class TestSessionSettings:
+    """Read-only session settings survive the pool's reset on return."""
+
+    def test_settings_run_in_autocommit_then_restore(self):
+        conn = _RecordingConnection()
+        SQLConnector._apply_session_settings(conn, SQLConnector._SESSION_SETTINGS["postgresql"])
+        assert conn.executed == [("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY", True)]
+        assert conn.autocommit is False
+
+    def test_sqlite_query_only_on_second_checkout(self, sqlite_db, store):
+        connector = SQLConnector(sqlite_db, store=store, registry=EngineRegistry(), sqlite_fast_path=False)
+        for _ in range(2):
+            with connector.engine.connect() as conn:
+                assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+
+    def test_postgres_read_only_on_second_checkout(self, store):
+        url = os.environ.get("TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("TEST_POSTGRES_URL not set")
+        connector = SQLConnector(url, store=store, registry=EngineRegistry())
+        for _ in range(2):
+            with connector.engine.connect() as conn:
+                assert conn.execute(text("SHOW transaction_read_only")).scalar() == "on"
@@ -0,0 +1,62 @@
+"""
+Unit tests for the vectorized client-side profiler's accumulators.
+
+Run with:
+    pytest backend/tests/test_vectorized_profiler.py -v
+"""
+from backend.connectors import vectorized_profiler
+from backend.connectors.vectorized_profiler import (
+    ColumnAccumulator, profile_batches, aggregate_mapping,
+)
+
+
+def _rows(start, stop):
+    return [(i, None if i % 5 == 0 else f"v{i % 50}") for i in range(start, stop)]
+
+
+class TestColumnAccumulator:
+    """Batches fold into the same stats however the rows are split."""
+
+    def test_batches_produce_aggregate_labels(self):
+        accs = profile_batches([_rows(1, 501), _rows(501, 1001)], ["id", "val"], {"id"})
+        agg = aggregate_mapping(accs)
+        assert agg["__rows"] == 1000
+        assert agg["id__min"] == 1 and agg["id__max"] == 1000
+        assert agg["id__avg"] == 500.5
+        assert agg["val__nulls"] == 200
+        assert agg["val__uniq"] == 40
+        # Reservoir samples: three distinct non-null values from anywhere in the scan
+        assert len(set(accs["val"].samples)) == 3
+        assert all(v.startswith("v") for v in accs["val"].samples)
+
+    def test_merge_equals_single_pass(self):
+        whole = profile_batches([_rows(1, 1001)], ["id", "val"], {"id"})
+        left = profile_batches([_rows(1, 400)], ["id", "val"], {"id"})
+        right = profile_batches([_rows(400, 1001)], ["id", "val"], {"id"})
+        for c in ("id", "val"):
+            left[c].merge(right[c])
+        assert aggregate_mapping(left) == aggregate_mapping(whole)
+
+    def test_value_frequencies_merge(self):
+        # val repeats every 50 rows: each value once in rows 1-20, twice in 1-100
+        whole = profile_batches([_rows(1, 21)], ["id", "val"], {"id"})["val"]
+        left = profile_batches([_rows(1, 11)], ["id", "val"], {"id"})["val"]
+        right = profile_batches([_rows(11, 21)], ["id", "val"], {"id"})["val"]
+        assert left.frequency_counts == (8, 0)
+        assert left.merge(right).frequency_counts == whole.frequency_counts == (16, 0)
+        pairs = profile_batches([_rows(1, 101)], ["id", "val"], {"id"})["val"]
+        assert pairs.frequency_counts == (0, 40)
+
+    def test_exact_distinct_degrades_to_hll(self, monkeypatch):
+        monkeypatch.setattr(vectorized_profiler, "EXACT_DISTINCT_LIMIT", 100)
+        accs = profile_batches([_rows(1, 2001)], ["id", "val"], {"id"})
+        assert accs["id"].distinct_method == "hll"
+        assert abs(accs["id"].distinct() - 2000) / 2000 < 0.05
+        assert accs["val"].distinct_method == "exact"
+
+    def test_round_trip_keeps_sketch(self):
+        acc = profile_batches([_rows(1, 1001)], ["id", "val"], {"id"})["id"]
+        restored = ColumnAccumulator.from_dict(acc.to_dict())
+        assert restored.distinct_method == "hll"
+        assert abs(restored.distinct() - 1000) / 1000 < 0.05
+        assert (restored.rows, restored.min, restored.max) == (1000, 1, 1000)
@@ -0,0 +1,92 @@
+"""
+Benchmark the two profiling engines: batched SQL aggregates vs. the
+vectorized client-side profiler.
+
+    python data/scripts/bench_profilers.py                 # synthetic SQLite table
+    python data/scripts/bench_profilers.py sqlite:///data/olist.db
+    python data/scripts/bench_profilers.py postgresql://...  --rows 0
+
+The result decides SQLConnector._VECTORIZED_DIALECTS (the "auto" default).
+"""
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from backend.connectors.sql_connector import SQLConnector
+from backend.connectors.profile_store import ProfileStore
+from backend.connectors.engine_registry import EngineRegistry
+
+
+def build_synthetic(path: Path, rows: int) -> str:
+    """A 12-column table mixing keys, low/high-cardinality ints, floats, text and NULLs."""
+    con = sqlite3.connect(path)
+    cols = ", ".join(
+        ["id INTEGER PRIMARY KEY", "user_id INTEGER", "status TEXT", "country TEXT"]
+        + [f"metric_{i} REAL" for i in range(4)]
+        + [f"label_{i} TEXT" for i in range(4)]
+    )
+    con.execute(f"CREATE TABLE facts ({cols})")
+    rnd = random.Random(7)
+    statuses = ["new", "paid", "shipped", "returned", None]
+    batch = []
+    for i in range(1, rows + 1):
+        batch.append(
+            (i, rnd.randint(1, rows // 10 or 1), rnd.choice(statuses), f"c{rnd.randint(1, 200)}")
+            + tuple(None if rnd.random() < 0.05 else rnd.random() * 1000 for _ in range(4))
+            + tuple(f"lbl{rnd.randint(1, 10_000)}" for _ in range(4))
+        )
+        if len(batch) == 50_000:
+            con.executemany(f"INSERT INTO facts VALUES ({', '.join('?' * 12)})", batch)
+            batch.clear()
+    if batch:
+        con.executemany(f"INSERT INTO facts VALUES ({', '.join('?' * 12)})", batch)
+    con.commit()
+    con.close()
+    return f"sqlite:///{path}"
+
+
+def run(url: str, engine: str, store_dir: Path, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        connector = SQLConnector(
+            url,
+            store=ProfileStore(store_dir / engine),
+            registry=EngineRegistry(),
+            profile_engine=engine,
+        )
+        started = time.perf_counter()
+        connector.get_live_schema()
+        best = min(best, time.perf_counter() - started)
+        connector.engine.dispose()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("url", nargs="?", help="database URL (default: synthetic SQLite)")
+    parser.add_argument("--rows", type=int, default=500_000, help="synthetic table size")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N runs per engine")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        url = args.url
+        if url is None:
+            print(f"Building synthetic SQLite table with {args.rows:,} rows...")
+            url = build_synthetic(tmp_dir / "bench.db", args.rows)
+
+        results = {engine: run(url, engine, tmp_dir, args.repeat) for engine in ("sql", "vectorized")}
+
+    for engine, secs in results.items():
+        print(f"  {engine:<11} {secs:8.2f}s")
+    faster = min(results, key=results.get)
+    print(f"Faster engine: {faster} ({max(results.values()) / min(results.values()):.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
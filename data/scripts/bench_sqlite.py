@@ -0,0 +1,104 @@
+"""
+Benchmark the SQLite fast path: catalog reads and a full profiling run
+with the fast path off, on with threads, and on with worker processes.
+
+    python data/scripts/bench_sqlite.py                  # synthetic multi-table file
+    python data/scripts/bench_sqlite.py sqlite:///data/chinook.db sqlite:///data/olist.db
+
+The result decides SQLConnector._SQLITE_PROCESS_MIN_BYTES (when "auto"
+switches to processes).
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from backend.connectors.sql_connector import SQLConnector
+from backend.connectors.profile_store import ProfileStore
+from backend.connectors.engine_registry import EngineRegistry
+
+VARIANTS = {
+    "baseline": {"sqlite_fast_path": False, "sqlite_processes": 1},
+    "fast/threads": {"sqlite_fast_path": True, "sqlite_processes": 1},
+    "fast/processes": {"sqlite_fast_path": True, "sqlite_processes": os.cpu_count() or 1},
+}
+
+
+def build_synthetic(path: Path, tables: int, rows: int) -> str:
+    """``tables`` 8-column tables of ``rows`` rows, chained by foreign keys and indexed."""
+    con = sqlite3.connect(path)
+    rnd = random.Random(7)
+    for t in range(tables):
+        parent = f", parent_id INTEGER REFERENCES t{t - 1}(id)" if t else ""
+        con.execute(
+            f"CREATE TABLE t{t} (id INTEGER PRIMARY KEY, code TEXT UNIQUE, status TEXT, "
+            f"amount REAL, qty INTEGER, note TEXT, created TEXT{parent})"
+        )
+        con.execute(f"CREATE INDEX ix_t{t}_status ON t{t} (status)")
+        width = 8 if t else 7
+        con.executemany(
+            f"INSERT INTO t{t} VALUES ({', '.join('?' * width)})",
+            (
+                (i, f"c{t}-{i}", rnd.choice(["new", "paid", "shipped", None]),
+                 rnd.random() * 1000, rnd.randint(1, 50), f"note {rnd.randint(1, 5000)}",
+                 f"2024-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}")
+                + ((rnd.randint(1, rows),) if t else ())
+                for i in range(1, rows + 1)
+            ),
+        )
+    con.commit()
+    con.close()
+    return f"sqlite:///{path}"
+
+
+def run(url: str, options: dict, store_dir: Path, repeat: int) -> tuple:
+    """Best-of-N (catalog seconds, full run seconds)."""
+    best_catalog = best_run = float("inf")
+    for i in range(repeat):
+        connector = SQLConnector(
+            url,
+            store=ProfileStore(store_dir / f"bench-{i}-{len(os.listdir(store_dir))}"),
+            registry=EngineRegistry(),
+            **options,
+        )
+        names = connector.inspector.get_table_names()
+        started = time.perf_counter()
+        connector._load_catalog(names)
+        best_catalog = min(best_catalog, time.perf_counter() - started)
+        started = time.perf_counter()
+        connector.get_live_schema()
+        best_run = min(best_run, time.perf_counter() - started)
+        connector.engine.dispose()
+    return best_catalog, best_run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("urls", nargs="*", help="SQLite URLs (default: synthetic file)")
+    parser.add_argument("--tables", type=int, default=40, help="synthetic table count")
+    parser.add_argument("--rows", type=int, default=20_000, help="synthetic rows per table")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N runs per variant")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        urls = args.urls
+        if not urls:
+            print(f"Building synthetic SQLite file: {args.tables} tables x {args.rows:,} rows...")
+            urls = [build_synthetic(tmp_dir / "bench.db", args.tables, args.rows)]
+
+        print(f"{os.cpu_count()} CPU(s)")
+        for url in urls:
+            print(url)
+            for name, options in VARIANTS.items():
+                catalog_s, run_s = run(url, options, tmp_dir, args.repeat)
+                print(f"  {name:<15} catalog {catalog_s * 1000:8.1f}ms   run {run_s:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -228,6 +228,25 @@ export interface TableSchema {
   health_score: number;
   foreign_keys: ForeignKey[];
   description: string | null;
+  profile_strategy?: string;
+  row_count_estimated?: boolean;
+  profile_incomplete?: boolean;
+  profile_plan?: ProfilePlan | null;
+  indexes?: TableIndex[];
+}
+
+export interface TableIndex {
+  name: string | null;
+  columns: string[];
+  unique: boolean;
+}
+
+export interface ProfilePlan {
+  strategy: string;
+  reason: string;
+  estimated_rows: number | null;
+  estimate_source: string | null;
+  budgeted_rows: number;
 }
 
 export interface ColumnMetadata {
@@ -249,6 +268,15 @@ export interface ColumnStats {
   min_value: number | null;
   max_value: number | null;
   mean_value: number | null;
+  is_estimate?: boolean;
+  sample_fraction?: number;
+  null_percentage_margin?: number;
+  unique_count_bounds?: [number, number] | null;
+  distinct_method?: string;
+  quantiles?: Record<string, number> | null;
+  histogram?: { lower: number; upper: number; count: number }[] | null;
+  top_values?: { value: string; count: number }[] | null;
+  length_stats?: { min: number; max: number; mean: number } | null;
 }
 
 export interface ForeignKey {
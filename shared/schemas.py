@@ -10,6 +10,17 @@ from datetime import datetime
 
 # ── Column & Table Schemas ──
 
+class HistogramBinResponse(BaseModel):
+    lower: float
+    upper: float
+    count: int
+
+
+class TopValueResponse(BaseModel):
+    value: str
+    count: int
+
+
 class ColumnStatsResponse(BaseModel):
     null_count: int = 0
     null_percentage: float = 0.0
@@ -19,6 +30,15 @@ class ColumnStatsResponse(BaseModel):
     min_value: Optional[Union[int, float]] = None
     max_value: Optional[Union[int, float]] = None
     mean_value: Optional[float] = None
+    is_estimate: bool = False
+    sample_fraction: float = 1.0
+    null_percentage_margin: float = 0.0
+    unique_count_bounds: Optional[List[int]] = None
+    distinct_method: str = "exact"
+    quantiles: Optional[Dict[str, float]] = None
+    histogram: Optional[List[HistogramBinResponse]] = None
+    top_values: Optional[List[TopValueResponse]] = None
+    length_stats: Optional[Dict[str, float]] = None
 
 
 class ColumnMetadataResponse(BaseModel):
@@ -37,6 +57,20 @@ class ForeignKeyResponse(BaseModel):
     referred_column: str
 
 
+class IndexResponse(BaseModel):
+    name: Optional[str] = None
+    columns: List[str] = []
+    unique: bool = False
+
+
+class ProfilePlanResponse(BaseModel):
+    strategy: str
+    reason: str
+    estimated_rows: Optional[int] = None
+    estimate_source: Optional[str] = None
+    budgeted_rows: int = 0
+
+
 class TableSchemaResponse(BaseModel):
     table_name: str
     row_count: int = 0
@@ -44,13 +78,18 @@ class TableSchemaResponse(BaseModel):
     health_score: float = 100.0
     foreign_keys: List[ForeignKeyResponse] = []
     description: Optional[str] = None
+    profile_strategy: str = "full"
+    row_count_estimated: bool = False
+    profile_incomplete: bool = False
+    profile_plan: Optional[ProfilePlanResponse] = None
+    indexes: List[IndexResponse] = []
 
 
 # ── Pipeline ──
 
 class PipelineRunRequest(BaseModel):
     connection_string: str = Field(
-        ..., description="SQLAlchemy connection string (e.g., sqlite:///path/to/db.sqlite)"
+        ..., description="SQLAlchemy connection string (e.g., sqlite:///path/to/db.sqlite), or file:///path/to/dir for Parquet/CSV files"
     )
 
 